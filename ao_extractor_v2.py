@@ -211,6 +211,10 @@ class AOExtractorV2:
                                 text_source,
                                 context=file_analysis
                             )
+                            # La troncature du texte est une information d'extraction, pas un champ
+                            texte_tronque = enhanced_data.pop('_texte_tronque', None)
+                            if texte_tronque:
+                                entry.setdefault('statistiques', {})['texte_tronque'] = texte_tronque
                             entry['valeurs_extraites'] = enhanced_data
             
             # Enrichir avec les suggestions depuis la base de données
@@ -369,7 +373,7 @@ class AOExtractorV2:
         """
         try:
             lots = self.lot_detector.detect_lots(text)
-            return [lot.__dict__ for lot in lots]
+            return [self.lot_detector.convert_lot_to_dict(lot) for lot in lots]
         except Exception as e:
             logger.error(f"Erreur détection lots: {e}")
             return []
@@ -530,7 +534,7 @@ class AOExtractorV2:
                 if count >= min_occurrences
             ]
             
-            return sorted(common_words, key=lambda x: word_counts[x], reverse=True)[:50]
+            return sorted(common_words, key=word_counts.__getitem__, reverse=True)[:50]
             
         except Exception as e:
             logger.error(f"Erreur extraction mots communs: {e}")
@@ -18,13 +18,11 @@ from datetime import datetime
 import time
 import json
 import logging
-from pathlib import Path
 
 # Import des modules locaux
 from database_manager import DatabaseManager
 from ai_engine import VeilleAIEngine
 from ao_extractor_v2 import AOExtractorV2
-from extraction_improver import extraction_improver
 from universal_criteria_extractor import UniversalCriteriaExtractor
 
 # Import des modules UI
@@ -155,16 +153,9 @@ try:
             if uploaded_file is not None:
                 with st.spinner("📊 Import en cours..."):
                     try:
-                        # Sauvegarder temporairement le fichier
-                        temp_path = f"temp_{uploaded_file.name}"
-                        with open(temp_path, "wb") as f:
-                            f.write(uploaded_file.getbuffer())
-                        
-                        # Importer dans la base
-                        result = db_manager.import_from_excel(temp_path)
-                        
-                        # Supprimer le fichier temporaire
-                        Path(temp_path).unlink()
+                        # Importer dans la base directement depuis le buffer uploadé
+                        # (pandas lit les objets fichier, pas besoin de passer par le disque)
+                        result = db_manager.import_from_excel(uploaded_file)
                         
                         st.success(f"✅ Import réussi: {result['rows_inserted']} lignes importées")
                         st.rerun()
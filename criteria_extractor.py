@@ -9,10 +9,97 @@ import logging
 import os
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 import PyPDF2
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Patterns compilés une seule fois au chargement du module
+_STRUCTURED_TABLE_RE = re.compile(
+    r'CRITERE\s+N°?\s*(\d+)\s*:\s*([^\n]+?)(?:\n[^\n]*+)*?\n(\d+)\s*points?',
+    re.IGNORECASE | re.MULTILINE
+)
+_SPACES_TABS_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_UNWANTED_CHARS_RE = re.compile(r'[^\w\s%.,()°éèêëàâäôöùûüçÉÈÊËÀÂÄÔÖÙÛÜÇ\n-]')
+_TITLE_PUNCT_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_STRUCTURED_POINTS_RE = re.compile(
+    r'critère\s*n°?\s*\d+[^:]*:[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*points?', re.IGNORECASE
+)
+_POINTS_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'(?:critère|criteres?)\s*n°?\s*\d+[^:]*:[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*points?',
+        r'(?:valeur\s+technique|prix|qualité|développement\s+durable)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*points?',
+        r'(?:pondération|ponderation)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*points?'
+    )
+]
+# Classes Unicode de `re` réécrites pour RE2 (dont \s et \d sont ASCII par défaut)
+_RE2_CLASS_EQUIVALENTS = {
+    's': r'[\t-\r\x{1c}-\x{20}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]',
+    'd': r'\p{Nd}',
+}
+_RE2_CLASS_RE = re.compile(r'\\([sd])')
+
+
+def _compile_linear(pattern: str, ignore_case: bool = True):
+    """
+    Compile un pattern (insensible à la casse par défaut)
+    
+    Utilise RE2 (automate à temps linéaire, sans retour arrière) si google-re2
+    est installé et accepte le pattern, sinon le moteur `re` standard.
+    Avec ignore_case=False, le pattern doit être écrit en minuscules et
+    appliqué à un texte déjà passé par `str.lower()`.
+    """
+    if RE2_AVAILABLE:
+        try:
+            options = re2.Options()
+            options.case_sensitive = not ignore_case
+            re2_syntax = _RE2_CLASS_RE.sub(lambda m: _RE2_CLASS_EQUIVALENTS[m.group(1)], pattern)
+            return re2.compile(re2_syntax, options)
+        except Exception as e:
+            logger.debug("Pattern non supporté par RE2, repli sur re: %s", e)
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+def _fuse_patterns(patterns: List[re.Pattern]):
+    """Fusionne des patterns en une seule alternation (un seul passage sur le texte)"""
+    return _compile_linear('|'.join(f'(?:{p.pattern})' for p in patterns))
+
+_SPECIFIC_TYPES_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'critère\s*n°?\s*\d+[^:]*:\s*([^:]+?)(?:\s*:|\s*pondération)',
+        r'(?:valeur\s+technique|prix|qualité\s+des\s+services|développement\s+durable)',
+        r'(?:technique|économique|prix|qualité|rse|développement\s+durable|durable)'
+    )
+]
+
+# Formes d'intitulé de lot, par ordre de priorité ('lot n° N', 'lot N', 'lot numéro N')
+_LOT_TITLE_FORMS = ('lot_n', 'lot', 'lot_numero')
+
+@lru_cache(maxsize=256)
+def _lot_title_pattern(lot_numero: int) -> re.Pattern:
+    """
+    Pattern d'intitulé d'un lot, compilé une seule fois par numéro de lot
+    
+    Les trois formes sont réunies dans une seule alternation : elles s'excluent
+    mutuellement à une position donnée et le lookahead ne consomme que "lot",
+    donc un seul finditer retrouve la première occurrence de chacune.
+    """
+    return re.compile(
+        r'lot(?=\s*(?:n°?\s*{0}\s*:?\s*(?P<lot_n>[^\n\r]+)'
+        r'|{0}\s*:?\s*(?P<lot>[^\n\r]+)'
+        r'|numéro\s*{0}\s*:?\s*(?P<lot_numero>[^\n\r]+)))'.format(lot_numero),
+        re.IGNORECASE
+    )
+
 @dataclass
 class CritereAttribution:
     """Structure pour un critère d'attribution"""
@@ -32,12 +119,26 @@ class TableauCriteres:
 class CriteriaExtractor:
     """Extracteur de critères d'attribution pour les marchés publics"""
     
+    # Patterns compilés partagés par toutes les instances (construits une seule fois)
+    _shared_patterns: Optional[Dict[str, List[re.Pattern]]] = None
+    _shared_fused_patterns: Optional[Dict[str, Any]] = None
+    
     def __init__(self):
-        self.patterns = self._init_patterns()
+        if CriteriaExtractor._shared_patterns is None:
+            patterns = self._init_patterns()
+            # Alternations fusionnées pour les catégories dont les patterns ne se
+            # chevauchent pas : un seul finditer au lieu d'un par pattern
+            CriteriaExtractor._shared_fused_patterns = {
+                category: _fuse_patterns(patterns[category])
+                for category in ('pourcentages', 'types_criteres')
+            }
+            CriteriaExtractor._shared_patterns = patterns
+        self.patterns = CriteriaExtractor._shared_patterns
+        self.fused_patterns = CriteriaExtractor._shared_fused_patterns
     
-    def _init_patterns(self) -> Dict[str, List[str]]:
-        """Initialise les patterns de recherche"""
-        return {
+    def _init_patterns(self) -> Dict[str, List[re.Pattern]]:
+        """Initialise les patterns de recherche (compilés une fois à la construction)"""
+        raw_patterns = {
             'tableau_criteres': [
                 r'critère[s]?\s*d\'attribution',
                 r'critère[s]?\s*de\s*sélection',
@@ -81,6 +182,10 @@ class CriteriaExtractor:
                 r'critère\s*de\s*références'
             ]
         }
+        return {
+            category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for category, patterns in raw_patterns.items()
+        }
     
     def extract_from_pdf(self, pdf_path: str) -> TableauCriteres:
         """Extrait les critères d'un PDF"""
@@ -129,9 +234,7 @@ class CriteriaExtractor:
         
         # Pattern pour capturer les critères structurés
         # Format: "CRITERE N° X : Nom du critère\nDescription\nY points"
-        pattern = r'CRITERE\s+N°?\s*(\d+)\s*:\s*([^\n]+?)(?:\n[^\n]*)*?\n(\d+)\s*points?'
-        
-        matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
+        matches = _STRUCTURED_TABLE_RE.finditer(text)
         
         for match in matches:
             numero = match.group(1)
@@ -166,10 +269,12 @@ class CriteriaExtractor:
         try:
             with open(pdf_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
-                text = ""
+                # Accumuler les pages dans une liste puis joindre (coût linéaire)
+                parts = []
                 for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+                    parts.append(page.extract_text())
+                    parts.append("\n")
+                return "".join(parts)
         except Exception as e:
             logger.error(f"Erreur lecture PDF {pdf_path}: {e}")
             return ""
@@ -179,10 +284,10 @@ class CriteriaExtractor:
         # Remplacer les caractères problématiques
         text = text.replace('\x00', ' ')
         # Normaliser les espaces multiples mais préserver les sauts de ligne
-        text = re.sub(r'[ \t]+', ' ', text)  # Normaliser les espaces et tabs
-        text = re.sub(r'\n\s*\n', '\n\n', text)  # Normaliser les sauts de ligne multiples
+        text = _SPACES_TABS_RE.sub(' ', text)  # Normaliser les espaces et tabs
+        text = _BLANK_LINES_RE.sub('\n\n', text)  # Normaliser les sauts de ligne multiples
         # Garder les caractères utiles incluant les accents et symboles spéciaux
-        text = re.sub(r'[^\w\s%.,()°éèêëàâäôöùûüçÉÈÊËÀÂÄÔÖÙÛÜÇ\n-]', ' ', text)
+        text = _UNWANTED_CHARS_RE.sub(' ', text)
         return text
     
     def _find_criteria_sections(self, text: str) -> List[Tuple[int, int, str]]:
@@ -190,7 +295,7 @@ class CriteriaExtractor:
         sections = []
         
         for pattern in self.patterns['tableau_criteres']:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern.finditer(text):
                 start = max(0, match.start() - 200)
                 end = min(len(text), match.end() + 1000)
                 section_text = text[start:end]
@@ -200,12 +305,17 @@ class CriteriaExtractor:
     
     def _extract_lots(self, text: str) -> List[Dict[str, Any]]:
         """Extrait les informations sur les lots"""
-        lots = []
+        # Dictionnaire indexé par numéro : dédoublonnage en O(1), premier match conservé
+        lots: Dict[int, Dict[str, Any]] = {}
         
         for pattern in self.patterns['lots']:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern.finditer(text):
                 lot_numero = int(match.group(1))
                 
+                # Éviter les doublons avant de calculer le contexte et l'intitulé
+                if lot_numero in lots:
+                    continue
+                
                 # Chercher le contexte autour du lot
                 start = max(0, match.start() - 100)
                 end = min(len(text), match.end() + 200)
@@ -214,39 +324,48 @@ class CriteriaExtractor:
                 # Extraire l'intitulé du lot si possible
                 intitule = self._extract_lot_title(context, lot_numero)
                 
-                lot_info = {
+                lots[lot_numero] = {
                     'numero': lot_numero,
                     'intitule': intitule,
                     'position': match.start()
                 }
-                
-                # Éviter les doublons
-                if not any(l['numero'] == lot_numero for l in lots):
-                    lots.append(lot_info)
         
-        return sorted(lots, key=lambda x: x['numero'])
+        return [lots[numero] for numero in sorted(lots)]
     
     def _extract_lot_title(self, context: str, lot_numero: int) -> str:
         """Extrait l'intitulé d'un lot"""
-        # Chercher des patterns d'intitulé après le numéro de lot
-        patterns = [
-            r'lot\s*n°?\s*{}\s*:?\s*([^\n\r]+)'.format(lot_numero),
-            r'lot\s*{}\s*:?\s*([^\n\r]+)'.format(lot_numero),
-            r'lot\s*numéro\s*{}\s*:?\s*([^\n\r]+)'.format(lot_numero)
-        ]
+        # Chercher des patterns d'intitulé après le numéro de lot (un seul passage)
+        titles = {}
+        for match in _lot_title_pattern(lot_numero).finditer(context):
+            form = match.lastgroup
+            if form in titles:
+                continue
+            titles[form] = self._clean_lot_title(match.group(form))
+            # Conclure dès que les formes plus prioritaires sont connues
+            for priority_form in _LOT_TITLE_FORMS:
+                if priority_form not in titles:
+                    break
+                if titles[priority_form]:
+                    return titles[priority_form]
+            else:
+                break
         
-        for pattern in patterns:
-            match = re.search(pattern, context, re.IGNORECASE)
-            if match:
-                title = match.group(1).strip()
-                # Nettoyer le titre
-                title = re.sub(r'[^\w\s-]', ' ', title)
-                title = re.sub(r'\s+', ' ', title).strip()
-                if len(title) > 10:  # Titre significatif
-                    return title[:100]  # Limiter la longueur
+        for form in _LOT_TITLE_FORMS:
+            if titles.get(form):
+                return titles[form]
         
         return f"Lot {lot_numero}"
     
+    def _clean_lot_title(self, raw_title: str) -> Optional[str]:
+        """Nettoie un intitulé de lot, None s'il n'est pas significatif"""
+        title = raw_title.strip()
+        # Nettoyer le titre
+        title = _TITLE_PUNCT_RE.sub(' ', title)
+        title = _WHITESPACE_RE.sub(' ', title).strip()
+        if len(title) > 10:  # Titre significatif
+            return title[:100]  # Limiter la longueur
+        return None
+    
     def _extract_global_criteria(self, text: str, sections: List[Tuple[int, int, str]]) -> List[CritereAttribution]:
         """Extrait les critères globaux"""
         criteres = []
@@ -317,25 +436,23 @@ class CriteriaExtractor:
         """Trouve les pourcentages dans une section"""
         pourcentages = []
         
-        # D'abord chercher les pourcentages directs
-        for pattern in self.patterns['pourcentages']:
-            for match in re.finditer(pattern, section_text, re.IGNORECASE):
-                try:
-                    # Convertir en float
-                    value_str = match.group(1).replace(',', '.')
-                    pourcentage = float(value_str)
-                    
-                    # Vérifier que c'est un pourcentage valide (0-100)
-                    if 0 <= pourcentage <= 100:
-                        pourcentages.append((pourcentage, match.start()))
-                except ValueError:
-                    continue
+        # D'abord chercher les pourcentages directs (lastindex désigne le groupe
+        # de l'alternative qui a matché)
+        for match in self.fused_patterns['pourcentages'].finditer(section_text):
+            try:
+                # Convertir en float
+                value_str = match.group(match.lastindex).replace(',', '.')
+                pourcentage = float(value_str)
+                
+                # Vérifier que c'est un pourcentage valide (0-100)
+                if 0 <= pourcentage <= 100:
+                    pourcentages.append((pourcentage, match.start()))
+            except ValueError:
+                continue
         
         # Chercher les tableaux de critères structurés (comme dans le PDF)
         # Pattern pour "Critère N° X : Description : Y points"
-        structured_pattern = r'critère\s*n°?\s*\d+[^:]*:[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*points?'
-        
-        for match in re.finditer(structured_pattern, section_text, re.IGNORECASE):
+        for match in _STRUCTURED_POINTS_RE.finditer(section_text):
             try:
                 # Convertir en float
                 value_str = match.group(1).replace(',', '.')
@@ -349,14 +466,8 @@ class CriteriaExtractor:
                 continue
         
         # Chercher les critères avec points dans un contexte plus large
-        points_patterns = [
-            r'(?:critère|criteres?)\s*n°?\s*\d+[^:]*:[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*points?',
-            r'(?:valeur\s+technique|prix|qualité|développement\s+durable)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*points?',
-            r'(?:pondération|ponderation)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*points?'
-        ]
-        
-        for pattern in points_patterns:
-            for match in re.finditer(pattern, section_text, re.IGNORECASE):
+        for pattern in _POINTS_PATTERNS:
+            for match in pattern.finditer(section_text):
                 try:
                     # Convertir en float
                     value_str = match.group(1).replace(',', '.')
@@ -370,7 +481,7 @@ class CriteriaExtractor:
                     continue
         
         # Trier par position dans le texte
-        pourcentages.sort(key=lambda x: x[1])
+        pourcentages.sort(key=itemgetter(1))
         return pourcentages
     
     def _find_criteria_types_in_section(self, section_text: str) -> List[Tuple[str, int]]:
@@ -378,14 +489,8 @@ class CriteriaExtractor:
         types = []
         
         # Patterns spécifiques pour les critères du tableau
-        specific_patterns = [
-            r'critère\s*n°?\s*\d+[^:]*:\s*([^:]+?)(?:\s*:|\s*pondération)',
-            r'(?:valeur\s+technique|prix|qualité\s+des\s+services|développement\s+durable)',
-            r'(?:technique|économique|prix|qualité|rse|développement\s+durable|durable)'
-        ]
-        
-        for pattern in specific_patterns:
-            for match in re.finditer(pattern, section_text, re.IGNORECASE):
+        for pattern in _SPECIFIC_TYPES_PATTERNS:
+            for match in pattern.finditer(section_text):
                 type_critere = match.group(1) if match.groups() else match.group(0)
                 type_critere = type_critere.strip()
                 
@@ -402,13 +507,12 @@ class CriteriaExtractor:
                     types.append((type_critere, match.start()))
         
         # Patterns génériques
-        for pattern in self.patterns['types_criteres']:
-            for match in re.finditer(pattern, section_text, re.IGNORECASE):
-                type_critere = match.group(0).strip()
-                types.append((type_critere, match.start()))
+        for match in self.fused_patterns['types_criteres'].finditer(section_text):
+            type_critere = match.group(0).strip()
+            types.append((type_critere, match.start()))
         
         # Trier par position dans le texte
-        types.sort(key=lambda x: x[1])
+        types.sort(key=itemgetter(1))
         return types
     
     def format_criteria_summary(self, tableau: TableauCriteres) -> str:
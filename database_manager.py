@@ -166,10 +166,12 @@ class DatabaseManager:
             logger.error(f"❌ Erreur création tables: {e}")
             raise
     
-    def import_from_excel(self, excel_path: str) -> Dict[str, Any]:
-        """Importe les données depuis un fichier Excel"""
+    def import_from_excel(self, excel_path: Union[str, Path, Any]) -> Dict[str, Any]:
+        """Importe les données depuis un fichier Excel (chemin ou objet fichier, ex. upload Streamlit)"""
         try:
-            logger.info(f"📊 Import depuis Excel: {excel_path}")
+            # Nom lisible pour les logs et métadonnées, même pour un objet fichier
+            source_name = str(getattr(excel_path, 'name', excel_path))
+            logger.info(f"📊 Import depuis Excel: {source_name}")
             
             # Lire le fichier Excel
             df = pd.read_excel(excel_path)
@@ -182,7 +184,7 @@ class DatabaseManager:
             
             # Enregistrer les métadonnées
             self._save_metadata('last_excel_import', {
-                'file_path': excel_path,
+                'file_path': source_name,
                 'rows_imported': len(df),
                 'columns': list(df.columns),
                 'import_date': datetime.now().isoformat()
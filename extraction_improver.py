@@ -11,121 +11,347 @@ Système d'extraction simplifié et plus robuste pour les appels d'offres
 
 import re
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import pandas as pd
 
+try:
+    import hyperscan  # Optionnel : pré-filtrage multi-patterns en une seule passe
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tables de nettoyage des montants (une seule passe au lieu de .replace() chaînés)
+_MONTANT_SPACES_COMMA = str.maketrans({' ': None, ',': '.'})
+_MONTANT_CLEAN = str.maketrans({'€': None, ',': '.', ' ': None})
+
+
+def _montant_avec_unite(montant_clean: str) -> float:
+    """Convertit un montant nettoyé en tenant compte d'un suffixe k (milliers) ou m (millions)"""
+    montant_lower = montant_clean.lower()
+    if 'k' in montant_lower:
+        return float(montant_lower.replace('k', '')) * 1000
+    elif 'm' in montant_lower:
+        return float(montant_lower.replace('m', '')) * 1000000
+    return float(montant_clean)
+
+
+# Fin commune des patterns de montant : ':' puis chiffres/séparateurs, unité k/m optionnelle et devise
+_MONTANT_TAIL_RE = re.compile(r':[\s\d.,]*+[km]?(?:€|euro)', re.IGNORECASE)
+
+
+def _montant_windows(text: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    Fenêtres (début, fin) du texte pouvant contenir un match des patterns de montant.
+
+    Ces patterns ont tous la forme « mot-clé [\\s\\w]* : nombre [km] devise » : chaque
+    match se termine sur une fin ':' ... devise et commence dans la suite de mots
+    et d'espaces qui la précède. Chercher dans ces seules fenêtres (fusionnées
+    si elles se chevauchent) donne exactement les mêmes matches que sur tout le
+    texte, sans parcourir les paragraphes sans montant.
+    """
+    windows: List[Tuple[int, int]] = []
+    for tail in _MONTANT_TAIL_RE.finditer(text):
+        start = tail.start()
+        while start > 0 and (text[start - 1].isalnum() or text[start - 1].isspace() or text[start - 1] == '_'):
+            start -= 1
+        # +1 : le 's' optionnel de 'euros'
+        end = min(len(text), tail.end() + 1)
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], end)
+        else:
+            windows.append((start, end))
+    return tuple(windows)
+
+
 class ExtractionImprover:
     """Améliorateur d'extraction de données pour les appels d'offres"""
     
+    # Alternance d'unités monétaires présente dans les patterns de lots
+    _CURRENCY_ALTERNATION = r'[km]?(?:€|euros?)'
+    # Présence d'une unité monétaire, condition nécessaire de cette alternance
+    _CURRENCY_RE = re.compile(r'€|euro', re.IGNORECASE)
+    
+    # Caractères non ASCII que IGNORECASE apparie à 'i' ou 's' mais que lower() ne ramène pas à l'ASCII
+    _CASE_FOLD_TRAPS_RE = re.compile('[\u0130\u0131\u017f]')
+    
+    # Patterns de localisation de la section des lots, par ordre de priorité, avec
+    # leurs mots-clés obligatoires en minuscules (chaque tuple : au moins un présent)
+    _LOTS_SECTION_PATTERNS = tuple(
+        (anchors, re.compile(pattern, re.IGNORECASE | re.DOTALL)) for anchors, pattern in (
+            # Patterns RESAH standard
+            ((('allotissement',), ('montant estimatif',), ('montant maximum',)),
+             r'Allotissement[^\n]*montant estimatif[^\n]*montant maximum[^\n]*(.*?)(?=1\.3|Article|$)'),
+            ((('allotissement',), ('montant',)), r'Allotissement[^\n]*montant[^\n]*(.*?)(?=1\.3|Article|$)'),
+            ((('intitulé du lot',),), r'Intitulé du lot[^\n]*(.*?)(?=1\.3|Article|$)'),
+            ((('allotissement',),), r'Allotissement[^\n]*(.*?)(?=1\.3|Article|$)'),
+            ((('montant estimatif',),), r'montant estimatif[^\n]*(.*?)(?=1\.3|Article|$)'),
+            # Patterns génériques
+            ((('lotissement',),), r'LOTISSEMENT[^\n]*(.*?)(?=Article|$)'),
+            ((('lots',),), r'LOTS[^\n]*(.*?)(?=Article|$)'),
+            ((('repartition',), ('lots',)), r'REPARTITION[^\n]*LOTS[^\n]*(.*?)(?=Article|$)'),
+            ((('allotissement',),), r'ALLOTISSEMENT[^\n]*(.*?)(?=Article|$)'),
+            ((('lot',), ('intitulé',)), r'Lot[^\n]*Intitulé[^\n]*(.*?)(?=Article|$)'),
+            ((('lot',), ('n°',)), r'Lot\s*N°[^\n]*(.*?)(?=Article|$)'),
+            ((('lot',),), r'Lot\s*N[^\n]*(.*?)(?=Article|$)'),
+            ((('n°',), ('intitulé',)), r'N°[^\n]*Intitulé[^\n]*(.*?)(?=Article|$)'),
+            ((('intitulé',), ('montant',)), r'Intitulé[^\n]*Montant[^\n]*(.*?)(?=Article|$)'),
+            ((('montant',), ('estimatif',)), r'Montant[^\n]*estimatif[^\n]*(.*?)(?=Article|$)'),
+            # Patterns avec séparateurs
+            ((('|',), ('intitulé',), ('montant',)),
+             r'[^\n]*\|[^\n]*Intitulé[^\n]*\|[^\n]*Montant[^\n]*(.*?)(?=Article|$)'),
+            ((('|',), ('lot',), ('montant',)), r'[^\n]*\|[^\n]*lot[^\n]*\|[^\n]*Montant[^\n]*(.*?)(?=Article|$)'),
+            # Patterns génériques pour tableaux
+            ((), r'(?:\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*.*?)(?=Article|$)'),
+            ((('€', 'euro'),),
+             r'(?:\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?).*?)(?=Article|$)'),
+        )
+    )
+    
+    # Vérification qu'une section candidate contient bien des lignes de lots :
+    # numéro + intitulé en majuscules communs, puis une seule alternance des
+    # formats de montants (une passe sur la section au lieu d'une par format)
+    _LOT_LINE_CHECK_RE = re.compile(
+        r'\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+(?:'
+        r'\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*'  # Format standard
+        r'|\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)'  # Format avec unités
+        r'|\d+(?:[.,]\d+)?\s*[kKmM]?€?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?'  # Format flexible
+        r'|\d+(?:[.,]\d+)?\s+\d+(?:[.,]\d+)?'  # Format simple
+        r'|\d+(?:[.,]\d+)?\s*[kKmM]?\s+\d+(?:[.,]\d+)?\s*[kKmM]?'  # Format très flexible
+        r')',
+        re.IGNORECASE | re.MULTILINE
+    )
+    
+    # Numéro de lot dans la section des lots (première correspondance retenue)
+    _LOT_NUMERO_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        # Format standard avec espaces
+        r'(\d+)\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*',
+        # Format avec unités monétaires
+        r'(\d+)\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)',
+        # Format flexible
+        r'(\d+)\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?',
+        # Format simple
+        r'(\d+)\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+\d+(?:[.,]\d+)?\s+\d+(?:[.,]\d+)?',
+        # Format très flexible
+        r'(\d+)\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+\d+(?:[.,]\d+)?\s*[kKmM]?\s+\d+(?:[.,]\d+)?\s*[kKmM]?',
+        # Format avec séparateurs
+        r'(\d+)\s*\|\s*[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s*\|\s*\d+(?:[.,]\d+)?\s*\|\s*\d+(?:[.,]\d+)?',
+        # Format avec tirets
+        r'(\d+)\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+-\s+\d+(?:[.,]\d+)?\s+-\s+\d+(?:[.,]\d+)?',
+        # Format générique
+        r'(\d+)\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+[0-9,.\s€kKmM]+'
+    ))
+    
+    # Intitulé de lot dans la section des lots (première correspondance retenue)
+    _LOT_INTITULE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        # Format standard avec espaces
+        r'\d+\s+([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*',
+        # Format avec unités monétaires
+        r'\d+\s+([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)',
+        # Format flexible
+        r'\d+\s+([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?',
+        # Format simple
+        r'\d+\s+([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s+\d+(?:[.,]\d+)?\s+\d+(?:[.,]\d+)?',
+        # Format très flexible
+        r'\d+\s+([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s+\d+(?:[.,]\d+)?\s*[kKmM]?\s+\d+(?:[.,]\d+)?\s*[kKmM]?',
+        # Format avec séparateurs
+        r'\d+\s*\|\s*([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s*\|\s*\d+(?:[.,]\d+)?\s*\|\s*\d+(?:[.,]\d+)?',
+        # Format avec tirets
+        r'\d+\s+([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s+-\s+\d+(?:[.,]\d+)?\s+-\s+\d+(?:[.,]\d+)?',
+        # Format générique
+        r'\d+\s+([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s+[0-9,.\s€kKmM]+'
+    ))
+    
+    # Montant estimatif de chaque ligne de lot (sommé sur la section)
+    _LOT_MONTANT_ESTIME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        # Format standard avec espaces (corrigé)
+        r'\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+(\d{1,3}(?:\s\d{3})*)\s+\d{1,3}(?:\s\d{3})*',
+        # Format avec unités monétaires
+        r'\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+(\d+(?:[.,]\d+)?)\s*[km]?(?:€|euros?)\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)',
+        # Format flexible
+        r'\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+(\d+(?:[.,]\d+)?)\s*[kKmM]?€?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?',
+        # Format simple (corrigé)
+        r'\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+(\d+(?:[.,]\d+)?)\s+\d+(?:[.,]\d+)?',
+        # Format très flexible
+        r'\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+(\d+(?:[.,]\d+)?)\s*[kKmM]?\s+\d+(?:[.,]\d+)?\s*[kKmM]?',
+        # Format avec séparateurs
+        r'\d+\s*\|\s*[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s*\|\s*(\d+(?:[.,]\d+)?)\s*\|\s*\d+(?:[.,]\d+)?',
+        # Format avec tirets
+        r'\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+-\s+(\d+(?:[.,]\d+)?)\s+-\s+\d+(?:[.,]\d+)?',
+        # Format générique
+        r'\d+\s+[A-Z][A-Z\s/](?:[A-Z/]|\s++)*?\s+(\d+(?:[.,]\d+)?)\s*[0-9,.\s€kKmM]+'
+    ))
+    
+    # Fallbacks appliqués au texte complet quand la section des lots ne donne rien
+    _LOT_NUMERO_FALLBACK_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(?:lot|prestation)[\s\w]*+[:]\s*(\d+)',
+        r'(?:n°|no)[\s\w]*+[:]\s*(\d+)'
+    ))
+    _MONTANT_ESTIME_FALLBACK_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(?:montant|budget|prix)[\s\w]*+[:]\s*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)',
+        r'(?:budget|montant)[\s\w]*+[:]\s*(\d+(?:[.,]\d+)?)\s*[km](?:€|euros?)'
+    ))
+    _MONTANT_MAXI_FALLBACK_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(?:maximum|maxi|plafond)[\s\w]*+[:]\s*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)',
+        r'(?:budget|montant)[\s\w]*(?:maximum|maxi|plafond)[\s\w]*+[:]\s*(\d+(?:[.,]\d+)?)\s*[km](?:€|euros?)'
+    ))
+    # Nettoyage des intitulés de lots
+    _LOT_TITLE_NOISE_RE = re.compile(r'[|€$]')
+    _WHITESPACE_RE = re.compile(r'\s+')
+    
+    # Nettoyage du texte et des valeurs extraites (appliqué à chaque match)
+    _TEXT_NOISE_RE = re.compile(r'[^\w\s.,:;()€/-]')
+    _COLON_SPACING_RE = re.compile(r'[:]\s*')
+    _EDGE_PUNCTUATION_RE = re.compile(r'^[.,\s]+|[.,\s]+$')
+    _BRACKETS_ONLY_RE = re.compile(r'^[\[\]()]+$')
+    _DOTS_ONLY_RE = re.compile(r'^\.+$')
+    
+    # Taille maximale de texte analysée (au-delà, le texte est tronqué)
+    MAX_TEXT_LENGTH = 2_000_000
+    
+    # Patterns des critères d'attribution par type, par ordre de priorité
+    # (tous exigent le mot "critère")
+    CRITERES_PATTERNS = {
+        'economique': [
+            re.compile(r'(?:critère|critere)[\s\w]*(?:économique|economique|prix)[\s\w]*+[:]\s*([^.\n]{10,100})', re.IGNORECASE),
+            re.compile(r'(?:économique|economique|prix)[\s\w]*(?:critère|critere)[\s\w]*+[:]\s*([^.\n]{10,100})', re.IGNORECASE)
+        ],
+        'techniques': [
+            re.compile(r'(?:critère|critere)[\s\w]*(?:technique)[\s\w]*+[:]\s*([^.\n]{10,100})', re.IGNORECASE),
+            re.compile(r'(?:technique)[\s\w]*(?:critère|critere)[\s\w]*+[:]\s*([^.\n]{10,100})', re.IGNORECASE)
+        ],
+        'autres': [
+            re.compile(r'(?:autre|autres)[\s\w]*(?:critère|critere)[\s\w]*+[:]\s*([^.\n]{10,100})', re.IGNORECASE),
+            re.compile(r'(?:critère|critere)[\s\w]*(?:autre|autres)[\s\w]*+[:]\s*([^.\n]{10,100})', re.IGNORECASE)
+        ]
+    }
+    
+    # Base Hyperscan des patterns simples compilée à la demande (None = pas encore
+    # compilée, False = indisponible) et (champ, rang du pattern) de chaque id
+    _hs_database = None
+    _hs_pattern_keys: Tuple[Tuple[str, int], ...] = ()
+    # Quantificateur possessif '*+', non supporté par Hyperscan : la version gloutonne
+    # accepte tout ce qu'accepte la possessive, ce qui suffit pour un pré-filtre
+    _POSSESSIVE_STAR_RE = re.compile(r'(?<!\\)\*\+')
+    
     def __init__(self):
         """Initialise l'améliorateur avec des patterns simplifiés"""
-        self.simple_patterns = self._init_simple_patterns()
+        # Patterns compilés une fois pour toutes : plus de passage par le cache de re à chaque appel
+        self.simple_patterns = {
+            field: tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in patterns)
+            for field, patterns in self._init_simple_patterns().items()
+        }
         self.validation_rules = self._init_validation_rules()
         self.context_analyzer = self._init_context_analyzer()
         self.intelligent_extractors = self._init_intelligent_extractors()
+        # Dernière section des lots localisée : (texte, section)
+        self._lots_section_cache = None
+        # Calculs par texte {(nature, texte): valeur}, partagés par les extracteurs le temps
+        # d'un appel à extract_improved_data ; None hors appel : aucun document retenu
+        self._call_cache = None
         
     def _init_simple_patterns(self) -> Dict[str, List[str]]:
         """Patterns d'extraction simplifiés et plus précis"""
         return {
             # Intitulé de procédure - patterns simples
             'intitule_procedure': [
-                r'(?:intitulé|intitule|titre|objet)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-                r'(?:procédure|procedure)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-                r'(?:appel|offre|consultation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-                r'(?:objet|sujet)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-                r'(?:marché|marche)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)'
+                r'(?:intitulé|intitule|titre|objet)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+                r'(?:procédure|procedure)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+                r'(?:appel|offre|consultation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+                r'(?:objet|sujet)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+                r'(?:marché|marche)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)'
             ],
             
             # Type de procédure - patterns simples
             'type_procedure': [
-                r'(?:type|nature)[\s\w]*[:]\s*([^.\n]{5,50})(?:\n|$)',
-                r'(?:procédure|procedure)[\s\w]*[:]\s*([^.\n]{5,50})(?:\n|$)',
-                r'(?:appel|offre|consultation)[\s\w]*[:]\s*([^.\n]{5,50})(?:\n|$)',
-                r'(?:marché|marche)[\s\w]*[:]\s*([^.\n]{5,50})(?:\n|$)'
+                r'(?:type|nature)[\s\w]*+[:]\s*([^.\n]{5,50})(?:\n|$)',
+                r'(?:procédure|procedure)[\s\w]*+[:]\s*([^.\n]{5,50})(?:\n|$)',
+                r'(?:appel|offre|consultation)[\s\w]*+[:]\s*([^.\n]{5,50})(?:\n|$)',
+                r'(?:marché|marche)[\s\w]*+[:]\s*([^.\n]{5,50})(?:\n|$)'
             ],
             
             # Intitulé de lot - patterns simples
             'intitule_lot': [
-                r'(?:lot|prestation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-                r'(?:intitulé|intitule|titre)[\s\w]*(?:lot|prestation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-                r'(?:objet|sujet)[\s\w]*(?:lot|prestation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)'
+                r'(?:lot|prestation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+                r'(?:intitulé|intitule|titre)[\s\w]*(?:lot|prestation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+                r'(?:objet|sujet)[\s\w]*(?:lot|prestation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)'
             ],
             
             # Groupement - patterns simples
             'groupement': [
-                r'(?:groupement|organisme|entité|entite)[\s\w]*[:]\s*([^.\n]{3,50})(?:\n|$)',
-                r'(?:acheteur|donneur|ordre)[\s\w]*[:]\s*([^.\n]{3,50})(?:\n|$)',
-                r'(?:établissement|etablissement|institution)[\s\w]*[:]\s*([^.\n]{3,50})(?:\n|$)'
+                r'(?:groupement|organisme|entité|entite)[\s\w]*+[:]\s*([^.\n]{3,50})(?:\n|$)',
+                r'(?:acheteur|donneur|ordre)[\s\w]*+[:]\s*([^.\n]{3,50})(?:\n|$)',
+                r'(?:établissement|etablissement|institution)[\s\w]*+[:]\s*([^.\n]{3,50})(?:\n|$)'
             ],
             
             # Montant global estimé - patterns simples
             'montant_global_estime': [
-                r'(?:montant|budget|prix)[\s\w]*[:]\s*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)',
-                r'(?:budget|montant)[\s\w]*[:]\s*(\d+(?:[.,]\d+)?)\s*(?:k€|keuros?|m€|meuros?)',
-                r'(?:enveloppe|allocation)[\s\w]*[:]\s*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)'
+                r'(?:montant|budget|prix)[\s\w]*+[:]\s*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)',
+                r'(?:budget|montant)[\s\w]*+[:]\s*(\d+(?:[.,]\d+)?)\s*[km](?:€|euros?)',
+                r'(?:enveloppe|allocation)[\s\w]*+[:]\s*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)'
             ],
             
             # Date limite - patterns simples
             'date_limite': [
-                r'(?:date|échéance|clôture)[\s\w]*[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'(?:date|échéance|clôture)[\s\w]*[:]\s*(\d{4}-\d{2}-\d{2})',
-                r'(?:date|échéance|clôture)[\s\w]*[:]\s*(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})'
+                r'(?:date|échéance|clôture)[\s\w]*+[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+                r'(?:date|échéance|clôture)[\s\w]*+[:]\s*(\d{4}-\d{2}-\d{2})',
+                r'(?:date|échéance|clôture)[\s\w]*+[:]\s*(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})'
             ],
             
             # Statut - patterns simples
             'statut': [
-                r'(?:statut|état|etat|phase)[\s\w]*[:]\s*([^.\n]{3,30})',
-                r'(?:procédure|procedure)[\s\w]*(?:statut|état|etat)[\s\w]*[:]\s*([^.\n]{3,30})'
+                r'(?:statut|état|etat|phase)[\s\w]*+[:]\s*([^.\n]{3,30})',
+                r'(?:procédure|procedure)[\s\w]*(?:statut|état|etat)[\s\w]*+[:]\s*([^.\n]{3,30})'
             ],
             
             # Nombre de lots - patterns simples
             'nbr_lots': [
-                r'(?:nombre|nb|nbr)[\s\w]*(?:lots|prestations)[\s\w]*[:]\s*(\d+)',
-                r'(?:lots|prestations)[\s\w]*(?:nombre|nb|nbr)[\s\w]*[:]\s*(\d+)',
-                r'(?:total)[\s\w]*(?:lots|prestations)[\s\w]*[:]\s*(\d+)'
+                r'(?:nombre|nb|nbr)[\s\w]*(?:lots|prestations)[\s\w]*+[:]\s*(\d+)',
+                r'(?:lots|prestations)[\s\w]*(?:nombre|nb|nbr)[\s\w]*+[:]\s*(\d+)',
+                r'(?:total)[\s\w]*(?:lots|prestations)[\s\w]*+[:]\s*(\d+)'
             ],
             
             # Quantités - patterns simples
             'quantite_minimum': [
-                r'(?:quantité|quantite|qty)[\s\w]*(?:minimum|min)[\s\w]*[:]\s*(\d+)',
-                r'(?:minimum|min)[\s\w]*(?:quantité|quantite)[\s\w]*[:]\s*(\d+)'
+                r'(?:quantité|quantite|qty)[\s\w]*(?:minimum|min)[\s\w]*+[:]\s*(\d+)',
+                r'(?:minimum|min)[\s\w]*(?:quantité|quantite)[\s\w]*+[:]\s*(\d+)'
             ],
             
             'quantites_estimees': [
-                r'(?:quantité|quantite|qty)[\s\w]*(?:estimée|estimee|prévue|prevue)[\s\w]*[:]\s*(\d+)',
-                r'(?:estimée|estimee|prévue|prevue)[\s\w]*(?:quantité|quantite)[\s\w]*[:]\s*(\d+)'
+                r'(?:quantité|quantite|qty)[\s\w]*(?:estimée|estimee|prévue|prevue)[\s\w]*+[:]\s*(\d+)',
+                r'(?:estimée|estimee|prévue|prevue)[\s\w]*(?:quantité|quantite)[\s\w]*+[:]\s*(\d+)'
             ],
             
             'quantite_maximum': [
-                r'(?:quantité|quantite|qty)[\s\w]*(?:maximum|max)[\s\w]*[:]\s*(\d+)',
-                r'(?:maximum|max)[\s\w]*(?:quantité|quantite)[\s\w]*[:]\s*(\d+)'
+                r'(?:quantité|quantite|qty)[\s\w]*(?:maximum|max)[\s\w]*+[:]\s*(\d+)',
+                r'(?:maximum|max)[\s\w]*(?:quantité|quantite)[\s\w]*+[:]\s*(\d+)'
             ],
             
             # Critères - patterns simples
             'criteres_economique': [
-                r'(?:critère|critere)[\s\w]*(?:économique|economique|prix)[\s\w]*[:]\s*([^.\n]{10,100})',
-                r'(?:économique|economique|prix)[\s\w]*(?:critère|critere)[\s\w]*[:]\s*([^.\n]{10,100})'
+                r'(?:critère|critere)[\s\w]*(?:économique|economique|prix)[\s\w]*+[:]\s*([^.\n]{10,100})',
+                r'(?:économique|economique|prix)[\s\w]*(?:critère|critere)[\s\w]*+[:]\s*([^.\n]{10,100})'
             ],
             
             'criteres_techniques': [
-                r'(?:critère|critere)[\s\w]*(?:technique|technique)[\s\w]*[:]\s*([^.\n]{10,100})',
-                r'(?:technique|technique)[\s\w]*(?:critère|critere)[\s\w]*[:]\s*([^.\n]{10,100})'
+                r'(?:critère|critere)[\s\w]*(?:technique)[\s\w]*+[:]\s*([^.\n]{10,100})',
+                r'(?:technique)[\s\w]*(?:critère|critere)[\s\w]*+[:]\s*([^.\n]{10,100})'
             ],
             
             # Informations complémentaires - patterns simples
             'infos_complementaires': [
-                r'(?:information|info|renseignement)[\s\w]*(?:complémentaire|complementaire|supplémentaire|supplementaire)[\s\w]*[:]\s*([^.\n]{10,200})',
-                r'(?:complémentaire|complementaire|supplémentaire|supplementaire)[\s\w]*(?:information|info)[\s\w]*[:]\s*([^.\n]{10,200})'
+                r'(?:information|info|renseignement)[\s\w]*(?:complémentaire|complementaire|supplémentaire|supplementaire)[\s\w]*+[:]\s*([^.\n]{10,200})',
+                r'(?:complémentaire|complementaire|supplémentaire|supplementaire)[\s\w]*(?:information|info)[\s\w]*+[:]\s*([^.\n]{10,200})'
             ]
         }
     
     def _init_validation_rules(self) -> Dict[str, Dict[str, Any]]:
-        """Règles de validation pour les données extraites"""
-        return {
+        """Règles de validation pour les données extraites (patterns compilés)"""
+        rules = {
             'intitule_procedure': {
                 'min_length': 10,
                 'max_length': 100,
@@ -158,12 +384,26 @@ class ExtractionImprover:
                 'pattern': r'^\d+$'
             }
         }
+        for field_rules in rules.values():
+            if 'forbidden_patterns' in field_rules:
+                field_rules['forbidden_patterns'] = tuple(re.compile(pattern) for pattern in field_rules['forbidden_patterns'])
+            if 'pattern' in field_rules:
+                field_rules['pattern'] = re.compile(field_rules['pattern'])
+        return rules
     
     def extract_improved_data(self, text: str) -> Dict[str, Any]:
         """Extraction améliorée des données avec validation et intelligence contextuelle"""
+        self._call_cache = {}
         try:
             logger.info("Début de l'extraction améliorée intelligente")
             
+            # Borner la taille du texte pour éviter des temps d'analyse démesurés
+            truncated_from = None
+            if len(text) > self.MAX_TEXT_LENGTH:
+                truncated_from = len(text)
+                logger.warning("⚠️ Texte de %s caractères tronqué à %s", truncated_from, self.MAX_TEXT_LENGTH)
+                text = text[:self.MAX_TEXT_LENGTH]
+            
             # Nettoyer le texte
             cleaned_text = self._clean_text(text)
             
@@ -180,10 +420,21 @@ class ExtractionImprover:
                 extracted_data['intitule_procedure'] = intitule_procedure
             
             # Étape 1: Extraction directe avec patterns
+            # Les patterns de montant ne sont lancés que sur les fenêtres ': nombre devise'
+            montant_windows = self._montant_windows(cleaned_text)
+            # Pré-filtre optionnel : un seul scan pour écarter les patterns sans correspondance
+            rejected = self._rejected_simple_patterns(cleaned_text)
             for field, patterns in self.simple_patterns.items():
                 if field == 'intitule_procedure' and 'intitule_procedure' in extracted_data:
                     continue  # Skip intitule_procedure car déjà extrait
-                value = self._extract_field(cleaned_text, patterns, field)
+                if rejected:
+                    patterns = tuple(pattern for rank, pattern in enumerate(patterns) if (field, rank) not in rejected)
+                if field == 'montant_global_estime':
+                    if not montant_windows:
+                        continue
+                    value = self._extract_field(cleaned_text, patterns, field, montant_windows)
+                else:
+                    value = self._extract_field(cleaned_text, patterns, field)
                 if value:
                     extracted_data[field] = value
             
@@ -222,55 +473,151 @@ class ExtractionImprover:
             # Étape 7: Validation et correction avec la base de données
             validated_data = self._validate_with_database(enriched_data)
             
+            # Signaler la troncature pour que l'interface puisse l'afficher
+            if truncated_from is not None:
+                validated_data['_texte_tronque'] = {
+                    'longueur_originale': truncated_from,
+                    'longueur_analysee': self.MAX_TEXT_LENGTH,
+                }
+            
             logger.info(f"Extraction intelligente terminée: {len(validated_data)} champs extraits")
             return validated_data
             
         except Exception as e:
             logger.error(f"Erreur lors de l'extraction: {e}")
             return {}
+        finally:
+            self._call_cache = None
+            self._lots_section_cache = None
+    
+    def _cached_for_call(self, kind: str, text: str, compute: Callable[[str], Any]) -> Any:
+        """Calcule compute(text) une seule fois par appel à extract_improved_data"""
+        cache = self._call_cache
+        if cache is None:
+            return compute(text)
+        key = (kind, text)
+        if key not in cache:
+            cache[key] = compute(text)
+        return cache[key]
+    
+    def _lower(self, text: str) -> str:
+        """Texte en minuscules, partagé par les extracteurs au cours d'une même extraction"""
+        return self._cached_for_call('lower', text, str.lower)
+    
+    def _montant_windows(self, text: str) -> Tuple[Tuple[int, int], ...]:
+        """Fenêtres de montant du texte, localisées une fois par extraction"""
+        return self._cached_for_call('montant_windows', text, _montant_windows)
     
     def _clean_text(self, text: str) -> str:
         """Nettoie le texte pour améliorer l'extraction"""
         # Remplacer les caractères problématiques MAIS garder les slashes pour les dates
-        text = re.sub(r'[^\w\s.,:;()€/-]', ' ', text)
+        text = self._TEXT_NOISE_RE.sub(' ', text)
         
         # Normaliser les espaces
-        text = re.sub(r'\s+', ' ', text)
+        text = self._WHITESPACE_RE.sub(' ', text)
         
         # Normaliser les deux-points
-        text = re.sub(r'[:]\s*', ': ', text)
+        text = self._COLON_SPACING_RE.sub(': ', text)
         
         return text.strip()
     
-    def _extract_field(self, text: str, patterns: List[str], field: str) -> Optional[str]:
-        """Extrait un champ spécifique avec les patterns donnés"""
+    def _get_hyperscan_database(self):
+        """Compile une seule fois la base Hyperscan des patterns simples (mode pré-filtre)"""
+        cls = type(self)
+        if cls._hs_database is None:
+            try:
+                flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+                         | hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+                         | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_MULTILINE)
+                expressions = []
+                keys = []
+                for field, patterns in self._init_simple_patterns().items():
+                    for rank, pattern in enumerate(patterns):
+                        expression = self._POSSESSIVE_STAR_RE.sub('*', pattern).encode('utf-8')
+                        try:
+                            hyperscan.Database().compile(expressions=[expression], ids=[0], elements=1, flags=[flags])
+                        except Exception:
+                            continue  # Construction non supportée : le pattern reste toujours candidat
+                        expressions.append(expression)
+                        keys.append((field, rank))
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=expressions,
+                    ids=list(range(len(expressions))),
+                    elements=len(expressions),
+                    flags=[flags] * len(expressions)
+                )
+                cls._hs_pattern_keys = tuple(keys)
+                cls._hs_database = database
+            except Exception as e:
+                logger.warning(f"Hyperscan indisponible pour les patterns simples: {e}")
+                cls._hs_database = False
+        return cls._hs_database
+    
+    def _rejected_simple_patterns(self, text: str) -> set:
+        """
+        Pré-filtre en une seule passe Hyperscan les patterns simples sans correspondance
+        
+        Le texte est passé en minuscules (les patterns n'ont pas de majuscule non
+        ASCII) ; inapplicable si le texte contient un caractère que IGNORECASE
+        apparie à une lettre ASCII (İ, ı, ſ).
+        
+        Returns:
+            Clés (champ, rang) des patterns sans aucune correspondance possible
+            (ensemble vide si Hyperscan n'est pas disponible)
+        """
+        if not HYPERSCAN_AVAILABLE or self._CASE_FOLD_TRAPS_RE.search(text):
+            return set()
+        
+        database = self._get_hyperscan_database()
+        if not database:
+            return set()
+        
+        hits = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+        
+        try:
+            database.scan(self._lower(text).encode('utf-8'), match_event_handler=on_match)
+        except Exception as e:
+            logger.debug("Erreur scan Hyperscan: %s", e)
+            return set()
+        
+        return {key for pattern_id, key in enumerate(self._hs_pattern_keys) if pattern_id not in hits}
+    
+    def _extract_field(self, text: str, patterns: Tuple[re.Pattern, ...], field: str,
+                       windows: Optional[Tuple[Tuple[int, int], ...]] = None) -> Optional[str]:
+        """Extrait un champ spécifique avec les patterns donnés (limités aux fenêtres si fournies)"""
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                # Prendre le premier match valide
-                for match in matches:
-                    if isinstance(match, tuple):
-                        match = match[0]
-                    
-                    # Nettoyer le match
-                    cleaned_match = self._clean_match(match)
-                    
-                    # Valider le match
-                    if self._is_valid_match(cleaned_match, field):
-                        return cleaned_match
+            # Parcours paresseux : on s'arrête au premier match valide sans
+            # matérialiser la liste complète des matches
+            if windows is None:
+                matches = pattern.finditer(text)
+            else:
+                matches = (match for start, end in windows for match in pattern.finditer(text, start, end))
+            for match in matches:
+                value = (match.group(1) if match.re.groups else match.group(0)) or ''
+                
+                # Nettoyer le match
+                cleaned_match = self._clean_match(value)
+                
+                # Valider le match
+                if self._is_valid_match(cleaned_match, field):
+                    return cleaned_match
         
         return None
     
     def _clean_match(self, match: str) -> str:
         """Nettoie un match extrait"""
         # Supprimer les caractères indésirables
-        cleaned = re.sub(r'^[.,\s]+|[.,\s]+$', '', match)
+        cleaned = self._EDGE_PUNCTUATION_RE.sub('', match)
         
         # Supprimer les crochets et parenthèses vides
-        cleaned = re.sub(r'^[\[\]()]+$', '', cleaned)
+        cleaned = self._BRACKETS_ONLY_RE.sub('', cleaned)
         
         # Supprimer les points multiples
-        cleaned = re.sub(r'^\.+$', '', cleaned)
+        cleaned = self._DOTS_ONLY_RE.sub('', cleaned)
         
         return cleaned.strip()
     
@@ -292,7 +639,7 @@ class ExtractionImprover:
             # Vérifier les patterns interdits
             if 'forbidden_patterns' in rules:
                 for pattern in rules['forbidden_patterns']:
-                    if re.match(pattern, match):
+                    if pattern.match(match):
                         return False
             
             # Vérifier les mots requis
@@ -303,7 +650,7 @@ class ExtractionImprover:
             
             # Vérifier les patterns spécifiques
             if 'pattern' in rules:
-                if not re.match(rules['pattern'], match):
+                if not rules['pattern'].match(match):
                     return False
         
         return True
@@ -327,8 +674,8 @@ class ExtractionImprover:
         for field, value in data.items():
             if isinstance(value, str):
                 # Nettoyer les chaînes
-                cleaned_value = re.sub(r'\s+', ' ', str(value)).strip()
-                cleaned_value = re.sub(r'^[.,\s]+|[.,\s]+$', '', cleaned_value)
+                cleaned_value = self._WHITESPACE_RE.sub(' ', str(value)).strip()
+                cleaned_value = self._EDGE_PUNCTUATION_RE.sub('', cleaned_value)
                 
                 if cleaned_value:
                     cleaned_data[field] = cleaned_value
@@ -416,7 +763,7 @@ class ExtractionImprover:
             'complexity_level': 'medium'
         }
         
-        text_lower = text.lower()
+        text_lower = self._lower(text)
         
         # Détecter le type de document
         for doc_type, keywords in self.context_analyzer['document_types'].items():
@@ -583,7 +930,7 @@ class ExtractionImprover:
             'Équipement': ['équipement', 'equipement', 'matériel', 'materiel', 'machine', 'outil', 'véhicule', 'vehicule', 'engin', 'appareil']
         }
         
-        text_lower = text.lower()
+        text_lower = self._lower(text)
         for univers, keywords in univers_patterns.items():
             if any(keyword in text_lower for keyword in keywords):
                 return univers
@@ -621,7 +968,7 @@ class ExtractionImprover:
             'Annulé': ['annulé', 'annule', 'annulé', 'abandonné', 'abandonne', 'supprimé', 'supprime']
         }
         
-        text_lower = text.lower()
+        text_lower = self._lower(text)
         for statut, keywords in statut_patterns.items():
             if any(keyword in text_lower for keyword in keywords):
                 return statut
@@ -638,7 +985,7 @@ class ExtractionImprover:
             'CAIH': ['caih', 'CAIH', 'Centre', 'Centre']
         }
         
-        text_lower = text.lower()
+        text_lower = self._lower(text)
         for groupement, keywords in groupement_patterns.items():
             if any(keyword in text_lower for keyword in keywords):
                 return groupement
@@ -676,22 +1023,21 @@ class ExtractionImprover:
             r'N°\s*([A-Z0-9]{3,15})',
             r'([A-Z0-9]{3,15})',
             # Patterns avec contexte
-            r'(?:référence|reference|ref|n°|no)[\s\w]*[:]\s*([A-Z0-9_\-]{2,15})',
-            r'(?:procédure|procedure)[\s\w]*[:]\s*([A-Z0-9_\-]{2,15})',
-            r'(?:marché|marche)[\s\w]*[:]\s*([A-Z0-9_\-]{2,15})',
-            r'(?:consultation)[\s\w]*[:]\s*([A-Z0-9_\-]{2,15})'
+            r'(?:référence|reference|ref|n°|no)[\s\w]*+[:]\s*([A-Z0-9_\-]{2,15})',
+            r'(?:procédure|procedure)[\s\w]*+[:]\s*([A-Z0-9_\-]{2,15})',
+            r'(?:marché|marche)[\s\w]*+[:]\s*([A-Z0-9_\-]{2,15})',
+            r'(?:consultation)[\s\w]*+[:]\s*([A-Z0-9_\-]{2,15})'
         ]
         
         for pattern in ref_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                ref = matches[0].strip()
+            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            if match:
+                ref = (match.group(1) if match.re.groups else match.group(0)).strip()
                 # Valider que c'est une référence valide
                 if (len(ref) >= 2 and 
                     not ref.lower() in ['cha', 'the', 'and', 'for', 'des', 'les', 'du', 'de', 'la', 'sur', 'par', 'avec', 'dans', 'pour', 'sur', 'page'] and
-                    not ref.isdigit() and  # Éviter les numéros de page
-                    not re.match(r'^\d{1,2}$', ref) and  # Éviter les petits nombres
-                    not re.match(r'^[a-z]+$', ref) and  # Éviter les mots en minuscules
+                    not ref.isdigit() and  # Éviter les numéros de page et les petits nombres
+                    not (ref.isascii() and ref.isalpha() and ref.islower()) and  # Éviter les mots en minuscules
                     not ref.startswith('http') and  # Éviter les URLs
                     not ref.startswith('www') and  # Éviter les URLs
                     not ref.startswith('mailto')):  # Éviter les emails
@@ -709,7 +1055,7 @@ class ExtractionImprover:
             'Convention': ['convention', 'accord', 'partenariat']
         }
         
-        text_lower = text.lower()
+        text_lower = self._lower(text)
         for type_proc, keywords in type_patterns.items():
             if any(keyword in text_lower for keyword in keywords):
                 return type_proc
@@ -731,7 +1077,7 @@ class ExtractionImprover:
                 pass
         
         # Chercher dans le texte
-        text_lower = text.lower()
+        text_lower = self._lower(text)
         if 'multi' in text_lower or 'plusieurs' in text_lower or 'alloti' in text_lower or 'lotissement' in text_lower:
             return 'Multi-attributif'
         elif 'mono' in text_lower or 'unique' in text_lower or 'unitaire' in text_lower:
@@ -748,7 +1094,7 @@ class ExtractionImprover:
             'Fournitures': ['fourniture', 'fourniture', 'matériel', 'materiel', 'équipement', 'equipement']
         }
         
-        text_lower = text.lower()
+        text_lower = self._lower(text)
         for execution, keywords in execution_patterns.items():
             if any(keyword in text_lower for keyword in keywords):
                 return execution
@@ -761,12 +1107,12 @@ class ExtractionImprover:
         # Patterns améliorés pour les dates
         date_patterns = [
             # Patterns avec contexte spécifique pour date limite
-            r'(?:date|échéance|clôture)[\s\w]*(?:limite|remise|offres)[\s\w]*[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'(?:date|échéance|clôture)[\s\w]*(?:limite|remise|offres)[\s\w]*[:]\s*(\d{4}-\d{2}-\d{2})',
-            r'(?:date|échéance|clôture)[\s\w]*(?:limite|remise|offres)[\s\w]*[:]\s*(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})',
+            r'(?:date|échéance|clôture)[\s\w]*(?:limite|remise|offres)[\s\w]*+[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'(?:date|échéance|clôture)[\s\w]*(?:limite|remise|offres)[\s\w]*+[:]\s*(\d{4}-\d{2}-\d{2})',
+            r'(?:date|échéance|clôture)[\s\w]*(?:limite|remise|offres)[\s\w]*+[:]\s*(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})',
             # Patterns plus permissifs
-            r'(?:date|échéance|clôture)[\s\w]*[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'(?:date|échéance|clôture)[\s\w]*[:]\s*(\d{4}-\d{2}-\d{2})',
+            r'(?:date|échéance|clôture)[\s\w]*+[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'(?:date|échéance|clôture)[\s\w]*+[:]\s*(\d{4}-\d{2}-\d{2})',
             # Patterns génériques (plus permissifs)
             r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
             r'(\d{4}-\d{2}-\d{2})',
@@ -775,9 +1121,9 @@ class ExtractionImprover:
         ]
         
         for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                date_str = matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                date_str = match.group(1)
                 # Valider que c'est une date valide
                 if self._is_valid_date_format(date_str):
                     return date_str
@@ -789,9 +1135,9 @@ class ExtractionImprover:
         ]
         
         for pattern in generic_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                date_str = matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                date_str = match.group(1)
                 if self._is_valid_date_format(date_str):
                     return date_str
         
@@ -801,20 +1147,20 @@ class ExtractionImprover:
         """Extraction intelligente de la date d'attribution"""
         attribution_patterns = [
             # Patterns avec contexte spécifique
-            r'(?:attribution|attribué)[\s\w]*(?:marché|marche|contrat)[\s\w]*[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'(?:attribution|attribué)[\s\w]*(?:marché|marche|contrat)[\s\w]*[:]\s*(\d{4}-\d{2}-\d{2})',
-            r'(?:attribution|attribué)[\s\w]*(?:marché|marche|contrat)[\s\w]*[:]\s*(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})',
+            r'(?:attribution|attribué)[\s\w]*(?:marché|marche|contrat)[\s\w]*+[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'(?:attribution|attribué)[\s\w]*(?:marché|marche|contrat)[\s\w]*+[:]\s*(\d{4}-\d{2}-\d{2})',
+            r'(?:attribution|attribué)[\s\w]*(?:marché|marche|contrat)[\s\w]*+[:]\s*(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})',
             # Patterns avec contexte général
-            r'(?:attribution|attribué)[\s\w]*[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'(?:attribution|attribué)[\s\w]*[:]\s*(\d{4}-\d{2}-\d{2})',
+            r'(?:attribution|attribué)[\s\w]*+[:]\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'(?:attribution|attribué)[\s\w]*+[:]\s*(\d{4}-\d{2}-\d{2})',
             # Patterns génériques
-            r'(?:attribution|attribué)[\s\w]*[:]\s*(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})'
+            r'(?:attribution|attribué)[\s\w]*+[:]\s*(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})'
         ]
         
         for pattern in attribution_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                date_str = matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                date_str = match.group(1)
                 # Valider que c'est une date valide
                 if self._is_valid_date_format(date_str):
                     return date_str
@@ -824,15 +1170,15 @@ class ExtractionImprover:
     def _extract_duree_marche_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[int]:
         """Extraction intelligente de la durée du marché"""
         duree_patterns = [
-            r'(?:durée|duree|période)[\s\w]*[:]\s*(\d+)\s*(?:mois|mois)',
-            r'(\d+)\s*(?:mois|mois)[\s\w]*(?:durée|duree|marché|marche)'
+            r'(?:durée|duree|période)[\s\w]*+[:]\s*(\d+)\s*(?:mois)',
+            r'(\d+)\s*(?:mois)[\s\w]*(?:durée|duree|marché|marche)'
         ]
         
         for pattern in duree_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
                 try:
-                    return int(matches[0])
+                    return int(match.group(1))
                 except:
                     continue
         
@@ -845,7 +1191,7 @@ class ExtractionImprover:
             'Non': ['sans reconduction', 'non reconduction', 'non renouvelable']
         }
         
-        text_lower = text.lower()
+        text_lower = self._lower(text)
         for reconduction, keywords in reconduction_patterns.items():
             if any(keyword in text_lower for keyword in keywords):
                 return reconduction
@@ -914,16 +1260,16 @@ class ExtractionImprover:
     def _extract_nbr_lots_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[int]:
         """Extraction intelligente du nombre de lots"""
         nbr_patterns = [
-            r'(?:nombre|nb|nbr)[\s\w]*(?:lots|prestations)[\s\w]*[:]\s*(\d+)',
-            r'(?:lots|prestations)[\s\w]*(?:nombre|nb|nbr)[\s\w]*[:]\s*(\d+)',
-            r'(?:total)[\s\w]*(?:lots|prestations)[\s\w]*[:]\s*(\d+)'
+            r'(?:nombre|nb|nbr)[\s\w]*(?:lots|prestations)[\s\w]*+[:]\s*(\d+)',
+            r'(?:lots|prestations)[\s\w]*(?:nombre|nb|nbr)[\s\w]*+[:]\s*(\d+)',
+            r'(?:total)[\s\w]*(?:lots|prestations)[\s\w]*+[:]\s*(\d+)'
         ]
         
         for pattern in nbr_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
                 try:
-                    return int(matches[0])
+                    return int(match.group(1))
                 except:
                     continue
         
@@ -959,9 +1305,9 @@ class ExtractionImprover:
         ]
         
         for pattern in rc_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                intitule = matches[0].strip()
+            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            if match:
+                intitule = (match.group(1) if match.re.groups else match.group(0)).strip()
                 # Post-traitement : couper au premier saut de ligne ou point
                 intitule = intitule.split('\n')[0].split('.')[0].strip()
                 # Validation améliorée
@@ -973,7 +1319,7 @@ class ExtractionImprover:
                     not intitule.startswith('N°') and
                     not intitule.startswith('Article') and
                     not intitule.startswith('Page') and
-                    not re.match(r'^\d+$', intitule) and  # Éviter les numéros
+                    not intitule.isdecimal() and  # Éviter les numéros
                     not re.match(r'^\d+\s+sur\s+\d+$', intitule)):  # Éviter "1 sur 16"
                     return intitule
         
@@ -985,96 +1331,71 @@ class ExtractionImprover:
         # Chercher d'abord dans la section des lots
         lots_section = self._extract_lots_section(text)
         if lots_section:
-            # Patterns universels pour extraire les numéros de lots
-            lot_patterns = [
-                # Format standard avec espaces
-                r'(\d+)\s+[A-Z][A-Z\s/]+?\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*',
-                # Format avec unités monétaires
-                r'(\d+)\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)',
-                # Format flexible
-                r'(\d+)\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?',
-                # Format simple
-                r'(\d+)\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s+\d+(?:[.,]\d+)?',
-                # Format très flexible
-                r'(\d+)\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s*[kKmM]?\s+\d+(?:[.,]\d+)?\s*[kKmM]?',
-                # Format avec séparateurs
-                r'(\d+)\s*\|\s*[A-Z][A-Z\s/]+?\s*\|\s*\d+(?:[.,]\d+)?\s*\|\s*\d+(?:[.,]\d+)?',
-                # Format avec tirets
-                r'(\d+)\s+[A-Z][A-Z\s/]+?\s+-\s+\d+(?:[.,]\d+)?\s+-\s+\d+(?:[.,]\d+)?',
-                # Format générique
-                r'(\d+)\s+[A-Z][A-Z\s/]+?\s+[0-9,.\s€kKmM]+'
-            ]
-            
-            for pattern in lot_patterns:
-                matches = re.findall(pattern, lots_section, re.IGNORECASE | re.MULTILINE)
-                if matches:
+            for pattern in self._select_lot_patterns(self._LOT_NUMERO_PATTERNS, lots_section):
+                # Seule la première correspondance est utilisée
+                match = pattern.search(lots_section)
+                if match:
                     try:
-                        return int(matches[0])
+                        return int(match.group(1))
                     except:
                         continue
         
         # Fallback vers les patterns génériques
-        lot_patterns = [
-            r'(?:lot|prestation)[\s\w]*[:]\s*(\d+)',
-            r'(?:n°|no)[\s\w]*[:]\s*(\d+)'
-        ]
-        
-        for pattern in lot_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+        for pattern in self._LOT_NUMERO_FALLBACK_PATTERNS:
+            match = pattern.search(text)
+            if match:
                 try:
-                    return int(matches[0])
+                    return int(match.group(1))
                 except:
                     continue
         
         # Ne PAS retourner de valeur par défaut
         return None
     
+    def _select_lot_patterns(self, patterns: Tuple[re.Pattern, ...], lots_section: str) -> Tuple[re.Pattern, ...]:
+        """Écarte les patterns exigeant une unité monétaire si la section n'en contient aucune"""
+        if self._CURRENCY_RE.search(lots_section):
+            return patterns
+        return tuple(pattern for pattern in patterns if self._CURRENCY_ALTERNATION not in pattern.pattern)
+    
     def _extract_lots_section(self, text: str) -> Optional[str]:
-        """Extraction de la section des lots"""
-        # Chercher la section des lots avec des patterns universels
-        lots_section_patterns = [
-            # Patterns RESAH standard
-            r'Allotissement[^\n]*montant estimatif[^\n]*montant maximum[^\n]*(.*?)(?=1\.3|Article|$)',
-            r'Allotissement[^\n]*montant[^\n]*(.*?)(?=1\.3|Article|$)',
-            r'Intitulé du lot[^\n]*(.*?)(?=1\.3|Article|$)',
-            r'Allotissement[^\n]*(.*?)(?=1\.3|Article|$)',
-            r'montant estimatif[^\n]*(.*?)(?=1\.3|Article|$)',
-            # Patterns génériques
-            r'LOTISSEMENT[^\n]*(.*?)(?=Article|$)',
-            r'LOTS[^\n]*(.*?)(?=Article|$)',
-            r'REPARTITION[^\n]*LOTS[^\n]*(.*?)(?=Article|$)',
-            r'ALLOTISSEMENT[^\n]*(.*?)(?=Article|$)',
-            r'Lot[^\n]*Intitulé[^\n]*(.*?)(?=Article|$)',
-            r'Lot\s*N°[^\n]*(.*?)(?=Article|$)',
-            r'Lot\s*N[^\n]*(.*?)(?=Article|$)',
-            r'N°[^\n]*Intitulé[^\n]*(.*?)(?=Article|$)',
-            r'Intitulé[^\n]*Montant[^\n]*(.*?)(?=Article|$)',
-            r'Montant[^\n]*estimatif[^\n]*(.*?)(?=Article|$)',
-            # Patterns avec séparateurs
-            r'[^\n]*\|[^\n]*Intitulé[^\n]*\|[^\n]*Montant[^\n]*(.*?)(?=Article|$)',
-            r'[^\n]*\|[^\n]*lot[^\n]*\|[^\n]*Montant[^\n]*(.*?)(?=Article|$)',
-            # Patterns génériques pour tableaux
-            r'(?:\d+\s+[A-Z][A-Z\s/]+?\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*.*?)(?=Article|$)',
-            r'(?:\d+\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?).*?)(?=Article|$)'
-        ]
+        """
+        Extraction de la section des lots
+        
+        Les extracteurs de nombre de lots et de montants la demandent tour à tour
+        pour le même texte : elle n'est localisée qu'une fois par texte.
+        """
+        cached = self._lots_section_cache
+        if cached is not None and (cached[0] is text or cached[0] == text):
+            return cached[1]
+        
+        section = self._locate_lots_section(text)
+        self._lots_section_cache = (text, section)
+        return section
+    
+    def _locate_lots_section(self, text: str) -> Optional[str]:
+        """Localise la section des lots dans le texte complet"""
+        # Préfiltre littéral : un pattern dont un mot-clé obligatoire est absent
+        # du texte ne peut pas correspondre (inapplicable si le texte contient un
+        # caractère que IGNORECASE apparie à une lettre ASCII : İ, ı, ſ)
+        text_lower = None if self._CASE_FOLD_TRAPS_RE.search(text) else self._lower(text)
+        rejected_sections = set()
         
-        for pattern in lots_section_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        # Chercher la section des lots avec des patterns universels
+        for anchors, pattern in self._LOTS_SECTION_PATTERNS:
+            if text_lower is not None and not all(
+                    any(keyword in text_lower for keyword in alternatives) for alternatives in anchors):
+                continue
+            match = pattern.search(text)
             if match:
                 section = match.group(1)
+                # Plusieurs patterns renvoient souvent la même section : ne la vérifier qu'une fois
+                if section in rejected_sections:
+                    continue
                 # Vérifier que la section contient des lots avec des patterns plus flexibles
-                lot_patterns = [
-                    r'\d+\s+[A-Z][A-Z\s/]+?\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*',  # Format standard
-                    r'\d+\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)',  # Format avec unités
-                    r'\d+\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?',  # Format flexible
-                    r'\d+\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s+\d+(?:[.,]\d+)?',  # Format simple
-                    r'\d+\s+[A-Z][A-Z\s/]+?\s+\d+(?:[.,]\d+)?\s*[kKmM]?\s+\d+(?:[.,]\d+)?\s*[kKmM]?'  # Format très flexible
-                ]
-                
-                for lot_pattern in lot_patterns:
-                    if re.search(lot_pattern, section, re.IGNORECASE | re.MULTILINE):
-                        return section
+                if self._LOT_LINE_CHECK_RE.search(section):
+                    return section
+                rejected_sections.add(section)
         
         return None
     
@@ -1083,36 +1404,16 @@ class ExtractionImprover:
         # Chercher d'abord dans la section des lots
         lots_section = self._extract_lots_section(text)
         if lots_section:
-            # Patterns universels pour extraire les intitulés de lots
-            intitule_patterns = [
-                # Format standard avec espaces
-                r'\d+\s+([A-Z][A-Z\s/]+?)\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*',
-                # Format avec unités monétaires
-                r'\d+\s+([A-Z][A-Z\s/]+?)\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)',
-                # Format flexible
-                r'\d+\s+([A-Z][A-Z\s/]+?)\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?',
-                # Format simple
-                r'\d+\s+([A-Z][A-Z\s/]+?)\s+\d+(?:[.,]\d+)?\s+\d+(?:[.,]\d+)?',
-                # Format très flexible
-                r'\d+\s+([A-Z][A-Z\s/]+?)\s+\d+(?:[.,]\d+)?\s*[kKmM]?\s+\d+(?:[.,]\d+)?\s*[kKmM]?',
-                # Format avec séparateurs
-                r'\d+\s*\|\s*([A-Z][A-Z\s/]+?)\s*\|\s*\d+(?:[.,]\d+)?\s*\|\s*\d+(?:[.,]\d+)?',
-                # Format avec tirets
-                r'\d+\s+([A-Z][A-Z\s/]+?)\s+-\s+\d+(?:[.,]\d+)?\s+-\s+\d+(?:[.,]\d+)?',
-                # Format générique
-                r'\d+\s+([A-Z][A-Z\s/]+?)\s+[0-9,.\s€kKmM]+'
-            ]
-            
-            for pattern in intitule_patterns:
-                matches = re.findall(pattern, lots_section, re.IGNORECASE | re.MULTILINE)
-                if matches:
-                    intitule = matches[0].strip()
+            for pattern in self._select_lot_patterns(self._LOT_INTITULE_PATTERNS, lots_section):
+                # Seule la première correspondance est utilisée
+                match = pattern.search(lots_section)
+                if match:
+                    intitule = match.group(1).strip()
                     # Nettoyer l'intitulé
-                    intitule = re.sub(r'\s+', ' ', intitule)
+                    intitule = self._WHITESPACE_RE.sub(' ', intitule)
                     # Enlever les caractères parasites
-                    intitule = re.sub(r'[|]', '', intitule)
-                    intitule = re.sub(r'[€$]', '', intitule)
-                    intitule = re.sub(r'\s+', ' ', intitule).strip()
+                    intitule = self._LOT_TITLE_NOISE_RE.sub('', intitule)
+                    intitule = self._WHITESPACE_RE.sub(' ', intitule).strip()
                     
                     if len(intitule) >= 5:  # Réduire la longueur minimale
                         return intitule
@@ -1125,70 +1426,29 @@ class ExtractionImprover:
         # Chercher d'abord dans la section des lots
         lots_section = self._extract_lots_section(text)
         if lots_section:
-            # Patterns universels pour extraire les montants estimatifs
-            montant_patterns = [
-                # Format standard avec espaces (corrigé)
-                r'\d+\s+[A-Z][A-Z\s/]+?\s+(\d{1,3}(?:\s\d{3})*)\s+\d{1,3}(?:\s\d{3})*',
-                # Format avec unités monétaires
-                r'\d+\s+[A-Z][A-Z\s/]+?\s+(\d+(?:[.,]\d+)?)\s*(?:k€|keuros?|m€|meuros?|€|euros?)\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)',
-                # Format flexible
-                r'\d+\s+[A-Z][A-Z\s/]+?\s+(\d+(?:[.,]\d+)?)\s*[kKmM]?€?\s+\d+(?:[.,]\d+)?\s*[kKmM]?€?',
-                # Format simple (corrigé)
-                r'\d+\s+[A-Z][A-Z\s/]+?\s+(\d+(?:[.,]\d+)?)\s+\d+(?:[.,]\d+)?',
-                # Format très flexible
-                r'\d+\s+[A-Z][A-Z\s/]+?\s+(\d+(?:[.,]\d+)?)\s*[kKmM]?\s+\d+(?:[.,]\d+)?\s*[kKmM]?',
-                # Format avec séparateurs
-                r'\d+\s*\|\s*[A-Z][A-Z\s/]+?\s*\|\s*(\d+(?:[.,]\d+)?)\s*\|\s*\d+(?:[.,]\d+)?',
-                # Format avec tirets
-                r'\d+\s+[A-Z][A-Z\s/]+?\s+-\s+(\d+(?:[.,]\d+)?)\s+-\s+\d+(?:[.,]\d+)?',
-                # Format générique
-                r'\d+\s+[A-Z][A-Z\s/]+?\s+(\d+(?:[.,]\d+)?)\s*[0-9,.\s€kKmM]+',
-                # Format avec espaces dans les montants (nouveau)
-                r'\d+\s+[A-Z][A-Z\s/]+?\s+(\d{1,3}(?:\s\d{3})*)\s+\d{1,3}(?:\s\d{3})*'
-            ]
-            
-            for pattern in montant_patterns:
-                matches = re.findall(pattern, lots_section, re.IGNORECASE | re.MULTILINE)
-                if matches:
-                    # Calculer le total des montants estimatifs
-                    total = 0
-                    for montant_str in matches:
-                        try:
-                            # Nettoyer le montant
-                            montant_clean = montant_str.replace(' ', '').replace(',', '.')
-                            
-                            # Gérer les unités
-                            if 'k' in montant_clean.lower():
-                                montant = float(montant_clean.lower().replace('k', '')) * 1000
-                            elif 'm' in montant_clean.lower():
-                                montant = float(montant_clean.lower().replace('m', '')) * 1000000
-                            else:
-                                montant = float(montant_clean)
-                            
-                            total += montant
-                        except:
-                            continue
-                    
-                    if total > 0:
-                        return total
-        
-        # Fallback vers les patterns génériques
-        montant_patterns = [
-            r'(?:montant|budget|prix)[\s\w]*[:]\s*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)',
-            r'(?:budget|montant)[\s\w]*[:]\s*(\d+(?:[.,]\d+)?)\s*(?:k€|keuros?|m€|meuros?)'
-        ]
+            for pattern in self._select_lot_patterns(self._LOT_MONTANT_ESTIME_PATTERNS, lots_section):
+                # Calculer le total des montants estimatifs (finditer : pas de liste intermédiaire)
+                total = 0
+                for match in pattern.finditer(lots_section):
+                    montant_str = match.group(1)
+                    try:
+                        # Nettoyer le montant
+                        montant = _montant_avec_unite(montant_str.translate(_MONTANT_SPACES_COMMA))
+                        
+                        total += montant
+                    except:
+                        continue
+                
+                if total > 0:
+                    return total
         
-        for pattern in montant_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+        # Fallback vers les patterns génériques, limités aux fenêtres ': nombre devise'
+        windows = self._montant_windows(text)
+        for pattern in self._MONTANT_ESTIME_FALLBACK_PATTERNS:
+            match = next(filter(None, (pattern.search(text, start, end) for start, end in windows)), None)
+            if match:
                 try:
-                    montant_str = matches[0].replace('€', '').replace(',', '.').replace(' ', '').strip()
-                    if 'k' in montant_str.lower():
-                        return float(montant_str.lower().replace('k', '')) * 1000
-                    elif 'm' in montant_str.lower():
-                        return float(montant_str.lower().replace('m', '')) * 1000000
-                    else:
-                        return float(montant_str)
+                    return _montant_avec_unite(match.group(1).translate(_MONTANT_CLEAN).strip())
                 except:
                     continue
         
@@ -1196,22 +1456,12 @@ class ExtractionImprover:
     
     def _extract_montant_global_maxi_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[float]:
         """Extraction intelligente du montant global maximum"""
-        max_patterns = [
-            r'(?:maximum|maxi|plafond)[\s\w]*[:]\s*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)',
-            r'(?:budget|montant)[\s\w]*(?:maximum|maxi|plafond)[\s\w]*[:]\s*(\d+(?:[.,]\d+)?)\s*(?:k€|keuros?|m€|meuros?)'
-        ]
-        
-        for pattern in max_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+        windows = self._montant_windows(text)
+        for pattern in self._MONTANT_MAXI_FALLBACK_PATTERNS:
+            match = next(filter(None, (pattern.search(text, start, end) for start, end in windows)), None)
+            if match:
                 try:
-                    montant_str = matches[0].replace('€', '').replace(',', '.').replace(' ', '').strip()
-                    if 'k' in montant_str.lower():
-                        return float(montant_str.lower().replace('k', '')) * 1000
-                    elif 'm' in montant_str.lower():
-                        return float(montant_str.lower().replace('m', '')) * 1000000
-                    else:
-                        return float(montant_str)
+                    return _montant_avec_unite(match.group(1).translate(_MONTANT_CLEAN).strip())
                 except:
                     continue
         
@@ -1362,42 +1612,42 @@ class ExtractionImprover:
     # ===== EXTRACTEURS POUR LES AUTRES COLONNES =====
     
     def _extract_achat_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        return 'Oui' if 'achat' in text.lower() else 'Non'
+        return 'Oui' if 'achat' in self._lower(text) else 'Non'
     
     def _extract_credit_bail_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        return 'Oui' if 'crédit bail' in text.lower() or 'credit bail' in text.lower() else 'Non'
+        return 'Oui' if 'crédit bail' in self._lower(text) or 'credit bail' in self._lower(text) else 'Non'
     
     def _extract_credit_bail_duree_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[int]:
-        if 'crédit bail' in text.lower() or 'credit bail' in text.lower():
-            matches = re.findall(r'(\d+)\s*(?:ans?|années?)', text, re.IGNORECASE)
-            if matches:
-                return int(matches[0])
+        if 'crédit bail' in self._lower(text) or 'credit bail' in self._lower(text):
+            match = re.search(r'(\d+)\s*(?:ans?|années?)', text, re.IGNORECASE)
+            if match:
+                return int(match.group(1))
         return None
     
     def _extract_location_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        return 'Oui' if 'location' in text.lower() else 'Non'
+        return 'Oui' if 'location' in self._lower(text) else 'Non'
     
     def _extract_location_duree_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[int]:
-        if 'location' in text.lower():
-            matches = re.findall(r'(\d+)\s*(?:ans?|années?)', text, re.IGNORECASE)
-            if matches:
-                return int(matches[0])
+        if 'location' in self._lower(text):
+            match = re.search(r'(\d+)\s*(?:ans?|années?)', text, re.IGNORECASE)
+            if match:
+                return int(match.group(1))
         return None
     
     def _extract_mad_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        return 'Oui' if 'mad' in text.lower() or 'mise à disposition' in text.lower() else 'Non'
+        return 'Oui' if 'mad' in self._lower(text) or 'mise à disposition' in self._lower(text) else 'Non'
     
     def _extract_quantite_minimum_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[int]:
         patterns = [
-            r'(?:quantité|quantite)[\s\w]*(?:minimum|min)[\s\w]*[:]\s*(\d+)',
-            r'(?:minimum|min)[\s\w]*(?:quantité|quantite)[\s\w]*[:]\s*(\d+)'
+            r'(?:quantité|quantite)[\s\w]*(?:minimum|min)[\s\w]*+[:]\s*(\d+)',
+            r'(?:minimum|min)[\s\w]*(?:quantité|quantite)[\s\w]*+[:]\s*(\d+)'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
                 try:
-                    return int(matches[0])
+                    return int(match.group(1))
                 except:
                     continue
         
@@ -1405,15 +1655,15 @@ class ExtractionImprover:
     
     def _extract_quantites_estimees_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[int]:
         patterns = [
-            r'(?:quantité|quantite)[\s\w]*(?:estimée|estimee|prévue|prevue)[\s\w]*[:]\s*(\d+)',
-            r'(?:estimée|estimee|prévue|prevue)[\s\w]*(?:quantité|quantite)[\s\w]*[:]\s*(\d+)'
+            r'(?:quantité|quantite)[\s\w]*(?:estimée|estimee|prévue|prevue)[\s\w]*+[:]\s*(\d+)',
+            r'(?:estimée|estimee|prévue|prevue)[\s\w]*(?:quantité|quantite)[\s\w]*+[:]\s*(\d+)'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
                 try:
-                    return int(matches[0])
+                    return int(match.group(1))
                 except:
                     continue
         
@@ -1421,161 +1671,147 @@ class ExtractionImprover:
     
     def _extract_quantite_maximum_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[int]:
         patterns = [
-            r'(?:quantité|quantite)[\s\w]*(?:maximum|max)[\s\w]*[:]\s*(\d+)',
-            r'(?:maximum|max)[\s\w]*(?:quantité|quantite)[\s\w]*[:]\s*(\d+)'
+            r'(?:quantité|quantite)[\s\w]*(?:maximum|max)[\s\w]*+[:]\s*(\d+)',
+            r'(?:maximum|max)[\s\w]*(?:quantité|quantite)[\s\w]*+[:]\s*(\d+)'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
                 try:
-                    return int(matches[0])
+                    return int(match.group(1))
                 except:
                     continue
         
         return None
     
     def _extract_criteres_economique_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        patterns = [
-            r'(?:critère|critere)[\s\w]*(?:économique|economique|prix)[\s\w]*[:]\s*([^.\n]{10,100})',
-            r'(?:économique|economique|prix)[\s\w]*(?:critère|critere)[\s\w]*[:]\s*([^.\n]{10,100})'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
-        
-        return None
+        return self._extract_critere(text, 'economique')
     
     def _extract_criteres_techniques_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        patterns = [
-            r'(?:critère|critere)[\s\w]*(?:technique|technique)[\s\w]*[:]\s*([^.\n]{10,100})',
-            r'(?:technique|technique)[\s\w]*(?:critère|critere)[\s\w]*[:]\s*([^.\n]{10,100})'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
-        
-        return None
+        return self._extract_critere(text, 'techniques')
     
     def _extract_autres_criteres_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        patterns = [
-            r'(?:autre|autres)[\s\w]*(?:critère|critere)[\s\w]*[:]\s*([^.\n]{10,100})',
-            r'(?:critère|critere)[\s\w]*(?:autre|autres)[\s\w]*[:]\s*([^.\n]{10,100})'
-        ]
+        return self._extract_critere(text, 'autres')
+    
+    def _extract_critere(self, text: str, critere_type: str) -> Optional[str]:
+        """Premier critère du type donné, selon l'ordre de priorité des patterns"""
+        # Une recherche de sous-chaîne évite de lancer les patterns sur un texte
+        # qui ne parle pas de critères
+        text_lower = self._lower(text)
+        if 'critère' not in text_lower and 'critere' not in text_lower:
+            return None
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+        # search s'arrête au premier match, là où findall parcourait tout le texte
+        for pattern in self.CRITERES_PATTERNS[critere_type]:
+            match = pattern.search(text)
+            if match:
+                return match.group(1)
         
         return None
     
     def _extract_rse_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        return 'Oui' if 'rse' in text.lower() or 'responsabilité sociale' in text.lower() else 'Non'
+        return 'Oui' if 'rse' in self._lower(text) or 'responsabilité sociale' in self._lower(text) else 'Non'
     
     def _extract_contribution_fournisseur_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
-        return 'Oui' if 'contribution' in text.lower() or 'participation' in text.lower() else 'Non'
+        return 'Oui' if 'contribution' in self._lower(text) or 'participation' in self._lower(text) else 'Non'
     
     def _extract_attributaire_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
         patterns = [
-            r'(?:attributaire|gagnant|retenu)[\s\w]*[:]\s*([^.\n]{3,50})',
-            r'(?:gagnant|retenu)[\s\w]*(?:attributaire)[\s\w]*[:]\s*([^.\n]{3,50})'
+            r'(?:attributaire|gagnant|retenu)[\s\w]*+[:]\s*([^.\n]{3,50})',
+            r'(?:gagnant|retenu)[\s\w]*(?:attributaire)[\s\w]*+[:]\s*([^.\n]{3,50})'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return match.group(1)
         
         return None
     
     def _extract_produit_retenu_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
         patterns = [
-            r'(?:produit|solution)[\s\w]*(?:retenu|retenu)[\s\w]*[:]\s*([^.\n]{5,100})',
-            r'(?:retenu|retenu)[\s\w]*(?:produit|solution)[\s\w]*[:]\s*([^.\n]{5,100})'
+            r'(?:produit|solution)[\s\w]*(?:retenu)[\s\w]*+[:]\s*([^.\n]{5,100})',
+            r'(?:retenu)[\s\w]*(?:produit|solution)[\s\w]*+[:]\s*([^.\n]{5,100})'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return match.group(1)
         
         return None
     
     def _extract_infos_complementaires_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
         patterns = [
-            r'(?:information|info)[\s\w]*(?:complémentaire|complementaire)[\s\w]*[:]\s*([^.\n]{10,200})',
-            r'(?:complémentaire|complementaire)[\s\w]*(?:information|info)[\s\w]*[:]\s*([^.\n]{10,200})'
+            r'(?:information|info)[\s\w]*(?:complémentaire|complementaire)[\s\w]*+[:]\s*([^.\n]{10,200})',
+            r'(?:complémentaire|complementaire)[\s\w]*(?:information|info)[\s\w]*+[:]\s*([^.\n]{10,200})'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return match.group(1)
         
         return None
     
     def _extract_remarques_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
         patterns = [
-            r'(?:remarque|note|observation)[\s\w]*[:]\s*([^.\n]{10,200})'
+            r'(?:remarque|note|observation)[\s\w]*+[:]\s*([^.\n]{10,200})'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return match.group(1)
         
         return None
     
     def _extract_notes_acheteur_procedure_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
         patterns = [
-            r'(?:note|avis)[\s\w]*(?:acheteur|acheteur)[\s\w]*(?:procédure|procedure)[\s\w]*[:]\s*([^.\n]{10,200})'
+            r'(?:note|avis)[\s\w]*(?:acheteur)[\s\w]*(?:procédure|procedure)[\s\w]*+[:]\s*([^.\n]{10,200})'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return match.group(1)
         
         return None
     
     def _extract_notes_acheteur_fournisseur_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
         patterns = [
-            r'(?:note|avis)[\s\w]*(?:acheteur|acheteur)[\s\w]*(?:fournisseur|fournisseur)[\s\w]*[:]\s*([^.\n]{10,200})'
+            r'(?:note|avis)[\s\w]*(?:acheteur)[\s\w]*(?:fournisseur)[\s\w]*+[:]\s*([^.\n]{10,200})'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return match.group(1)
         
         return None
     
     def _extract_notes_acheteur_positionnement_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
         patterns = [
-            r'(?:note|avis)[\s\w]*(?:acheteur|acheteur)[\s\w]*(?:positionnement|positionnement)[\s\w]*[:]\s*([^.\n]{10,200})'
+            r'(?:note|avis)[\s\w]*(?:acheteur)[\s\w]*(?:positionnement)[\s\w]*+[:]\s*([^.\n]{10,200})'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return match.group(1)
         
         return None
     
     def _extract_note_veille_intelligent(self, text: str, context: Dict[str, Any], existing_data: Dict[str, Any]) -> Optional[str]:
         patterns = [
-            r'(?:note|avis)[\s\w]*(?:veille|veille)[\s\w]*[:]\s*([^.\n]{10,200})'
+            r'(?:note|avis)[\s\w]*(?:veille)[\s\w]*+[:]\s*([^.\n]{10,200})'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return match.group(1)
         
         return None
     
@@ -1612,31 +1848,31 @@ class ExtractionImprover:
         ]
         
         for pattern in rc_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                intitule = matches[0].strip()
+            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            if match:
+                intitule = (match.group(1) if match.re.groups else match.group(0)).strip()
                 if self._is_valid_intitule(intitule):
                     return intitule
         
         # Patterns spécifiques pour l'intitulé de procédure (priorité aux patterns avec "procédure")
         patterns = [
             # Patterns avec contexte spécifique et fin de ligne stricte
-            r'(?:intitulé|intitule|titre|objet)[\s\w]*(?:procédure|procedure)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-            r'(?:procédure|procedure)[\s\w]*(?:intitulé|intitule|titre|objet)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:intitulé|intitule|titre|objet)[\s\w]*(?:procédure|procedure)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:procédure|procedure)[\s\w]*(?:intitulé|intitule|titre|objet)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
             # Patterns avec contexte général et fin de ligne stricte
-            r'(?:procédure|procedure)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:procédure|procedure)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
             # Patterns avec contexte d'appel d'offres et fin de ligne stricte
-            r'(?:appel|offre|consultation)[\s\w]*(?:intitulé|intitule|titre|objet)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-            r'(?:appel|offre|consultation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:appel|offre|consultation)[\s\w]*(?:intitulé|intitule|titre|objet)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:appel|offre|consultation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
             # Patterns avec contexte de marché et fin de ligne stricte
-            r'(?:marché|marche)[\s\w]*(?:intitulé|intitule|titre|objet)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-            r'(?:marché|marche)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)'
+            r'(?:marché|marche)[\s\w]*(?:intitulé|intitule|titre|objet)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:marché|marche)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                intitule = matches[0].strip()
+            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            if match:
+                intitule = (match.group(1) if match.re.groups else match.group(0)).strip()
                 # Valider que c'est un intitulé valide
                 if self._is_valid_intitule(intitule):
                     return intitule
@@ -1644,19 +1880,18 @@ class ExtractionImprover:
         # Si aucun pattern spécifique ne fonctionne, essayer les patterns génériques
         # mais exclure ceux qui contiennent "lot" ou "prestation"
         generic_patterns = [
-            r'(?:intitulé|intitule|titre|objet)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-            r'(?:procédure|procedure)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)'
+            r'(?:intitulé|intitule|titre|objet)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:procédure|procedure)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)'
         ]
         
         for pattern in generic_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                for match in matches:
-                    intitule = match.strip()
-                    # Exclure les intitulés qui contiennent "lot" ou "prestation"
-                    if 'lot' not in intitule.lower() and 'prestation' not in intitule.lower():
-                        if self._is_valid_intitule(intitule):
-                            return intitule
+            # Parcours paresseux : arrêt au premier intitulé retenu
+            for match in re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE):
+                intitule = match.group(1).strip()
+                # Exclure les intitulés qui contiennent "lot" ou "prestation"
+                if 'lot' not in intitule.lower() and 'prestation' not in intitule.lower():
+                    if self._is_valid_intitule(intitule):
+                        return intitule
         
         return None
     
@@ -1665,19 +1900,19 @@ class ExtractionImprover:
         # Patterns spécifiques pour l'intitulé du lot (priorité aux patterns avec "lot")
         patterns = [
             # Patterns avec contexte spécifique et fin de ligne stricte
-            r'(?:intitulé|intitule|titre|objet)[\s\w]*(?:lot|prestation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-            r'(?:lot|prestation)[\s\w]*(?:intitulé|intitule|titre|objet)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:intitulé|intitule|titre|objet)[\s\w]*(?:lot|prestation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:lot|prestation)[\s\w]*(?:intitulé|intitule|titre|objet)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
             # Patterns avec contexte général et fin de ligne stricte
-            r'(?:lot|prestation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:lot|prestation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
             # Patterns avec numéro de lot et fin de ligne stricte
-            r'(?:lot|prestation)[\s\w]*(?:n°|no|numéro|numero)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-            r'(?:n°|no|numéro|numero)[\s\w]*(?:lot|prestation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)'
+            r'(?:lot|prestation)[\s\w]*(?:n°|no|numéro|numero)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:n°|no|numéro|numero)[\s\w]*(?:lot|prestation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)'
         ]
         
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                intitule = matches[0].strip()
+            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            if match:
+                intitule = (match.group(1) if match.re.groups else match.group(0)).strip()
                 # Valider que c'est un intitulé valide
                 if self._is_valid_intitule(intitule):
                     return intitule
@@ -1685,19 +1920,18 @@ class ExtractionImprover:
         # Si aucun pattern spécifique ne fonctionne, essayer les patterns génériques
         # mais privilégier ceux qui contiennent "lot" ou "prestation"
         generic_patterns = [
-            r'(?:intitulé|intitule|titre|objet)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)',
-            r'(?:lot|prestation)[\s\w]*[:]\s*([^.\n]{10,100})(?:\n|$)'
+            r'(?:intitulé|intitule|titre|objet)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)',
+            r'(?:lot|prestation)[\s\w]*+[:]\s*([^.\n]{10,100})(?:\n|$)'
         ]
         
         for pattern in generic_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                for match in matches:
-                    intitule = match.strip()
-                    # Privilégier les intitulés qui contiennent "lot" ou "prestation"
-                    if 'lot' in intitule.lower() or 'prestation' in intitule.lower():
-                        if self._is_valid_intitule(intitule):
-                            return intitule
+            # Parcours paresseux : arrêt au premier intitulé retenu
+            for match in re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE):
+                intitule = match.group(1).strip()
+                # Privilégier les intitulés qui contiennent "lot" ou "prestation"
+                if 'lot' in intitule.lower() or 'prestation' in intitule.lower():
+                    if self._is_valid_intitule(intitule):
+                        return intitule
         
         return None
     
@@ -2000,15 +2234,10 @@ class ExtractionImprover:
                 return None
             
             # Nettoyer la chaîne
-            montant_clean = str(montant_str).replace('€', '').replace(',', '.').replace(' ', '').strip()
+            montant_clean = str(montant_str).translate(_MONTANT_CLEAN).strip()
             
             # Gérer les unités
-            if 'k' in montant_clean.lower():
-                return float(montant_clean.lower().replace('k', '')) * 1000
-            elif 'm' in montant_clean.lower():
-                return float(montant_clean.lower().replace('m', '')) * 1000000
-            else:
-                return float(montant_clean)
+            return _montant_avec_unite(montant_clean)
         except:
             return None
     
@@ -2243,5 +2472,18 @@ class ExtractionImprover:
         
         return pattern_validation
 
-# Instance globale
-extraction_improver = ExtractionImprover()
+# Instance globale, créée à la demande (évite le coût d'initialisation à l'import)
+_extraction_improver: Optional[ExtractionImprover] = None
+
+def get_extraction_improver() -> ExtractionImprover:
+    """Retourne l'instance globale d'ExtractionImprover, créée au premier appel"""
+    global _extraction_improver
+    if _extraction_improver is None:
+        _extraction_improver = ExtractionImprover()
+    return _extraction_improver
+
+def __getattr__(name: str) -> Any:
+    """Compatibilité : `from extraction_improver import extraction_improver` reste valide"""
+    if name == 'extraction_improver':
+        return get_extraction_improver()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,11 +16,330 @@ import asyncio
 from datetime import datetime
 import unicodedata
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Alternations de mots-clés factorisées par préfixe commun (trie) : moins de
+# branches à essayer à chaque position que la liste littérale équivalente
+_RECONDUCTION_OUI_RE = re.compile(r'\b(?:oui|possible|autorisée?|pr[ée]vue)\b')
+# "non autorisé", "non prévue"... sont déjà couverts par \bnon\b
+_RECONDUCTION_NON_RE = re.compile(r'\b(?:non|impossible|sans\s+re(?:conduction|nouvellement))\b')
+_RECONDUCTION_MENTION_RE = re.compile(r'\b(?:reconducti(?:on|ble)|renouvellement)\b')
+
+# Normalisation des montants
+_MONTANT_NON_NUMERIC_RE = re.compile(r'[^\d,.\s]')
+_MONTANT_THOUSANDS_RE = re.compile(r'\bk€?\b|\bkeuros?\b|\bk\s*€', re.IGNORECASE)
+_MONTANT_MILLIONS_RE = re.compile(r'\bm€?\b|\bmillions?\b|\bm\s*€', re.IGNORECASE)
+
+# Espaces multiples (nettoyage général) et blancs extrêmes (normalisation OCR)
+_WHITESPACE_RE = re.compile(r'\s+')
+_WIDE_WHITESPACE_RE = re.compile(r'\s{3,}')
+# Remplacements OCR courants (version conservatrice)
+# REMARQUE: Éviter les règles qui peuvent casser la détection des lots
+_OCR_REPLACEMENTS = tuple((re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in (
+    # Erreurs de reconnaissance de caractères (seulement cas sûrs)
+    # NOTE: Pas de remplacement 'l'→'I' ni '0'→'O' car cela casse "lot" et numéros de lots
+    
+    # Espaces et ponctuation mal placés (conservateur)
+    (r'\s+,', ','),  # Espace avant virgule
+    (r'\s+\.', '.'),  # Espace avant point (seulement si suivi d'un espace)
+    (r'\s+:', ':'),  # Espace avant deux-points
+    # NOTE: Pas de remplacement automatique virgule/point sans espace car peut casser des formats
+    
+    # Corrections spécifiques aux appels d'offres (conservateur)
+    (r'\bd\'offre\b', "d'offre"),  # Correction apostrophe
+    # NOTE: Pas de corrections d'accents automatiques car peuvent casser des patterns
+    
+    # Correction des espaces multiples (conservateur)
+    # NOTE: Pas de suppression des espaces dans les nombres (ex: "10 000") 
+    # car cela peut casser des patterns de lots comme "Lot 1 234"
+))
+
 class BaseExtractor(ABC):
     """Classe de base abstraite pour tous les extracteurs"""
     
+    # Univers conformes à la BDD veille concurrentielle - avec scores de priorité
+    # L'ordre est important : vérifier du plus spécifique au moins spécifique
+    UNIVERSE_KEYWORDS = {
+        'Médical': [
+            'medical', 'sante', 'soins', 'hopital', 'hospitalier', 'clinique', 'biomedical',
+            'pharmacie', 'pharmaceutique', 'laboratoire', 'imagerie', 'radiologie', 'bloc', 
+            'sterilisation', 'medecine', 'therapeutique', 'diagnostic', 'chirurgie', 'anesthesie'
+        ],
+        'Informatique': [
+            'informatique', 'it', 'si', 'systeme information', 'logiciel', 'software',
+            'application', 'applicatif', 'numerique', 'digital', 'reseau', 'cybersecurite',
+            'securite informatique', 'cloud', 'data', 'donnees', 'serveur', 'poste', 
+            'licence', 'erpg', 'pgi', 'erp', 'saas', 'ia', 'intelligence artificielle',
+            'base de donnees', 'reseau', 'telecommunication'
+        ],
+        'Equipement': [
+            'equipement', 'materiel', 'appareil', 'machine', 'outillage', 'dispositif', 
+            'instrument', 'equipements', 'materiaux', 'outils', 'borne', 'terminal',
+            'appareillage', 'installation technique'
+        ],
+        'Consommable': [
+            'consommable', 'consommables', 'fourniture', 'fournitures', 'jetable', 
+            'reactif', 'reactifs', 'cartouche', 'cartouches', 'toner', 'papier', 'encre', 
+            'masque', 'gants', 'seringue', 'bandelette', 'reactif diagnostic'
+        ],
+        'Mobilier': [
+            'mobilier', 'meuble', 'meubles', 'ameublement', 'fauteuil', 'chaise', 
+            'bureau', 'armoire', 'table', 'rangement', 'banque accueil', 'siege', 
+            'etagere', 'etagere', 'lit medical', 'brancard'
+        ],
+        'Vehicules': [
+            'vehicule', 'vehicules', 'voiture', 'automobile', 'camion', 'utilitaire', 
+            'bus', 'car', 'minibus', 'ambulance', 'fourgon', 'berline', 
+            'vehicule electrique', 'vehicule hybride', 'engin', 'transport'
+        ],
+        'Service': [
+            'service', 'prestations', 'prestation', 'maintenance', 'nettoyage', 
+            'securite', 'gardiennage', 'restauration', 'hebergement', 'formation', 
+            'assistance', 'support', 'infogerance', 'transport personnes', 'conseil',
+            'prestation intellectuelle'
+        ]
+    }
+    
+    # Patterns de détection des groupements (compilés une fois, texte en minuscules)
+    GROUPEMENT_PATTERNS = {
+        'RESAH': [
+            re.compile(r'\bresah\b'),
+            re.compile(r'reseau.*sante.*hospitalier'),
+            re.compile(r'reseau.*sante')
+        ],
+        'UGAP': [
+            re.compile(r'\bugap\b'),
+            re.compile(r'union.*groupement.*achat.*public'),
+            re.compile(r'union.*groupement')
+        ],
+        'UNIHA': [
+            re.compile(r'\buniha\b'),
+            re.compile(r'union.*hospitaliere.*achat'),
+            re.compile(r'union.*hospitaliere')
+        ],
+        'CAIH': [
+            re.compile(r'\bcaih\b'),
+            re.compile(r'centre.*achat.*inter.*hospitalier')
+        ]
+    }
+    
+    # Mapping segment -> mots-clés avec poids, par univers
+    SEGMENT_KEYWORDS = {
+        'Médical': {
+            'Hospitalier': {
+                'words': ['hospitalier', 'hopital', 'chru', 'chu', 'ch', 'centre hospitalier', 
+                         'etablissement hospitalier', 'gh', 'ghp', 'ghps', 'clinique', 
+                         'centre de soins', 'bloc operatoire'],
+                'weight': 1.0
+            },
+            'Santé publique': {
+                'words': ['sante publique', 'santé publique', 'ars', 'collectivite', 
+                         'commune', 'mairie', 'departement', 'region', 'cnrs', 
+                         'etablissement public', 'service public'],
+                'weight': 1.0
+            },
+            'Santé privée': {
+                'words': ['prive', 'privé', 'sante privee', 'santé privée', 'cabinet', 
+                         'praticien', 'medecin prive'],
+                'weight': 1.0
+            },
+            'EHPAD': {
+                'words': ['ehpad', 'maison retraite', 'residence', 'personnes agees', 
+                         'personnes âgées', 'geriatrie', 'gériatrie'],
+                'weight': 1.0
+            }
+        },
+        'Informatique': {
+            'Logiciels': {
+                'words': ['logiciel', 'application', 'software', 'app', 'programme', 
+                         'erp', 'pgi', 'si', 'systeme information', 'licence'],
+                'weight': 1.0
+            },
+            'Infrastructure': {
+                'words': ['infrastructure', 'serveur', 'reseau', 'réseau', 'cloud', 
+                         'virtualisation', 'saas', 'iaas', 'paas', 'datacenter'],
+                'weight': 1.0
+            },
+            'Sécurité informatique': {
+                'words': ['securite', 'sécurité', 'cybersecurite', 'cybersécurité', 
+                         'firewall', 'antivirus', 'protection', 'securisation'],
+                'weight': 1.0
+            },
+            'Télécommunications': {
+                'words': ['telecommunication', 'télécommunication', 'telephonie', 
+                         'téléphonie', 'voip', 'fibre', 'reseaux telecom'],
+                'weight': 1.0
+            }
+        },
+        'Equipement': {
+            'Equipements techniques': {
+                'words': ['equipement technique', 'materiel technique', 'appareil technique', 
+                         'outillage', 'machine', 'installation'],
+                'weight': 1.0
+            },
+            'Matériels': {
+                'words': ['materiel', 'matériel', 'equipement', 'équipement', 'appareil'],
+                'weight': 0.8
+            },
+            'Dispositifs médicaux': {
+                'words': ['dispositif medical', 'dispositif médical', 'biomedical', 
+                         'biomédical', 'appareil medical'],
+                'weight': 1.0
+            }
+        },
+        'Service': {
+            'Services': {
+                'words': ['service', 'prestation', 'prestations', 'prestation de service'],
+                'weight': 0.5
+            },
+            'Prestations': {
+                'words': ['prestation', 'prestations', 'conseil', 'assistance', 'support'],
+                'weight': 1.0
+            },
+            'Maintenance': {
+                'words': ['maintenance', 'entretien', 'sav', 'reparation', 'réparation', 
+                         'intervention', 'depannage', 'dépannage'],
+                'weight': 1.0
+            },
+            'Formation': {
+                'words': ['formation', 'apprentissage', 'enseignement', 'pedagogie', 
+                         'pédagogie', 'cours', 'stage'],
+                'weight': 1.0
+            }
+        }
+    }
+    
+    # Mapping famille -> mots-clés avec poids, par univers
+    FAMILLE_KEYWORDS = {
+        'Médical': {
+            'Stérilisation': {
+                'words': ['sterilisation', 'stérilisation', 'desinfection', 'autoclave', 
+                         'sterilisation centralisee', 'stérilisation centralisée', 'scs', 
+                         'laveur desinfecteur', 'laveur désinfecteur'],
+                'weight': 1.0
+            },
+            'Consommables médicaux': {
+                'words': ['consommable', 'jetable', 'reactif', 'réactif', 'bandelette', 
+                         'seringue', 'gant', 'masque', 'cathéter', 'sonde', 'compresse', 
+                         'gaze', 'champ operatoire', 'champ opératoire'],
+                'weight': 1.0
+            },
+            'Imagerie médicale': {
+                'words': ['imagerie', 'radiologie', 'scanner', 'irm', 'echographie', 
+                         'échographie', 'mammographie', 'tomodensitometrie', 
+                         'tomodensitométrie', 'imagerie medicale', 'imagerie médicale'],
+                'weight': 1.0
+            },
+            'Biologie médicale': {
+                'words': ['laboratoire', 'analyse', 'diagnostic', 'biologie', 'hematologie', 
+                         'hématologie', 'microbiologie', 'biochimie', 'serologie', 
+                         'sérologie', 'biologie medicale'],
+                'weight': 1.0
+            },
+            'Matériel médical': {
+                'words': ['materiel medical', 'matériel médical', 'equipement medical', 
+                         'équipement médical', 'appareil medical', 'dispositif medical'],
+                'weight': 0.8
+            },
+            'Bloc opératoire': {
+                'words': ['bloc operatoire', 'bloc opératoire', 'salle operation', 
+                         'salle opération', 'anesthesie', 'anesthésie', 'moniteur', 
+                         'table operation'],
+                'weight': 1.0
+            },
+            'Réanimation': {
+                'words': ['reanimation', 'réanimation', 'soins intensifs', 'si', 'rea', 
+                         'ventilateur', 'respirateur'],
+                'weight': 1.0
+            }
+        },
+        'Informatique': {
+            'Logiciels ERP/PGI': {
+                'words': ['erp', 'pgi', 'logiciel gestion', 'logiciel erp', 'progiciel', 
+                         'systeme gestion', 'système gestion', 'erp medical', 'erp hopital'],
+                'weight': 1.0
+            },
+            'Logiciels': {
+                'words': ['logiciel', 'software', 'application', 'app', 'licence', 
+                         'programme', 'outil informatique'],
+                'weight': 0.8
+            },
+            'Solutions Cloud': {
+                'words': ['cloud', 'saas', 'iaas', 'paas', 'azure', 'aws', 'gcp', 
+                         'hebergement cloud', 'hébergement cloud', 'infrastructure cloud'],
+                'weight': 1.0
+            },
+            'Cybersécurité': {
+                'words': ['securite', 'sécurité', 'cybersecurite', 'cybersécurité', 
+                         'firewall', 'antivirus', 'protection', 'securisation', 
+                         'intrusion detection', 'intrusion détection'],
+                'weight': 1.0
+            },
+            'Téléphonie': {
+                'words': ['telephonie', 'téléphonie', 'voip', 'pabx', 'ipbx', 
+                         'telecommunication', 'télécommunication'],
+                'weight': 1.0
+            },
+            'Infrastructure réseau': {
+                'words': ['reseau', 'réseau', 'switch', 'routeur', 'wifi', 'wlan', 
+                         'ethernet', 'infrastructure reseau'],
+                'weight': 1.0
+            }
+        },
+        'Equipement': {
+            'Équipements médicaux': {
+                'words': ['medical', 'médical', 'biomedical', 'biomédical', 
+                         'appareil medical', 'dispositif medical', 'equipement medical'],
+                'weight': 1.0
+            },
+            'Équipements techniques': {
+                'words': ['technique', 'industriel', 'outillage', 'machine', 'equipement technique', 
+                         'materiel technique', 'installation technique'],
+                'weight': 1.0
+            },
+            'Matériel et équipements': {
+                'words': ['materiel', 'matériel', 'equipement', 'équipement', 'appareil'],
+                'weight': 0.5
+            }
+        },
+        'Service': {
+            'Maintenance': {
+                'words': ['maintenance', 'entretien', 'sav', 'reparation', 'réparation', 
+                         'intervention', 'depannage', 'dépannage', 'maintenance preventive', 
+                         'maintenance préventive'],
+                'weight': 1.0
+            },
+            'Formation': {
+                'words': ['formation', 'apprentissage', 'enseignement', 'pedagogie', 
+                         'pédagogie', 'cours', 'stage', 'training', 'formation continue'],
+                'weight': 1.0
+            },
+            'Services de nettoyage': {
+                'words': ['nettoyage', 'hygiene', 'hygiène', 'proprete', 'propreté', 
+                         'nettoyage hospitalier', 'nettoyage industriel', 'prestations nettoyage'],
+                'weight': 1.0
+            },
+            'Conseil': {
+                'words': ['conseil', 'consulting', 'assistance technique', 'accompagnement', 
+                         'expertise', 'audit', 'conseil strategique'],
+                'weight': 1.0
+            },
+            'Services': {
+                'words': ['service', 'prestation', 'prestations'],
+                'weight': 0.3
+            }
+        }
+    }
+    
+    # Automate Aho-Corasick des mots-clés d'univers (construit une seule fois)
+    _universe_automaton = None
+    
     def __init__(self, pattern_manager=None, validation_engine=None):
         """
         Initialise l'extracteur de base
@@ -64,14 +383,20 @@ class BaseExtractor(ABC):
             logger.error(f"Erreur compilation pattern '{pattern}': {e}")
             return re.compile(r'.*')  # Pattern par défaut
     
-    def extract_with_patterns(self, text: str, patterns: List[str], field_name: str = None) -> List[str]:
+    def extract_with_patterns(self, text: str, patterns: List[str], field_name: str = None,
+                              max_values: Optional[int] = None) -> List[str]:
         """
         Extrait des valeurs avec plusieurs patterns
         
+        Les patterns sont essayés dans l'ordre (des plus spécifiques aux plus
+        génériques) : avec max_values, les suivants ne sont lancés que tant que
+        les précédents n'ont pas fourni assez de valeurs.
+        
         Args:
             text: Texte à analyser
             patterns: Liste des patterns à essayer
             field_name: Nom du champ (pour le logging)
+            max_values: Nombre de valeurs au-delà duquel arrêter l'extraction (toutes par défaut)
             
         Returns:
             Liste des valeurs extraites
@@ -85,28 +410,36 @@ class BaseExtractor(ABC):
                     compiled_pattern = self.pattern_manager.compile_pattern(pattern)
                 else:
                     compiled_pattern = self.compile_pattern(pattern)
-                matches = compiled_pattern.findall(text)
                 
-                if matches:
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            # Si c'est un tuple, prendre le premier élément non vide
-                            value = next((m for m in match if m and str(m).strip()), '')
-                        else:
-                            value = match
-                        
-                        if value and str(value).strip():
-                            extracted_values.append(str(value).strip())
-                            # Pour les dates et durées, prendre seulement la première valeur valide
-                            if field_name and field_name in ['date_limite', 'date_attribution', 'duree_marche', 'fin_sans_reconduction', 'fin_avec_reconduction']:
-                                break  # Prendre seulement la première date trouvée
+                # finditer plutôt que findall : pas de liste intermédiaire, et arrêt
+                # effectif au premier match pour les champs à valeur unique
+                for match in compiled_pattern.finditer(text):
+                    groups = match.groups()
+                    if len(groups) > 1:
+                        # Plusieurs groupes : prendre le premier élément non vide
+                        value = next((m for m in groups if m and str(m).strip()), '')
+                    elif groups:
+                        value = groups[0]
+                    else:
+                        value = match.group(0)
+                    
+                    if value and str(value).strip():
+                        extracted_values.append(str(value).strip())
+                        if max_values is not None and len(extracted_values) >= max_values:
+                            break
+                        # Pour les dates et durées, prendre seulement la première valeur valide
+                        if field_name and field_name in ['date_limite', 'date_attribution', 'duree_marche', 'fin_sans_reconduction', 'fin_avec_reconduction']:
+                            break  # Prendre seulement la première date trouvée
                             
             except Exception as e:
                 logger.warning(f"Erreur pattern '{pattern}' pour {field_name}: {e}")
                 continue
+            
+            if max_values is not None and len(extracted_values) >= max_values:
+                break
         
         if field_name and extracted_values:
-            logger.debug(f"Extraction {field_name}: {len(extracted_values)} valeurs trouvées")
+            logger.debug("Extraction %s: %s valeurs trouvées", field_name, len(extracted_values))
         
         return extracted_values
     
@@ -114,6 +447,9 @@ class BaseExtractor(ABC):
         """
         Extraction parallèle de plusieurs groupes de patterns
         
+        Délègue à extract_parallel_sync (une seule implémentation) exécutée dans un
+        thread, pour ne pas bloquer la boucle d'événements pendant l'extraction.
+        
         Args:
             text: Texte à analyser
             pattern_groups: Dictionnaire {champ: [patterns]}
@@ -121,24 +457,7 @@ class BaseExtractor(ABC):
         Returns:
             Dictionnaire {champ: [valeurs]}
         """
-        results = {}
-        
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Créer les tâches
-            tasks = {
-                field: executor.submit(self.extract_with_patterns, text, patterns, field)
-                for field, patterns in pattern_groups.items()
-            }
-            
-            # Attendre les résultats
-            for field, task in tasks.items():
-                try:
-                    results[field] = task.result(timeout=30)
-                except Exception as e:
-                    logger.error(f"Erreur extraction parallèle {field}: {e}")
-                    results[field] = []
-        
-        return results
+        return await asyncio.to_thread(self.extract_parallel_sync, text, pattern_groups)
     
     def extract_parallel_sync(self, text: str, pattern_groups: Dict[str, List[str]]) -> Dict[str, List[str]]:
         """
@@ -238,17 +557,17 @@ class BaseExtractor(ABC):
             cleaned_lower = cleaned.lower().strip()
             
             # Détecter "oui" ou variantes positives
-            if re.search(r'\b(oui|possible|autorisée|autorisé|prévue|prevue|autorisée)\b', cleaned_lower):
+            if _RECONDUCTION_OUI_RE.search(cleaned_lower):
                 return 'Oui'
             
             # Détecter "non" ou variantes négatives
-            if re.search(r'\b(non|impossible|non\s+autorisée|non\s+autorisé|non\s+prévue|non\s+prevue|sans\s+reconduction|sans\s+renouvellement)\b', cleaned_lower):
+            if _RECONDUCTION_NON_RE.search(cleaned_lower):
                 return 'Non'
             
             # Si aucun pattern n'a matché mais qu'il y a du texte, retourner "Non spécifié"
             if cleaned and len(cleaned.strip()) > 0:
                 # Si le pattern a détecté quelque chose (mention de reconduction), mais pas clairement oui/non
-                if re.search(r'\b(reconduction|reconductible|renouvellement)\b', cleaned_lower):
+                if _RECONDUCTION_MENTION_RE.search(cleaned_lower):
                     return 'Non spécifié'
             
             # Sinon, valeur vide
@@ -256,7 +575,7 @@ class BaseExtractor(ABC):
             
         else:
             # Nettoyage général
-            cleaned = re.sub(r'\s+', ' ', cleaned)  # Espaces multiples
+            cleaned = _WHITESPACE_RE.sub(' ', cleaned)  # Espaces multiples
             return cleaned
     
     def _normalize_ocr_errors(self, text: str) -> str:
@@ -273,35 +592,15 @@ class BaseExtractor(ABC):
         if not text:
             return text
         
-        # Dictionnaire des remplacements OCR courants (version conservatrice)
-        # REMARQUE: Éviter les règles qui peuvent casser la détection des lots
-        ocr_replacements = [
-            # Erreurs de reconnaissance de caractères (seulement cas sûrs)
-            # NOTE: Pas de remplacement 'l'→'I' ni '0'→'O' car cela casse "lot" et numéros de lots
-            
-            # Espaces et ponctuation mal placés (conservateur)
-            (r'\s+,', ','),  # Espace avant virgule
-            (r'\s+\.', '.'),  # Espace avant point (seulement si suivi d'un espace)
-            (r'\s+:', ':'),  # Espace avant deux-points
-            # NOTE: Pas de remplacement automatique virgule/point sans espace car peut casser des formats
-            
-            # Corrections spécifiques aux appels d'offres (conservateur)
-            (r'\bd\'offre\b', "d'offre"),  # Correction apostrophe
-            # NOTE: Pas de corrections d'accents automatiques car peuvent casser des patterns
-            
-            # Correction des espaces multiples (conservateur)
-            # NOTE: Pas de suppression des espaces dans les nombres (ex: "10 000") 
-            # car cela peut casser des patterns de lots comme "Lot 1 234"
-        ]
-        
+        # Remplacements OCR courants, compilés une fois (voir _OCR_REPLACEMENTS)
         normalized = text
-        for pattern, replacement in ocr_replacements:
-            normalized = re.sub(pattern, replacement, normalized, flags=re.IGNORECASE)
+        for pattern, replacement in _OCR_REPLACEMENTS:
+            normalized = pattern.sub(replacement, normalized)
         
         # Normalisation finale : seulement les espaces multiples EXTREMES (très conservateur)
         # Ne normaliser que les espaces multiples de 3+ espaces consécutifs
         # pour éviter de casser les formats avec double espaces légitimes
-        normalized = re.sub(r'\s{3,}', ' ', normalized)  # Seulement 3+ espaces consécutifs
+        normalized = _WIDE_WHITESPACE_RE.sub(' ', normalized)  # Seulement 3+ espaces consécutifs
         
         return normalized
     
@@ -319,22 +618,23 @@ class BaseExtractor(ABC):
             # Convertir en string si nécessaire
             cleaned = str(value).strip()
             
-            # Détecter et extraire le multiplicateur
             multiplier = 1
-            if re.search(r'\bk€?\b|\bkeuros?\b|\bk\s*€', cleaned, re.IGNORECASE):
-                multiplier = 1000
-                # Retirer les indicateurs de milliers
-                cleaned = re.sub(r'\bk€?\b|\bkeuros?\b|\bk\s*€', '', cleaned, flags=re.IGNORECASE)
-            elif re.search(r'\bm€?\b|\bmillions?\b|\bm\s*€', cleaned, re.IGNORECASE):
-                multiplier = 1000000
-                # Retirer les indicateurs de millions
-                cleaned = re.sub(r'\bm€?\b|\bmillions?\b|\bm\s*€', '', cleaned, flags=re.IGNORECASE)
-            
-            # Supprimer les caractères non numériques sauf point, virgule et espace
-            cleaned = re.sub(r'[^\d,.\s]', '', cleaned)
-            
-            # Retirer le symbole euro et ses variantes
-            cleaned = cleaned.replace('€', '').replace('euros', '').replace('euro', '').replace('EUR', '')
+            # Chemin rapide : la valeur capturée par les patterns est le plus souvent
+            # déjà purement numérique, sans unité ni symbole à retirer
+            if _MONTANT_NON_NUMERIC_RE.search(cleaned):
+                # Détecter et retirer les indicateurs de milliers, sinon de millions
+                # (subn : détection et suppression en une seule passe)
+                cleaned, count = _MONTANT_THOUSANDS_RE.subn('', cleaned)
+                if count:
+                    multiplier = 1000
+                else:
+                    cleaned, count = _MONTANT_MILLIONS_RE.subn('', cleaned)
+                    if count:
+                        multiplier = 1000000
+                
+                # Supprimer les caractères non numériques sauf point, virgule et espace
+                # (symbole euro et ses variantes compris)
+                cleaned = _MONTANT_NON_NUMERIC_RE.sub('', cleaned)
             
             # Normaliser le séparateur décimal
             # Si on a une virgule comme séparateur (format français)
@@ -613,53 +913,13 @@ class BaseExtractor(ABC):
         
         text_norm = normalize(text_combined)
         
-        # Univers conformes à la BDD veille concurrentielle - avec scores de priorité
-        # L'ordre est important : vérifier du plus spécifique au moins spécifique
-        universe_keywords = {
-            'Médical': [
-                'medical', 'sante', 'soins', 'hopital', 'hospitalier', 'clinique', 'biomedical',
-                'pharmacie', 'pharmaceutique', 'laboratoire', 'imagerie', 'radiologie', 'bloc', 
-                'sterilisation', 'medecine', 'therapeutique', 'diagnostic', 'chirurgie', 'anesthesie'
-            ],
-            'Informatique': [
-                'informatique', 'it', 'si', 'systeme information', 'logiciel', 'software',
-                'application', 'applicatif', 'numerique', 'digital', 'reseau', 'cybersecurite',
-                'securite informatique', 'cloud', 'data', 'donnees', 'serveur', 'poste', 
-                'licence', 'erpg', 'pgi', 'erp', 'saas', 'ia', 'intelligence artificielle',
-                'base de donnees', 'reseau', 'telecommunication'
-            ],
-            'Equipement': [
-                'equipement', 'materiel', 'appareil', 'machine', 'outillage', 'dispositif', 
-                'instrument', 'equipements', 'materiaux', 'outils', 'borne', 'terminal',
-                'appareillage', 'installation technique'
-            ],
-            'Consommable': [
-                'consommable', 'consommables', 'fourniture', 'fournitures', 'jetable', 
-                'reactif', 'reactifs', 'cartouche', 'cartouches', 'toner', 'papier', 'encre', 
-                'masque', 'gants', 'seringue', 'bandelette', 'reactif diagnostic'
-            ],
-            'Mobilier': [
-                'mobilier', 'meuble', 'meubles', 'ameublement', 'fauteuil', 'chaise', 
-                'bureau', 'armoire', 'table', 'rangement', 'banque accueil', 'siege', 
-                'etagere', 'etagere', 'lit medical', 'brancard'
-            ],
-            'Vehicules': [
-                'vehicule', 'vehicules', 'voiture', 'automobile', 'camion', 'utilitaire', 
-                'bus', 'car', 'minibus', 'ambulance', 'fourgon', 'berline', 
-                'vehicule electrique', 'vehicule hybride', 'engin', 'transport'
-            ],
-            'Service': [
-                'service', 'prestations', 'prestation', 'maintenance', 'nettoyage', 
-                'securite', 'gardiennage', 'restauration', 'hebergement', 'formation', 
-                'assistance', 'support', 'infogerance', 'transport personnes', 'conseil',
-                'prestation intellectuelle'
-            ]
-        }
+        # Repérer tous les mots-clés présents en une seule passe sur le texte
+        found_keywords = self._find_universe_keywords(text_norm)
         
         # Compter les occurrences pour chaque univers
         universe_scores = {}
-        for universe, words in universe_keywords.items():
-            score = sum(1 for word in words if word in text_norm)
+        for universe, words in self.UNIVERSE_KEYWORDS.items():
+            score = sum(1 for word in words if word in found_keywords)
             if score > 0:
                 universe_scores[universe] = score
         
@@ -681,6 +941,34 @@ class BaseExtractor(ABC):
         # Par défaut, classer en Service (pas de catégorie "Général" dans la BDD)
         return 'Service'
     
+    @classmethod
+    def _get_universe_automaton(cls):
+        """Construit (une fois) l'automate Aho-Corasick des mots-clés d'univers"""
+        if cls._universe_automaton is None:
+            automaton = ahocorasick.Automaton()
+            for words in cls.UNIVERSE_KEYWORDS.values():
+                for word in words:
+                    automaton.add_word(word, word)
+            automaton.make_automaton()
+            cls._universe_automaton = automaton
+        return cls._universe_automaton
+    
+    def _find_universe_keywords(self, text_norm: str) -> set:
+        """
+        Retourne l'ensemble des mots-clés d'univers présents dans le texte
+        
+        Avec pyahocorasick, un seul parcours du texte suffit quel que soit le
+        nombre de mots-clés ; sinon, recherche de sous-chaîne par mot-clé.
+        """
+        if AHOCORASICK_AVAILABLE:
+            return {word for _, word in self._get_universe_automaton().iter(text_norm)}
+        return {
+            word
+            for words in self.UNIVERSE_KEYWORDS.values()
+            for word in words
+            if word in text_norm
+        }
+    
     def _detect_groupement(self, data: Dict[str, Any]) -> str:
         """Détecte le groupement de manière améliorée basé sur les données"""
         # Prioriser certains champs pour la détection
@@ -697,37 +985,14 @@ class BaseExtractor(ABC):
             # Si pas de texte dans les champs prioritaires, chercher partout
             text = ' '.join(str(v) for v in data.values() if v).lower()
         
-        # Normalisation
+        # Normalisation (le texte est déjà en minuscules)
         text = unicodedata.normalize('NFD', text)
-        text = ''.join(ch for ch in text if unicodedata.category(ch) != 'Mn').lower()
-        
-        # Patterns de détection améliorés avec variations
-        groupement_patterns = {
-            'RESAH': [
-                r'\bresah\b',
-                r'reseau.*sante.*hospitalier',
-                r'reseau.*sante'
-            ],
-            'UGAP': [
-                r'\bugap\b',
-                r'union.*groupement.*achat.*public',
-                r'union.*groupement'
-            ],
-            'UNIHA': [
-                r'\buniha\b',
-                r'union.*hospitaliere.*achat',
-                r'union.*hospitaliere'
-            ],
-            'CAIH': [
-                r'\bcaih\b',
-                r'centre.*achat.*inter.*hospitalier'
-            ]
-        }
+        text = ''.join(ch for ch in text if unicodedata.category(ch) != 'Mn')
         
         # Rechercher dans l'ordre de priorité
-        for groupement, patterns in groupement_patterns.items():
+        for groupement, patterns in self.GROUPEMENT_PATTERNS.items():
             for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
+                if pattern.search(text):
                     return groupement
         
         return 'AUTRE'
@@ -773,95 +1038,9 @@ class BaseExtractor(ABC):
             segment_scores = {}
             
             if univers:
-                # Mapping segment -> mots-clés avec poids
-                segment_keywords = {
-                    'Médical': {
-                        'Hospitalier': {
-                            'words': ['hospitalier', 'hopital', 'chru', 'chu', 'ch', 'centre hospitalier', 
-                                     'etablissement hospitalier', 'gh', 'ghp', 'ghps', 'clinique', 
-                                     'centre de soins', 'bloc operatoire'],
-                            'weight': 1.0
-                        },
-                        'Santé publique': {
-                            'words': ['sante publique', 'santé publique', 'ars', 'collectivite', 
-                                     'commune', 'mairie', 'departement', 'region', 'cnrs', 
-                                     'etablissement public', 'service public'],
-                            'weight': 1.0
-                        },
-                        'Santé privée': {
-                            'words': ['prive', 'privé', 'sante privee', 'santé privée', 'cabinet', 
-                                     'praticien', 'medecin prive'],
-                            'weight': 1.0
-                        },
-                        'EHPAD': {
-                            'words': ['ehpad', 'maison retraite', 'residence', 'personnes agees', 
-                                     'personnes âgées', 'geriatrie', 'gériatrie'],
-                            'weight': 1.0
-                        }
-                    },
-                    'Informatique': {
-                        'Logiciels': {
-                            'words': ['logiciel', 'application', 'software', 'app', 'programme', 
-                                     'erp', 'pgi', 'si', 'systeme information', 'licence'],
-                            'weight': 1.0
-                        },
-                        'Infrastructure': {
-                            'words': ['infrastructure', 'serveur', 'reseau', 'réseau', 'cloud', 
-                                     'virtualisation', 'saas', 'iaas', 'paas', 'datacenter'],
-                            'weight': 1.0
-                        },
-                        'Sécurité informatique': {
-                            'words': ['securite', 'sécurité', 'cybersecurite', 'cybersécurité', 
-                                     'firewall', 'antivirus', 'protection', 'securisation'],
-                            'weight': 1.0
-                        },
-                        'Télécommunications': {
-                            'words': ['telecommunication', 'télécommunication', 'telephonie', 
-                                     'téléphonie', 'voip', 'fibre', 'reseaux telecom'],
-                            'weight': 1.0
-                        }
-                    },
-                    'Equipement': {
-                        'Equipements techniques': {
-                            'words': ['equipement technique', 'materiel technique', 'appareil technique', 
-                                     'outillage', 'machine', 'installation'],
-                            'weight': 1.0
-                        },
-                        'Matériels': {
-                            'words': ['materiel', 'matériel', 'equipement', 'équipement', 'appareil'],
-                            'weight': 0.8
-                        },
-                        'Dispositifs médicaux': {
-                            'words': ['dispositif medical', 'dispositif médical', 'biomedical', 
-                                     'biomédical', 'appareil medical'],
-                            'weight': 1.0
-                        }
-                    },
-                    'Service': {
-                        'Services': {
-                            'words': ['service', 'prestation', 'prestations', 'prestation de service'],
-                            'weight': 0.5
-                        },
-                        'Prestations': {
-                            'words': ['prestation', 'prestations', 'conseil', 'assistance', 'support'],
-                            'weight': 1.0
-                        },
-                        'Maintenance': {
-                            'words': ['maintenance', 'entretien', 'sav', 'reparation', 'réparation', 
-                                     'intervention', 'depannage', 'dépannage'],
-                            'weight': 1.0
-                        },
-                        'Formation': {
-                            'words': ['formation', 'apprentissage', 'enseignement', 'pedagogie', 
-                                     'pédagogie', 'cours', 'stage'],
-                            'weight': 1.0
-                        }
-                    }
-                }
-                
                 # Calculer les scores pour chaque segment possible
-                if univers in segment_keywords:
-                    for segment, config in segment_keywords[univers].items():
+                if univers in self.SEGMENT_KEYWORDS:
+                    for segment, config in self.SEGMENT_KEYWORDS[univers].items():
                         score = 0
                         words = config['words']
                         weight = config.get('weight', 1.0)
@@ -874,7 +1053,7 @@ class BaseExtractor(ABC):
                         
                         if score > 0:
                             segment_scores[segment] = score
-                            logger.debug(f"  📊 Segment '{segment}': score={score:.2f}")
+                            logger.debug("  📊 Segment '%s': score=%.2f", segment, score)
             
             # 3. Inférence basée sur le groupement (bonus)
             groupement = data.get('groupement', '')
@@ -961,131 +1140,9 @@ class BaseExtractor(ABC):
             famille_scores = {}
             
             if univers:
-                # Mapping famille -> mots-clés avec poids
-                famille_keywords = {
-                    'Médical': {
-                        'Stérilisation': {
-                            'words': ['sterilisation', 'stérilisation', 'desinfection', 'autoclave', 
-                                     'sterilisation centralisee', 'stérilisation centralisée', 'scs', 
-                                     'laveur desinfecteur', 'laveur désinfecteur'],
-                            'weight': 1.0
-                        },
-                        'Consommables médicaux': {
-                            'words': ['consommable', 'jetable', 'reactif', 'réactif', 'bandelette', 
-                                     'seringue', 'gant', 'masque', 'cathéter', 'sonde', 'compresse', 
-                                     'gaze', 'champ operatoire', 'champ opératoire'],
-                            'weight': 1.0
-                        },
-                        'Imagerie médicale': {
-                            'words': ['imagerie', 'radiologie', 'scanner', 'irm', 'echographie', 
-                                     'échographie', 'mammographie', 'tomodensitometrie', 
-                                     'tomodensitométrie', 'imagerie medicale', 'imagerie médicale'],
-                            'weight': 1.0
-                        },
-                        'Biologie médicale': {
-                            'words': ['laboratoire', 'analyse', 'diagnostic', 'biologie', 'hematologie', 
-                                     'hématologie', 'microbiologie', 'biochimie', 'serologie', 
-                                     'sérologie', 'biologie medicale'],
-                            'weight': 1.0
-                        },
-                        'Matériel médical': {
-                            'words': ['materiel medical', 'matériel médical', 'equipement medical', 
-                                     'équipement médical', 'appareil medical', 'dispositif medical'],
-                            'weight': 0.8
-                        },
-                        'Bloc opératoire': {
-                            'words': ['bloc operatoire', 'bloc opératoire', 'salle operation', 
-                                     'salle opération', 'anesthesie', 'anesthésie', 'moniteur', 
-                                     'table operation'],
-                            'weight': 1.0
-                        },
-                        'Réanimation': {
-                            'words': ['reanimation', 'réanimation', 'soins intensifs', 'si', 'rea', 
-                                     'ventilateur', 'respirateur'],
-                            'weight': 1.0
-                        }
-                    },
-                    'Informatique': {
-                        'Logiciels ERP/PGI': {
-                            'words': ['erp', 'pgi', 'logiciel gestion', 'logiciel erp', 'progiciel', 
-                                     'systeme gestion', 'système gestion', 'erp medical', 'erp hopital'],
-                            'weight': 1.0
-                        },
-                        'Logiciels': {
-                            'words': ['logiciel', 'software', 'application', 'app', 'licence', 
-                                     'programme', 'outil informatique'],
-                            'weight': 0.8
-                        },
-                        'Solutions Cloud': {
-                            'words': ['cloud', 'saas', 'iaas', 'paas', 'azure', 'aws', 'gcp', 
-                                     'hebergement cloud', 'hébergement cloud', 'infrastructure cloud'],
-                            'weight': 1.0
-                        },
-                        'Cybersécurité': {
-                            'words': ['securite', 'sécurité', 'cybersecurite', 'cybersécurité', 
-                                     'firewall', 'antivirus', 'protection', 'securisation', 
-                                     'intrusion detection', 'intrusion détection'],
-                            'weight': 1.0
-                        },
-                        'Téléphonie': {
-                            'words': ['telephonie', 'téléphonie', 'voip', 'pabx', 'ipbx', 
-                                     'telecommunication', 'télécommunication'],
-                            'weight': 1.0
-                        },
-                        'Infrastructure réseau': {
-                            'words': ['reseau', 'réseau', 'switch', 'routeur', 'wifi', 'wlan', 
-                                     'ethernet', 'infrastructure reseau'],
-                            'weight': 1.0
-                        }
-                    },
-                    'Equipement': {
-                        'Équipements médicaux': {
-                            'words': ['medical', 'médical', 'biomedical', 'biomédical', 
-                                     'appareil medical', 'dispositif medical', 'equipement medical'],
-                            'weight': 1.0
-                        },
-                        'Équipements techniques': {
-                            'words': ['technique', 'industriel', 'outillage', 'machine', 'equipement technique', 
-                                     'materiel technique', 'installation technique'],
-                            'weight': 1.0
-                        },
-                        'Matériel et équipements': {
-                            'words': ['materiel', 'matériel', 'equipement', 'équipement', 'appareil'],
-                            'weight': 0.5
-                        }
-                    },
-                    'Service': {
-                        'Maintenance': {
-                            'words': ['maintenance', 'entretien', 'sav', 'reparation', 'réparation', 
-                                     'intervention', 'depannage', 'dépannage', 'maintenance preventive', 
-                                     'maintenance préventive'],
-                            'weight': 1.0
-                        },
-                        'Formation': {
-                            'words': ['formation', 'apprentissage', 'enseignement', 'pedagogie', 
-                                     'pédagogie', 'cours', 'stage', 'training', 'formation continue'],
-                            'weight': 1.0
-                        },
-                        'Services de nettoyage': {
-                            'words': ['nettoyage', 'hygiene', 'hygiène', 'proprete', 'propreté', 
-                                     'nettoyage hospitalier', 'nettoyage industriel', 'prestations nettoyage'],
-                            'weight': 1.0
-                        },
-                        'Conseil': {
-                            'words': ['conseil', 'consulting', 'assistance technique', 'accompagnement', 
-                                     'expertise', 'audit', 'conseil strategique'],
-                            'weight': 1.0
-                        },
-                        'Services': {
-                            'words': ['service', 'prestation', 'prestations'],
-                            'weight': 0.3
-                        }
-                    }
-                }
-                
                 # Calculer les scores pour chaque famille possible
-                if univers in famille_keywords:
-                    for famille, config in famille_keywords[univers].items():
+                if univers in self.FAMILLE_KEYWORDS:
+                    for famille, config in self.FAMILLE_KEYWORDS[univers].items():
                         score = 0
                         words = config['words']
                         weight = config.get('weight', 1.0)
@@ -1098,7 +1155,7 @@ class BaseExtractor(ABC):
                         
                         if score > 0:
                             famille_scores[famille] = score
-                            logger.debug(f"  📊 Famille '{famille}': score={score:.2f}")
+                            logger.debug("  📊 Famille '%s': score=%.2f", famille, score)
             
             # Retourner la famille avec le score le plus élevé
             if famille_scores:
@@ -140,9 +140,12 @@ class ExcelExtractor(BaseExtractor):
             if lot_columns:
                 logger.info(f"📋 Colonnes de lots détectées: {lot_columns}")
                 
+                # Rôle de chaque colonne déterminé une fois pour tout le tableau
+                column_roles = self._classify_lot_columns(df.columns, lot_columns)
+                
                 # Si on trouve une colonne "lot" ou similaire, traiter chaque ligne comme un lot
-                for idx, row in df.iterrows():
-                    lot_info = self._extract_lot_from_row(row, lot_columns, idx)
+                for idx, row in self._iter_rows(df):
+                    lot_info = self._extract_lot_from_row(row, column_roles, idx)
                     if lot_info:
                         lots.append(lot_info)
                         logger.info(f"📦 Lot Excel détecté: {lot_info.numero} - {lot_info.intitule[:50]}...")
@@ -154,13 +157,89 @@ class ExcelExtractor(BaseExtractor):
         
         return lots
     
-    def _extract_lot_from_row(self, row: pd.Series, lot_columns: List[str], row_index: int) -> Optional[LotInfo]:
+    def _iter_rows(self, df: pd.DataFrame):
         """
-        Extrait les informations d'un lot depuis une ligne Excel
+        Parcourt les lignes du DataFrame sous forme de dictionnaires {colonne: valeur}
+        
+        Les valeurs sont lues dans df.values, comme iterrows, sans construire
+        une Series par ligne. Avec des colonnes en double, iterrows est conservé.
+        """
+        if not df.columns.is_unique:
+            yield from df.iterrows()
+            return
+        columns = list(df.columns)
+        for idx, values in zip(df.index, df.values):
+            yield idx, dict(zip(columns, values))
+    
+    def _classify_lot_columns(self, columns, lot_columns: List[str]) -> Dict[str, List]:
+        """
+        Associe chaque colonne au champ de lot qu'elle alimente
         
         Args:
-            row: Ligne du DataFrame
+            columns: Colonnes du DataFrame (dans l'ordre)
             lot_columns: Colonnes de lots identifiées
+            
+        Returns:
+            Dictionnaire {champ: [colonnes] ou [(colonne, variante)]} dans l'ordre des colonnes
+        """
+        roles = {
+            'numero': [], 'intitule': [], 'montants': [], 'quantites': [],
+            'criteres': [], 'rse': []
+        }
+        
+        for col in lot_columns:
+            col_lower = col.lower()
+            if 'numero' in col_lower or 'numéro' in col_lower or 'no' in col_lower:
+                roles['numero'].append(col)
+            if 'intitule' in col_lower or 'titre' in col_lower or 'objet' in col_lower:
+                roles['intitule'].append(col)
+        
+        for col in columns:
+            col_lower = col.lower()
+            
+            if 'montant' in col_lower or 'budget' in col_lower or 'prix' in col_lower:
+                if 'estime' in col_lower or 'estimation' in col_lower:
+                    kind = 'estime'
+                elif 'max' in col_lower or 'maximum' in col_lower:
+                    kind = 'maximum'
+                else:
+                    kind = 'both'
+                roles['montants'].append((col, kind))
+            
+            if 'quantite' in col_lower or 'quantité' in col_lower or 'qte' in col_lower:
+                if 'minimum' in col_lower or 'min' in col_lower:
+                    kind = 'minimum'
+                elif 'maximum' in col_lower or 'max' in col_lower:
+                    kind = 'maximum'
+                else:
+                    kind = 'estimees'
+                roles['quantites'].append((col, kind))
+            
+            if 'critere' in col_lower or 'critère' in col_lower or 'attribution' in col_lower:
+                if 'economique' in col_lower or 'économique' in col_lower or 'prix' in col_lower or 'cout' in col_lower:
+                    kind = 'economique'
+                elif 'technique' in col_lower:
+                    kind = 'techniques'
+                elif 'autre' in col_lower:
+                    kind = 'autres'
+                else:
+                    kind = 'defaut'
+                roles['criteres'].append((col, kind))
+            
+            if 'rse' in col_lower or 'responsabilite' in col_lower or 'responsabilité' in col_lower or 'social' in col_lower or 'environnement' in col_lower:
+                roles['rse'].append((col, 'rse'))
+            elif 'contribution' in col_lower or 'fournisseur' in col_lower:
+                roles['rse'].append((col, 'contribution'))
+        
+        return roles
+    
+    def _extract_lot_from_row(self, row, column_roles: Dict[str, List], row_index: int) -> Optional[LotInfo]:
+        """
+        Extrait les informations d'un lot depuis une ligne Excel
+        
+        Args:
+            row: Ligne du DataFrame ({colonne: valeur} ou Series)
+            column_roles: Rôles des colonnes (voir _classify_lot_columns)
             row_index: Index de la ligne
             
         Returns:
@@ -174,92 +253,77 @@ class ExcelExtractor(BaseExtractor):
             )
             
             # Extraire le numéro de lot
-            for col in lot_columns:
-                if 'numero' in col.lower() or 'numéro' in col.lower() or 'no' in col.lower():
-                    try:
-                        if pd.notna(row[col]):
-                            lot_info.numero = int(row[col])
-                    except (ValueError, TypeError):
-                        pass
+            for col in column_roles['numero']:
+                try:
+                    if pd.notna(row[col]):
+                        lot_info.numero = int(row[col])
+                except (ValueError, TypeError):
+                    pass
             
             # Extraire l'intitulé du lot
-            for col in lot_columns:
-                if 'intitule' in col.lower() or 'titre' in col.lower() or 'objet' in col.lower():
-                    if pd.notna(row[col]):
-                        lot_info.intitule = str(row[col]).strip()
-                        break
+            for col in column_roles['intitule']:
+                if pd.notna(row[col]):
+                    lot_info.intitule = str(row[col]).strip()
+                    break
             
             # Si pas d'intitulé trouvé, utiliser un intitulé par défaut
             if not lot_info.intitule:
                 lot_info.intitule = f"Lot {lot_info.numero}"
             
             # Extraire les montants
-            for col in row.index:
-                col_lower = col.lower()
-                if 'montant' in col_lower or 'budget' in col_lower or 'prix' in col_lower:
-                    try:
-                        if pd.notna(row[col]):
-                            value = float(row[col]) if isinstance(row[col], (int, float)) else float(str(row[col]).replace(',', '.'))
-                            if 'estime' in col_lower or 'estimation' in col_lower:
-                                lot_info.montant_estime = value
-                            elif 'max' in col_lower or 'maximum' in col_lower:
-                                lot_info.montant_maximum = value
-                            else:
-                                lot_info.montant_estime = value
-                                lot_info.montant_maximum = value
-                    except (ValueError, TypeError):
-                        pass
+            for col, kind in column_roles['montants']:
+                try:
+                    if pd.notna(row[col]):
+                        value = float(row[col]) if isinstance(row[col], (int, float)) else float(str(row[col]).replace(',', '.'))
+                        if kind == 'estime':
+                            lot_info.montant_estime = value
+                        elif kind == 'maximum':
+                            lot_info.montant_maximum = value
+                        else:
+                            lot_info.montant_estime = value
+                            lot_info.montant_maximum = value
+                except (ValueError, TypeError):
+                    pass
             
             # Extraire les quantités
-            for col in row.index:
-                col_lower = col.lower()
-                if 'quantite' in col_lower or 'quantité' in col_lower or 'qte' in col_lower:
-                    try:
-                        if pd.notna(row[col]):
-                            if 'minimum' in col_lower or 'min' in col_lower:
-                                lot_info.quantite_minimum = int(row[col])
-                            elif 'maximum' in col_lower or 'max' in col_lower:
-                                lot_info.quantite_maximum = int(row[col])
-                            elif 'estime' in col_lower or 'estimation' in col_lower:
-                                lot_info.quantites_estimees = str(row[col])
-                            else:
-                                lot_info.quantites_estimees = str(row[col])
-                    except (ValueError, TypeError):
-                        pass
+            for col, kind in column_roles['quantites']:
+                try:
+                    if pd.notna(row[col]):
+                        if kind == 'minimum':
+                            lot_info.quantite_minimum = int(row[col])
+                        elif kind == 'maximum':
+                            lot_info.quantite_maximum = int(row[col])
+                        else:
+                            lot_info.quantites_estimees = str(row[col])
+                except (ValueError, TypeError):
+                    pass
             
             # Extraire les critères d'attribution
-            for col in row.index:
-                col_lower = col.lower()
-                if 'critere' in col_lower or 'critère' in col_lower or 'attribution' in col_lower:
-                    try:
-                        if pd.notna(row[col]):
-                            if 'economique' in col_lower or 'économique' in col_lower or 'prix' in col_lower or 'cout' in col_lower:
+            for col, kind in column_roles['criteres']:
+                try:
+                    if pd.notna(row[col]):
+                        if kind == 'economique':
+                            lot_info.criteres_economique = str(row[col])
+                        elif kind == 'techniques':
+                            lot_info.criteres_techniques = str(row[col])
+                        elif kind == 'autres':
+                            lot_info.autres_criteres = str(row[col])
+                        else:
+                            if not lot_info.criteres_economique:
                                 lot_info.criteres_economique = str(row[col])
-                            elif 'technique' in col_lower:
-                                lot_info.criteres_techniques = str(row[col])
-                            elif 'autre' in col_lower:
-                                lot_info.autres_criteres = str(row[col])
-                            else:
-                                if not lot_info.criteres_economique:
-                                    lot_info.criteres_economique = str(row[col])
-                    except (ValueError, TypeError):
-                        pass
+                except (ValueError, TypeError):
+                    pass
             
             # Extraire RSE et contribution fournisseur
-            for col in row.index:
-                col_lower = col.lower()
-                if 'rse' in col_lower or 'responsabilite' in col_lower or 'responsabilité' in col_lower or 'social' in col_lower or 'environnement' in col_lower:
-                    try:
-                        if pd.notna(row[col]):
+            for col, kind in column_roles['rse']:
+                try:
+                    if pd.notna(row[col]):
+                        if kind == 'rse':
                             lot_info.rse = str(row[col])
-                    except (ValueError, TypeError):
-                        pass
-                elif 'contribution' in col_lower or 'fournisseur' in col_lower:
-                    try:
-                        if pd.notna(row[col]):
+                        else:
                             lot_info.contribution_fournisseur = str(row[col])
-                    except (ValueError, TypeError):
-                        pass
+                except (ValueError, TypeError):
+                    pass
             
             # Nettoyer l'intitulé
             lot_info.intitule = self._clean_title(lot_info.intitule)
@@ -561,8 +625,9 @@ class ExcelExtractor(BaseExtractor):
             text_parts.append(' '.join(df.columns))
             
             # Ajouter les premières lignes (max 50 pour éviter de traiter trop de données)
-            for idx, row in df.head(50).iterrows():
-                row_text = ' '.join(str(val) for val in row.values if pd.notna(val))
+            # Valeurs lues directement dans df.values (mêmes valeurs que iterrows)
+            for row_values in df.head(50).values:
+                row_text = ' '.join(str(val) for val in row_values if pd.notna(val))
                 text_parts.append(row_text)
             
             return ' '.join(text_parts)
@@ -15,7 +15,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    from extraction_improver import extraction_improver
+    from extraction_improver import get_extraction_improver
     EXTRACTION_IMPROVER_AVAILABLE = True
 except ImportError:
     EXTRACTION_IMPROVER_AVAILABLE = False
@@ -43,7 +43,7 @@ class IntelligentPostProcessor:
         
         if self.enable_improver:
             try:
-                self.extraction_improver = extraction_improver
+                self.extraction_improver = get_extraction_improver()
                 logger.info("✅ IntelligentPostProcessor initialisé avec ExtractionImprover")
             except Exception as e:
                 logger.warning(f"⚠️ Impossible d'initialiser ExtractionImprover: {e}")
@@ -8,14 +8,115 @@ utilisant différentes stratégies de détection.
 
 import re
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 
+try:
+    import hyperscan  # Optionnel : pré-filtrage multi-patterns en une seule passe
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Contexte d'un lot : en-tête 'lot n° N' (à défaut 'lot N') puis les lignes qui suivent,
+# jusqu'au lot suivant ou à une ligne vide. Le numéro est capturé plutôt qu'injecté
+# dans le pattern : un seul jeu de patterns, compilé à l'import, sert tous les lots.
+# La fin du contexte est cherchée directement (préfixe littéral '\n') au lieu d'un
+# '(.*?)' paresseux qui testait l'anticipation à chaque caractère.
+_LOT_CONTEXT_PATTERNS = (
+    (re.compile(r'lot\s*n°?\s*(\d+)', re.IGNORECASE),
+     re.compile(r'\n(?:lot\s*n°?\s*\d+|\n)', re.IGNORECASE)),
+    (re.compile(r'lot\s*(\d+)', re.IGNORECASE),
+     re.compile(r'\n(?:lot\s*\d+|\n)', re.IGNORECASE)),
+)
+
+
+def _lot_context_body(text: str, header_end: int, end_pattern: re.Pattern) -> Optional[str]:
+    """
+    Lignes qui suivent la ligne d'en-tête d'un lot, jusqu'à la fin du contexte
+    
+    Équivaut à r'[^\n]*+\n(.*?)(?=\nlot...|\n\n|$)' appliqué en header_end
+    (None si la ligne d'en-tête est la dernière du texte).
+    """
+    start = text.find('\n', header_end) + 1
+    if not start:
+        return None
+    end = end_pattern.search(text, start)
+    if end:
+        return text[start:end.start()]
+    # '$' : fin du texte, ou juste avant un saut de ligne final
+    stop = len(text) - 1 if text.endswith('\n') and len(text) > start else len(text)
+    return text[start:stop]
+
+
+# Normalisation des montants : espaces retirés, virgule décimale (format français
+# "1 234,56" -> "1234.56") ou séparateur de milliers ("1,234" -> "1234")
+_MONTANT_DECIMAL_COMMA = str.maketrans({' ': None, ',': '.'})
+_MONTANT_THOUSANDS_COMMA = str.maketrans({' ': None, ',': None})
+
+
+def _parse_montant(montant_str: str) -> float:
+    """Convertit un montant extrait en float (ValueError si invalide)"""
+    montant_str = montant_str.strip()
+    # Si format français (virgule comme séparateur décimal), convertir
+    if ',' in montant_str and '.' not in montant_str.replace(',', '', 1):
+        return float(montant_str.translate(_MONTANT_DECIMAL_COMMA))
+    return float(montant_str.translate(_MONTANT_THOUSANDS_COMMA))
+
+
+def _index_lot_headers(text: str) -> Tuple[List[Tuple[str, int]], ...]:
+    """
+    Relève tous les en-têtes de lots du texte, une passe par forme d'en-tête
+    
+    Returns:
+        Pour chaque forme, la liste des (numéro écrit, fin de l'en-tête)
+    """
+    return tuple(
+        [(header.group(1), header.end()) for header in header_pattern.finditer(text)]
+        for header_pattern, _ in _LOT_CONTEXT_PATTERNS
+    )
+
+
+def _find_lot_context(text: str, lot_numero: int,
+                      lot_headers: Optional[Tuple[List[Tuple[str, int]], ...]] = None) -> str:
+    """
+    Extrait le contexte d'un lot (premier en-tête correspondant suivi d'un contenu)
+    
+    Comme l'ancien pattern 'lot\\s*N', le numéro cherché peut être le préfixe du
+    numéro écrit ('lot 1' retient aussi l'en-tête 'lot 12').
+    
+    Args:
+        text: Texte complet
+        lot_numero: Numéro du lot
+        lot_headers: Index de _index_lot_headers(text), à fournir quand plusieurs
+            lots du même texte sont traités (le texte n'est alors plus parcouru)
+    """
+    numero = str(lot_numero)
+    # Les en-têtes exigent le numéro tel quel : sans index, un test de sous-chaîne
+    # écarte les numéros absents sans lancer le moteur de regex ; avec l'index, les
+    # en-têtes relevés suffisent et le texte n'est pas reparcouru
+    if lot_headers is None and numero not in text:
+        return ""
+    
+    for index, (header_pattern, end_pattern) in enumerate(_LOT_CONTEXT_PATTERNS):
+        if lot_headers is not None:
+            headers = lot_headers[index]
+        else:
+            headers = ((header.group(1), header.end()) for header in header_pattern.finditer(text))
+        for header_numero, header_end in headers:
+            if header_numero.startswith(numero):
+                body = _lot_context_body(text, header_end, end_pattern)
+                if body is not None:
+                    return body
+    
+    return ""
+
 class DetectionStrategy(Enum):
     """Stratégies de détection"""
     STRUCTURED_TABLE = "structured_table"
@@ -24,9 +125,9 @@ class DetectionStrategy(Enum):
     FLEXIBLE_PATTERNS = "flexible_patterns"
     EXCEL_TABLE = "excel_table"
 
-@dataclass
+@dataclass(slots=True)
 class LotInfo:
-    """Information sur un lot détecté"""
+    """Information sur un lot détecté (slots, Python 3.10+ : empreinte mémoire réduite, accès plus rapide)"""
     numero: int
     intitule: str
     montant_estime: float = 0.0
@@ -45,6 +146,52 @@ class LotInfo:
 class LotDetectionStrategy(ABC):
     """Stratégie de détection de lots abstraite"""
     
+    # Patterns de validation des intitulés, compilés une fois avec leurs flags
+    FORBIDDEN_START_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r'^accord-cadre',
+        r'^uniquement',
+        r'^ou\s',  # "ou" suivi d'un espace (pour éviter les mots comme "outil")
+        r'^sans majuscule',
+        r'^article\s',  # "article" suivi d'un espace (pour éviter les articles de texte, pas les lots)
+        r'^article$'    # "article" seul (sans rien après)
+    ))
+    DATE_START_PATTERNS = tuple(re.compile(p) for p in (
+        r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # 01/01/2024, 01-01-24
+        r'^\d{1,2}\s+\d{1,2}\s+\d{2,4}',     # 01 01 2024
+        r'^\d{4}[/-]\d{1,2}[/-]\d{1,2}',     # 2024/01/01
+    ))
+    
+    # Nettoyage des intitulés (appliqués dans l'ordre par _clean_title)
+    TRAILING_AMOUNT_PATTERNS = (
+        re.compile(r'\s+\d{1,3}(?:\s\d{3})*(?:[.,]\d{2})?\s*[€]?\s*$'),
+        re.compile(r'\s+\d+(?:[.,]\d+)?\s*[km]?(?:€|euros?)\s*$'),
+    )
+    TECHNICAL_WORDS = (
+        'MAIN', 'POUR', 'DE', 'D\'', 'D\\s', 'ET', 'POUR TOUT', 'TYPE', 
+        'D\'ETABLISSEMENT', 'D\'ETABLISSEMENTS', 'ETABLISSEMENT', 'ETABLISSEMENTS',
+        'SANTE', 'SANTÉ', 'PUBLIC', 'PRIVE', 'PRIVÉ', 'HOPITAL', 'HÔPITAL',
+        'HOPITAUX', 'HÔPITAUX', 'CENTRE', 'CENTRES', 'SERVICE', 'SERVICES'
+    )
+    TECHNICAL_WORD_PATTERNS = tuple(
+        re.compile(r'\s+' + re.escape(word) + r'\s*$', re.IGNORECASE) for word in TECHNICAL_WORDS
+    )
+    # Un seul test pour le cas courant (aucun mot technique en fin d'intitulé) :
+    # si aucun des patterns ci-dessus ne correspond, aucune substitution n'a lieu
+    TECHNICAL_WORD_TAIL_RE = re.compile(
+        r'\s(?:' + '|'.join(re.escape(word) for word in TECHNICAL_WORDS) + r')\s*$', re.IGNORECASE
+    )
+    FORMATTING_CHARS_RE = re.compile(r'[^\w\s\-/(),\.]')
+    TRAILING_STOPWORD_RE = re.compile(
+        r'\s+(et|de|du|des|le|la|les|un|une|pour|avec|dans|sur|par|en|au|aux|à|d\'|l\')\s*$',
+        re.IGNORECASE
+    )
+    
+    # Paires de montants (estimatif, maximum), par ordre de priorité
+    MONTANT_PAIR_PATTERNS = (
+        re.compile(r'(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?'),
+        re.compile(r'(\d+(?:[.,]\d+)?)\s*[km]?(?:€|euros?)\s+(\d+(?:[.,]\d+)?)\s*[km]?(?:€|euros?)'),
+    )
+    
     @abstractmethod
     def detect_lots(self, text: str) -> List[LotInfo]:
         """
@@ -86,40 +233,25 @@ class LotDetectionStrategy(ABC):
             return False
         
         # Vérifier si l'intitulé commence par un chiffre ou un nombre
-        if re.match(r'^\d', intitule_trim):
-            logger.debug(f"❌ Intitulé rejeté (commence par un chiffre): {intitule_trim[:50]}...")
+        if intitule_trim[0].isdecimal():
+            logger.debug("❌ Intitulé rejeté (commence par un chiffre): %s...", intitule_trim[:50])
             return False
         
         # Rejeter les intitulés qui sont exactement "ARTICLE" ou commencent par "article"
         if intitule_trim.upper().strip() == 'ARTICLE':
-            logger.debug(f"❌ Intitulé rejeté (est exactement 'ARTICLE'): {intitule_trim[:50]}...")
+            logger.debug("❌ Intitulé rejeté (est exactement 'ARTICLE'): %s...", intitule_trim[:50])
             return False
         
         # Vérifier si l'intitulé commence par des mots interdits
-        forbidden_starts = [
-            r'^accord-cadre',
-            r'^uniquement',
-            r'^ou\s',  # "ou" suivi d'un espace (pour éviter les mots comme "outil")
-            r'^sans majuscule',
-            r'^article\s',  # "article" suivi d'un espace (pour éviter les articles de texte, pas les lots)
-            r'^article$'    # "article" seul (sans rien après)
-        ]
-        
-        for pattern in forbidden_starts:
-            if re.match(pattern, intitule_trim, re.IGNORECASE):
-                logger.debug(f"❌ Intitulé rejeté (commence par mot interdit): {intitule_trim[:50]}...")
+        for pattern in self.FORBIDDEN_START_PATTERNS:
+            if pattern.match(intitule_trim):
+                logger.debug("❌ Intitulé rejeté (commence par mot interdit): %s...", intitule_trim[:50])
                 return False
         
         # Vérifier si l'intitulé commence par une date (format: jour/mois/année, jour-mois-année, etc.)
-        date_patterns = [
-            r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # 01/01/2024, 01-01-24
-            r'^\d{1,2}\s+\d{1,2}\s+\d{2,4}',     # 01 01 2024
-            r'^\d{4}[/-]\d{1,2}[/-]\d{1,2}',     # 2024/01/01
-        ]
-        
-        for pattern in date_patterns:
-            if re.match(pattern, intitule_trim):
-                logger.debug(f"❌ Intitulé rejeté (commence par une date): {intitule_trim[:50]}...")
+        for pattern in self.DATE_START_PATTERNS:
+            if pattern.match(intitule_trim):
+                logger.debug("❌ Intitulé rejeté (commence par une date): %s...", intitule_trim[:50])
                 return False
         
         # Vérifier si l'intitulé commence par une majuscule
@@ -131,7 +263,7 @@ class LotDetectionStrategy(ABC):
                 break
         
         if first_alpha_char and not first_alpha_char.isupper():
-            logger.debug(f"❌ Intitulé rejeté (ne commence pas par majuscule): {intitule_trim[:50]}...")
+            logger.debug("❌ Intitulé rejeté (ne commence pas par majuscule): %s...", intitule_trim[:50])
             return False
         
         return True
@@ -148,29 +280,23 @@ class LotDetectionStrategy(ABC):
         cleaned = ' '.join(cleaned.split())
         
         # Supprimer les montants à la fin si présents
-        cleaned = re.sub(r'\s+\d{1,3}(?:\s\d{3})*(?:[.,]\d{2})?\s*[€]?\s*$', '', cleaned)
-        cleaned = re.sub(r'\s+\d+(?:[.,]\d+)?\s*(?:k€|keuros?|m€|meuros?|€|euros?)\s*$', '', cleaned)
+        for pattern in self.TRAILING_AMOUNT_PATTERNS:
+            cleaned = pattern.sub('', cleaned)
         
         # Supprimer les mots techniques à la fin
-        technical_words = [
-            'MAIN', 'POUR', 'DE', 'D\'', 'D\\s', 'ET', 'POUR TOUT', 'TYPE', 
-            'D\'ETABLISSEMENT', 'D\'ETABLISSEMENTS', 'ETABLISSEMENT', 'ETABLISSEMENTS',
-            'SANTE', 'SANTÉ', 'PUBLIC', 'PRIVE', 'PRIVÉ', 'HOPITAL', 'HÔPITAL',
-            'HOPITAUX', 'HÔPITAUX', 'CENTRE', 'CENTRES', 'SERVICE', 'SERVICES'
-        ]
-        
-        for word in technical_words:
-            cleaned = re.sub(r'\s+' + re.escape(word) + r'\s*$', '', cleaned, flags=re.IGNORECASE)
+        if self.TECHNICAL_WORD_TAIL_RE.search(cleaned):
+            for pattern in self.TECHNICAL_WORD_PATTERNS:
+                cleaned = pattern.sub('', cleaned)
         
         # Supprimer les caractères de formatage (mais préserver virgules, apostrophes, etc.)
         # Ne supprimer que les caractères vraiment indésirables
-        cleaned = re.sub(r'[^\w\s\-/(),\.]', ' ', cleaned)  # Préserver virgules, points, apostrophes
+        cleaned = self.FORMATTING_CHARS_RE.sub(' ', cleaned)  # Préserver virgules, points, apostrophes
         
         # Supprimer les espaces multiples après nettoyage
         cleaned = ' '.join(cleaned.split())
         
         # Supprimer les mots vides à la fin
-        cleaned = re.sub(r'\s+(et|de|du|des|le|la|les|un|une|pour|avec|dans|sur|par|en|au|aux|à|d\'|l\')\s*$', '', cleaned, flags=re.IGNORECASE)
+        cleaned = self.TRAILING_STOPWORD_RE.sub('', cleaned)
         
         # Limiter la longueur
         if len(cleaned) > 300:
@@ -184,33 +310,13 @@ class LotDetectionStrategy(ABC):
         montant_maximum = 0.0
         
         try:
-            # Patterns pour les montants
-            montant_patterns = [
-                r'(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?',
-                r'(\d+(?:[.,]\d+)?)\s*(?:k€|keuros?|m€|meuros?|€|euros?)\s+(\d+(?:[.,]\d+)?)\s*(?:k€|keuros?|m€|meuros?|€|euros?)'
-            ]
-            
-            for pattern in montant_patterns:
-                matches = re.findall(pattern, text)
-                if matches:
+            for pattern in self.MONTANT_PAIR_PATTERNS:
+                # Seule la première correspondance est exploitée : search suffit
+                match = pattern.search(text)
+                if match:
                     try:
-                        # Nettoyer les montants en gérant le format français
-                        montant1_str = matches[0][0].strip()
-                        montant2_str = matches[0][1].strip()
-                        
-                        # Si format français (virgule comme séparateur décimal), convertir
-                        if ',' in montant1_str and '.' not in montant1_str.replace(',', '', 1):
-                            montant1_str = montant1_str.replace(' ', '').replace(',', '.')
-                        else:
-                            montant1_str = montant1_str.replace(' ', '').replace(',', '')
-                        
-                        if ',' in montant2_str and '.' not in montant2_str.replace(',', '', 1):
-                            montant2_str = montant2_str.replace(' ', '').replace(',', '.')
-                        else:
-                            montant2_str = montant2_str.replace(' ', '').replace(',', '')
-                        
-                        montant1 = float(montant1_str)
-                        montant2 = float(montant2_str)
+                        montant1 = _parse_montant(match.group(1))
+                        montant2 = _parse_montant(match.group(2))
                         montant_estime = montant1
                         montant_maximum = montant2
                         break
@@ -224,6 +330,12 @@ class LotDetectionStrategy(ABC):
 class StructuredTableStrategy(LotDetectionStrategy):
     """Détection dans les tableaux structurés"""
     
+    # Format: N° | Intitulé | Montant estimatif | Montant maximum (MULTILINE inclus à la compilation)
+    LOT_ROW_PATTERN = re.compile(
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{1,299}?)\s+(\d{1,3}(?:\s\d{3})*)\s*€?\s+(\d{1,3}(?:\s\d{3})*)\s*€?\s*(?:\n|$)',
+        re.MULTILINE
+    )
+    
     def detect_lots(self, text: str) -> List[LotInfo]:
         """Détecte les lots dans les tableaux structurés"""
         lots = []
@@ -231,58 +343,40 @@ class StructuredTableStrategy(LotDetectionStrategy):
         try:
             logger.debug("🔍 Détection des lots dans les tableaux structurés...")
             
-            # Pattern pour détecter les tableaux de lots structurés
-            # Format: N° | Intitulé | Montant estimatif | Montant maximum
-            lot_pattern = r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)\s+(\d{1,3}(?:\s\d{3})*)\s*€?\s+(\d{1,3}(?:\s\d{3})*)\s*€?\s*(?:\n|$)'
-            
-            matches = re.findall(lot_pattern, text, re.MULTILINE)
-            
-            if matches:
-                logger.debug(f"📋 {len(matches)} lots structurés détectés")
+            # finditer : pas de liste de tuples matérialisée, groupes lus à la demande
+            for match in self.LOT_ROW_PATTERN.finditer(text):
+                numero, intitule, montant_estime, montant_max = match.group(1, 2, 3, 4)
                 
-                for match in matches:
-                    numero, intitule, montant_estime, montant_max = match
-                    
-                    # Nettoyer les données
-                    numero = int(numero.strip())
-                    intitule = self._clean_title(intitule.strip())
-                    
-                    # Valider l'intitulé
-                    if not self._is_valid_lot_intitule(intitule):
-                        continue
-                    
-                    # Nettoyer les montants en gérant le format français
-                    montant_estime_str = montant_estime.strip()
-                    montant_max_str = montant_max.strip()
-                    
-                    # Si format français (virgule comme séparateur décimal), convertir
-                    if ',' in montant_estime_str and '.' not in montant_estime_str.replace(',', '', 1):
-                        montant_estime_str = montant_estime_str.replace(' ', '').replace(',', '.')
-                    else:
-                        montant_estime_str = montant_estime_str.replace(' ', '').replace(',', '')
-                    
-                    if ',' in montant_max_str and '.' not in montant_max_str.replace(',', '', 1):
-                        montant_max_str = montant_max_str.replace(' ', '').replace(',', '.')
-                    else:
-                        montant_max_str = montant_max_str.replace(' ', '').replace(',', '')
-                    
-                    try:
-                        montant_estime_val = float(montant_estime_str)
-                        montant_max_val = float(montant_max_str)
-                    except ValueError:
-                        montant_estime_val = 0.0
-                        montant_max_val = 0.0
-                    
-                    lot_info = LotInfo(
-                        numero=numero,
-                        intitule=intitule,
-                        montant_estime=montant_estime_val,
-                        montant_maximum=montant_max_val,
-                        source='structured_table'
-                    )
-                    
-                    lots.append(lot_info)
-                    logger.debug(f"📦 Lot structuré: {numero} - {intitule[:50]}...")
+                # Nettoyer les données (montants parsés seulement après validation)
+                numero = int(numero.strip())
+                intitule = intitule.strip()
+                if not intitule:
+                    continue
+                intitule = self._clean_title(intitule)
+                
+                # Valider l'intitulé
+                if not self._is_valid_lot_intitule(intitule):
+                    continue
+                
+                try:
+                    montant_estime_val = _parse_montant(montant_estime)
+                    montant_max_val = _parse_montant(montant_max)
+                except ValueError:
+                    montant_estime_val = 0.0
+                    montant_max_val = 0.0
+                
+                lot_info = LotInfo(
+                    numero=numero,
+                    intitule=intitule,
+                    montant_estime=montant_estime_val,
+                    montant_maximum=montant_max_val,
+                    source='structured_table'
+                )
+                
+                lots.append(lot_info)
+                logger.debug("📦 Lot structuré: %s - %s...", numero, intitule[:50])
+            
+            logger.debug("📋 %s lots structurés détectés", len(lots))
             
         except Exception as e:
             logger.error(f"Erreur détection tableaux structurés: {e}")
@@ -295,6 +389,99 @@ class StructuredTableStrategy(LotDetectionStrategy):
 class LineAnalysisStrategy(LotDetectionStrategy):
     """Détection par analyse de lignes avec support des lots collés"""
     
+    # Entrée dans une section de lots - Mots-clés élargis (une seule alternance par ligne)
+    LOT_SECTION_KEYWORDS_RE = re.compile('|'.join(re.escape(keyword) for keyword in (
+        'allotissement', 'lotissement', 'répartition', 'lots', 'lot n°', 'lot numéro',
+        'lot:', 'lots:', 'numéro du lot', 'n° lot', 'lot n', 'lot numero',
+        'prestation', 'prestations', 'description des lots', 'liste des lots',
+        'tableau', 'table', 'annexe', 'détail', 'détails'
+    )))
+    # Sortie de la section de lots
+    SECTION_END_KEYWORDS_RE = re.compile(r'article|chapitre|section|annexe')
+    
+    # Préfiltre littéral : une ligne sans chiffre ne peut contenir aucun lot
+    DIGIT_RE = re.compile(r'\d')
+    
+    # Numéro + texte en début de ligne : section de lots probable
+    AUTO_DETECT_LOT_RE = re.compile(r'^(\d{1,3})\s+[\w]')
+    
+    # Début d'un lot (numéro + intitulé), essayés dans l'ordre jusqu'au premier match
+    LOT_START_PATTERNS = (
+        # Pattern 1: Format standard - capture jusqu'à la fin de ligne (amélioré pour multi-lignes)
+        re.compile(r'^(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?:\s+\d{1,3}(?:\s\d{3})*|$)'),
+        # Pattern 1b: Format pour lots sur plusieurs lignes (sans montants sur la première ligne)
+        # (couvre aussi l'ancien pattern 5, identique)
+        re.compile(r'^(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?:\s*$)'),
+        # Pattern 1b: Format avec montants sur la même ligne
+        re.compile(r'^(\d+)\s+([\w][\w\s/().,-]{1,299}?)\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?'),
+        # Pattern 2: Format avec "LOT" ou "Lot" - capture jusqu'à la fin
+        re.compile(r'^(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]{1,299}?)(?:\s+\d|$)'),
+        # Pattern 2b: Format "LOT" avec montants sur la même ligne
+        re.compile(r'^(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]{1,299}?)\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?'),
+        # Pattern 3: Format avec tirets ou points - capture jusqu'à la fin
+        re.compile(r'^(\d+)[\s.-]+([\w][\w\s/().,-]{1,299}?)(?:\s+\d|$)'),
+        # Pattern 4: Format très permissif - capture tout le reste
+        # (couvre aussi l'ancien pattern 9, identique)
+        re.compile(r'^(\d+)\s+([\w][\w\s/().,-]+)'),
+        # Pattern 6: Format avec parenthèses
+        re.compile(r'^(\d+)\s*[)]\s+([\w][\w\s/().,-]+)'),
+        # Pattern 7: Format avec numéro entre parenthèses
+        re.compile(r'^\s*[\(]?\s*(\d+)\s*[\)]\s+([\w][\w\s/().,-]+)'),
+        # Pattern 8: Format avec "N°" ou "n°"
+        re.compile(r'^(?:N°|n°|N|n)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+)'),
+        # Pattern 10: Format avec tabulation ou espaces multiples
+        re.compile(r'^(\d+)\s{2,}([\w][\w\s/().,-]+)'),
+    )
+    
+    # Alternation unique des patterns ci-dessus : une seule passe par ligne.
+    # Chaque pattern est enveloppé dans un groupe dont l'index (lastindex)
+    # désigne le pattern gagnant, comme le premier match de la cascade.
+    LOT_START_RE = re.compile('|'.join('(%s)' % pattern.pattern for pattern in LOT_START_PATTERNS))
+    LOT_START_BY_GROUP = {}
+    _group_index = 1
+    for _pattern in LOT_START_PATTERNS:
+        LOT_START_BY_GROUP[_group_index] = _pattern
+        _group_index += 1 + _pattern.groups
+    del _group_index, _pattern
+    
+    # Montants sur une ligne de continuation d'un lot
+    AMOUNT_HINT_RE = re.compile(r'\d{1,3}(?:\s\d{3})*\s*[€]')
+    AMOUNT_DASH_PAIR_RE = re.compile(r'(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?')
+    AMOUNT_PAIR_RE = re.compile(r'(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?')
+    
+    # Lots collés sur une même ligne
+    # Exemple: "20 Micro-manipulateur... 400 000 € 800 000 € 21 Station complète..."
+    COLLATED_LOTS_RE = re.compile(
+        r'(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?:\s+(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?)?(?=\s+\d+\s+[\w]|$)'
+    )
+    
+    # Lot collé à la fin d'une ligne (détecte aussi les lots sans montants)
+    COLLATED_END_PATTERNS = (
+        re.compile(r'(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*\d+\s+sur\s+\d+\s+(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?:\s|$)'),
+        re.compile(r'\d+\s+sur\s+\d+\s+(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?:\s|$)'),
+        re.compile(r'(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?=\s+\d+\s+[\w]|$)'),
+        re.compile(r'(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?=\s*$)'),
+        # Pattern pour capturer l'intitulé complet jusqu'à la fin de ligne
+        re.compile(r'(\d+)\s+([\w][\w\s/().,-]+)'),
+    )
+    # Les deux premiers patterns exigent la pagination « 3 sur 16 » : sans le
+    # littéral « sur » dans la ligne, seuls les suivants peuvent correspondre
+    COLLATED_END_UNPAGINATED_PATTERNS = COLLATED_END_PATTERNS[2:]
+    # Titres de sections du RC pris à tort pour des lots collés
+    COLLATED_END_FALSE_LOT_KEYWORDS = (
+        'objet de la consultation', 'nomenclature communautaire', 'lieux d',
+        'contenu du dossier', 'mise', 'modification du dce', 'questions des candidats',
+        'modalit', 'horodatage', 'copie de sauvegarde', 'antivirus',
+        'documents', 'examen des candidatures', 'jugement des offres', 'mise au point'
+    )
+    
+    # Débuts de ligne qui annoncent un nouveau lot
+    NEW_LOT_LINE_RE = re.compile(r'^(?:\d+\s+[\w]|(?:LOT|Lot)\s*\d+|\d+[.-])')
+    # Lignes qui ne prolongent pas un intitulé (montants, sigles, nouveau lot)
+    NON_TITLE_LINE_RE = re.compile(r'^(?:\d{1,3}(?:\s\d{3})*\s*[€]|[€\s\d,.-]+$|[A-Z\s]+$)')
+    UPPERCASE_WORD_LINE_RE = re.compile(r'^[A-Z]{2,}\s*$')
+    STRICT_NEW_LOT_RE = re.compile(r'^\d+\s+[\w][\w]')
+    
     def detect_lots(self, text: str) -> List[LotInfo]:
         """Détecte les lots par analyse des lignes"""
         lots = []
@@ -306,14 +493,6 @@ class LineAnalysisStrategy(LotDetectionStrategy):
             current_lot = None
             in_lot_section = False
             
-            # Détecter si on est dans une section de lots - Mots-clés élargis
-            lot_section_keywords = [
-                'allotissement', 'lotissement', 'répartition', 'lots', 'lot n°', 'lot numéro',
-                'lot:', 'lots:', 'numéro du lot', 'n° lot', 'lot n', 'lot numero',
-                'prestation', 'prestations', 'description des lots', 'liste des lots',
-                'tableau', 'table', 'annexe', 'détail', 'détails'
-            ]
-            
             # Détection auto: si on trouve un pattern de lot au début, considérer qu'on est dans une section
             auto_detect_lot_section = False
             
@@ -322,24 +501,29 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                 line_lower = line.lower()
                 
                 # Détecter l'entrée dans une section de lots
-                if any(keyword in line_lower for keyword in lot_section_keywords):
+                if self.LOT_SECTION_KEYWORDS_RE.search(line_lower):
                     in_lot_section = True
                     auto_detect_lot_section = True
-                    logger.debug(f"📋 Section de lots détectée: {line[:50]}...")
+                    logger.debug("📋 Section de lots détectée: %s...", line[:50])
                     continue
                 
                 # Auto-détection: Si on trouve un pattern de lot (numéro + texte), on est probablement dans une section
-                if not in_lot_section and re.match(r'^(\d{1,3})\s+[\w]', line):
+                if not in_lot_section and self.AUTO_DETECT_LOT_RE.match(line):
                     auto_detect_lot_section = True
                 
                 # Détecter la sortie de la section de lots - Conditions plus strictes pour éviter les faux positifs
-                if in_lot_section and any(keyword in line_lower for keyword in ['article', 'chapitre', 'section', 'annexe']) and len(line) > 20:
+                if in_lot_section and self.SECTION_END_KEYWORDS_RE.search(line_lower) and len(line) > 20:
                     # Vérifier que ce n'est pas juste un titre dans une liste de lots
-                    if not re.match(r'^\d+', line):
+                    if not line[:1].isdecimal():
                         in_lot_section = False
-                        logger.debug(f"📋 Fin de section de lots détectée: {line[:50]}...")
+                        logger.debug("📋 Fin de section de lots détectée: %s...", line[:50])
                         continue
                 
+                # Préfiltre : tous les patterns de lot (collés, début de lot, montants)
+                # exigent au moins un chiffre, inutile de les lancer sinon
+                if not self.DIGIT_RE.search(line):
+                    continue
+                
                 # Détecter les lots collés sur la même ligne (dans la section de lots OU auto-détectée)
                 if in_lot_section or auto_detect_lot_section:
                     # Chercher tous les lots sur cette ligne (y compris ceux collés)
@@ -354,7 +538,7 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                         # Ajouter tous les lots trouvés sur cette ligne
                         for lot in lots_in_line:
                             lots.append(lot)
-                            logger.debug(f"📦 Lot collé (ligne): {lot.numero} - {lot.intitule[:50]}...")
+                            logger.debug("📦 Lot collé (ligne): %s - %s...", lot.numero, lot.intitule[:50])
                         continue
                     
                     # NOUVEAU: Détecter les lots collés à la fin d'une ligne (cas spécial)
@@ -367,62 +551,11 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                         
                         # Ajouter le lot collé détecté
                         lots.append(collated_lot)
-                        logger.debug(f"📦 Lot collé (fin de ligne): {collated_lot.numero} - {collated_lot.intitule[:50]}...")
+                        logger.debug("📦 Lot collé (fin de ligne): %s - %s...", collated_lot.numero, collated_lot.intitule[:50])
                     continue
                 
                 # Détecter le début d'un lot (numéro + intitulé) - Patterns multiples
-                lot_match = None
-                
-                # Pattern 1: Format standard - capture jusqu'à la fin de ligne (amélioré pour multi-lignes)
-                lot_match = re.match(r'^(\d+)\s+([\w][\w\s/().,-]+?)(?:\s+\d{1,3}(?:\s\d{3})*|$)', line)
-                
-                # Pattern 1b: Format pour lots sur plusieurs lignes (sans montants sur la première ligne)
-                if not lot_match:
-                    lot_match = re.match(r'^(\d+)\s+([\w][\w\s/().,-]+?)(?:\s*$)', line)
-                
-                # Pattern 1b: Format avec montants sur la même ligne
-                if not lot_match:
-                    lot_match = re.match(r'^(\d+)\s+([\w][\w\s/().,-]+?)\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?', line)
-                
-                # Pattern 2: Format avec "LOT" ou "Lot" - capture jusqu'à la fin
-                if not lot_match:
-                    lot_match = re.match(r'^(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+?)(?:\s+\d|$)', line)
-                
-                # Pattern 2b: Format "LOT" avec montants sur la même ligne
-                if not lot_match:
-                    lot_match = re.match(r'^(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+?)\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?', line)
-                
-                # Pattern 3: Format avec tirets ou points - capture jusqu'à la fin
-                if not lot_match:
-                    lot_match = re.match(r'^(\d+)[\s.-]+([\w][\w\s/().,-]+?)(?:\s+\d|$)', line)
-                
-                # Pattern 4: Format très permissif - capture tout le reste
-                if not lot_match:
-                    lot_match = re.match(r'^(\d+)\s+([\w][\w\s/().,-]+)', line)
-                
-                # Pattern 5: Format spécifique pour lots 13 et 14 (multi-lignes)
-                if not lot_match:
-                    lot_match = re.match(r'^(\d+)\s+([\w][\w\s/().,-]+?)(?:\s*$)', line)
-                
-                # Pattern 6: Format avec parenthèses - NOUVEAU
-                if not lot_match:
-                    lot_match = re.match(r'^(\d+)\s*[)]\s+([\w][\w\s/().,-]+)', line)
-                
-                # Pattern 7: Format avec numéro entre parenthèses - NOUVEAU
-                if not lot_match:
-                    lot_match = re.match(r'^\s*[\(]?\s*(\d+)\s*[\)]\s+([\w][\w\s/().,-]+)', line)
-                
-                # Pattern 8: Format avec "N°" ou "n°" - NOUVEAU
-                if not lot_match:
-                    lot_match = re.match(r'^(?:N°|n°|N|n)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+)', line)
-                
-                # Pattern 9: Format très permissif sans majuscule au début - NOUVEAU
-                if not lot_match:
-                    lot_match = re.match(r'^(\d+)\s+([\w][\w\s/().,-]+)', line)
-                
-                # Pattern 10: Format avec tabulation ou espaces multiples - NOUVEAU
-                if not lot_match:
-                    lot_match = re.match(r'^(\d+)\s{2,}([\w][\w\s/().,-]+)', line)
+                lot_match = self._match_lot_start(line)
                 
                 # Détecter les lots partout dans le document (même sans section explicite)
                 # Mais avec une priorité plus élevée si on est dans une section
@@ -431,107 +564,95 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                     if current_lot:
                         lots.append(current_lot)
                     
-                    # Commencer un nouveau lot
-                    numero = int(lot_match.group(1))
-                    intitule_raw = lot_match.group(2).strip()
-                    
-                    # Filtrer les faux lots (codes postaux, etc.) - Limite assouplie à 200 lots
-                    if numero > 200 or numero < 1:
-                        current_lot = None
-                        continue
-                    
-                    # Nettoyer et valider l'intitulé
-                    intitule = self._clean_title(intitule_raw)
-                    if not self._is_valid_lot_intitule(intitule):
-                        current_lot = None
-                        continue
-                    
-                    current_lot = LotInfo(
-                        numero=numero,
-                        intitule=intitule,
-                        source='line_analysis'
-                    )
-                    
-                    # Si le pattern contient des montants, les extraire directement
-                    if len(lot_match.groups()) >= 4:
-                        try:
-                            # Nettoyer les montants en gérant le format français
-                            montant1_str = lot_match.group(3).strip()
-                            montant2_str = lot_match.group(4).strip()
-                            # Si format français (virgule comme séparateur décimal), convertir
-                            if ',' in montant1_str and '.' not in montant1_str.replace(',', '', 1):
-                                # Format français: "1 234,56" -> "1234.56"
-                                montant1_str = montant1_str.replace(' ', '').replace(',', '.')
-                            else:
-                                # Format anglais ou sans décimales
-                                montant1_str = montant1_str.replace(' ', '').replace(',', '')
-                            
-                            if ',' in montant2_str and '.' not in montant2_str.replace(',', '', 1):
-                                montant2_str = montant2_str.replace(' ', '').replace(',', '.')
-                            else:
-                                montant2_str = montant2_str.replace(' ', '').replace(',', '')
-                            
-                            montant1 = float(montant1_str)
-                            montant2 = float(montant2_str)
-                            current_lot.montant_estime = montant1
-                            current_lot.montant_maximum = montant2
-                            logger.debug(f"💰 Montants détectés pour lot {numero}: {montant1} € - {montant2} €")
-                        except (ValueError, IndexError) as e:
-                            logger.warning(f"Erreur extraction montants lot {numero}: {e}")
-                    
-                    # Chercher les montants et continuer l'intitulé sur plusieurs lignes
-                    self._extend_lot_title(current_lot, lines, i)
+                    # Commencer un nouveau lot (None si numéro ou intitulé invalide)
+                    current_lot = self._start_lot(lot_match, lines, i)
                 
                 # Si on a un lot en cours et qu'on trouve des montants dans la ligne actuelle
-                elif current_lot and re.search(r'\d{1,3}(?:\s\d{3})*\s*[€]', line):
-                    montant_match = re.search(r'(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?', line)
-                    if montant_match:
-                        try:
-                            # Nettoyer les montants en gérant le format français
-                            montant1_str = montant_match.group(1).strip()
-                            montant2_str = montant_match.group(2).strip()
-                            
-                            # Si format français (virgule comme séparateur décimal), convertir
-                            if ',' in montant1_str and '.' not in montant1_str.replace(',', '', 1):
-                                montant1_str = montant1_str.replace(' ', '').replace(',', '.')
-                            else:
-                                montant1_str = montant1_str.replace(' ', '').replace(',', '')
-                            
-                            if ',' in montant2_str and '.' not in montant2_str.replace(',', '', 1):
-                                montant2_str = montant2_str.replace(' ', '').replace(',', '.')
-                            else:
-                                montant2_str = montant2_str.replace(' ', '').replace(',', '')
-                            
-                            montant1 = float(montant1_str)
-                            montant2 = float(montant2_str)
-                            current_lot.montant_estime = montant1
-                            current_lot.montant_maximum = montant2
-                            logger.debug(f"💰 Montants détectés pour lot {current_lot.numero}: {montant1} € - {montant2} €")
-                        except ValueError:
-                            pass
+                elif current_lot and self.AMOUNT_HINT_RE.search(line):
+                    self._apply_continuation_amounts(current_lot, line)
             
             # Ajouter le dernier lot s'il existe
             if current_lot:
                 lots.append(current_lot)
             
-            # Supprimer les doublons basés sur le numéro de lot
-            unique_lots = []
-            seen_numbers = set()
-            for lot in lots:
-                if lot.numero not in seen_numbers:
-                    lot.intitule = self._clean_title(lot.intitule)
-                    unique_lots.append(lot)
-                    seen_numbers.add(lot.numero)
-                else:
-                    logger.debug(f"Doublon ignoré: lot {lot.numero}")
+            unique_lots = self._dedupe_lots(lots)
             
-            logger.info(f"✅ Détection par lignes terminée: {len(unique_lots)} lots uniques trouvés (sur {len(lots)} total)")
+            logger.info("✅ Détection par lignes terminée: %s lots uniques trouvés (sur %s total)", len(unique_lots), len(lots))
             return unique_lots
             
         except Exception as e:
             logger.error(f"Erreur détection par lignes: {e}")
             return []
     
+    def _start_lot(self, lot_match: re.Match, lines: List[str], line_index: int) -> Optional[LotInfo]:
+        """Crée le lot annoncé par une ligne de début de lot (None si faux lot)"""
+        numero = int(lot_match.group(1))
+        intitule_raw = lot_match.group(2).strip()
+        
+        # Filtrer les faux lots (codes postaux, etc.) - Limite assouplie à 200 lots
+        if numero > 200 or numero < 1:
+            return None
+        
+        # Nettoyer et valider l'intitulé
+        intitule = self._clean_title(intitule_raw)
+        if not self._is_valid_lot_intitule(intitule):
+            return None
+        
+        lot = LotInfo(
+            numero=numero,
+            intitule=intitule,
+            source='line_analysis'
+        )
+        
+        # Si le pattern contient des montants, les extraire directement
+        if len(lot_match.groups()) >= 4:
+            try:
+                montant1 = _parse_montant(lot_match.group(3))
+                montant2 = _parse_montant(lot_match.group(4))
+                lot.montant_estime = montant1
+                lot.montant_maximum = montant2
+                logger.debug("💰 Montants détectés pour lot %s: %s € - %s €", numero, montant1, montant2)
+            except (ValueError, IndexError) as e:
+                logger.warning(f"Erreur extraction montants lot {numero}: {e}")
+        
+        # Chercher les montants et continuer l'intitulé sur plusieurs lignes
+        self._extend_lot_title(lot, lines, line_index)
+        return lot
+    
+    def _apply_continuation_amounts(self, lot: LotInfo, line: str) -> None:
+        """Affecte au lot en cours les montants 'estimé - maximum' trouvés sur une ligne"""
+        montant_match = self.AMOUNT_DASH_PAIR_RE.search(line)
+        if montant_match:
+            try:
+                montant1 = _parse_montant(montant_match.group(1))
+                montant2 = _parse_montant(montant_match.group(2))
+                lot.montant_estime = montant1
+                lot.montant_maximum = montant2
+                logger.debug("💰 Montants détectés pour lot %s: %s € - %s €", lot.numero, montant1, montant2)
+            except ValueError:
+                pass
+    
+    def _dedupe_lots(self, lots: List[LotInfo]) -> List[LotInfo]:
+        """Supprime les doublons basés sur le numéro de lot (premier conservé, intitulé nettoyé)"""
+        unique_lots = []
+        seen_numbers = set()
+        for lot in lots:
+            if lot.numero not in seen_numbers:
+                lot.intitule = self._clean_title(lot.intitule)
+                unique_lots.append(lot)
+                seen_numbers.add(lot.numero)
+            else:
+                logger.debug("Doublon ignoré: lot %s", lot.numero)
+        return unique_lots
+    
+    def _match_lot_start(self, line: str) -> Optional[re.Match]:
+        """Premier pattern de début de lot qui correspond à la ligne (ou None)"""
+        match = self.LOT_START_RE.match(line)
+        if not match:
+            return None
+        # Rejouer le pattern gagnant seul pour retrouver sa numérotation de groupes
+        return self.LOT_START_BY_GROUP[match.lastindex].match(line)
+    
     def _extract_multiple_lots_from_line(self, line: str, line_index: int) -> List[LotInfo]:
         """
         Extrait plusieurs lots d'une même ligne (cas des lots collés)
@@ -546,14 +667,10 @@ class LineAnalysisStrategy(LotDetectionStrategy):
         lots = []
         
         try:
-            # Pattern pour détecter les lots collés sur la même ligne
-            # Exemple: "20 Micro-manipulateur... 400 000 € 800 000 € 21 Station complète..."
-            collated_lots_pattern = r'(\d+)\s+([\w][\w\s/().,-]+?)(?:\s+(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?)?(?=\s+\d+\s+[\w]|$)'
-            
-            matches = re.findall(collated_lots_pattern, line)
+            matches = self.COLLATED_LOTS_RE.findall(line)
             
             if len(matches) > 1:  # Plusieurs lots sur la même ligne
-                logger.debug(f"🔗 Détection de {len(matches)} lots collés sur la ligne {line_index + 1}")
+                logger.debug("🔗 Détection de %s lots collés sur la ligne %s", len(matches), line_index + 1)
 
                 for match in matches:
                     numero_str = match[0].strip()
@@ -562,10 +679,12 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                     montant2_str = match[3] if match[3] else ""
                     
                     # Filtrer les faux lots - Limite assouplie à 200 lots pour capturer tous les lots
-                    if not numero_str.isdigit() or int(numero_str) > 200 or int(numero_str) < 1:
+                    if not numero_str.isdigit():
                         continue
-                    
                     numero = int(numero_str)
+                    if numero > 200 or numero < 1:
+                        continue
+                    
                     intitule = self._clean_title(intitule_raw)
                     
                     # Valider l'intitulé
@@ -581,30 +700,15 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                     # Extraire les montants si présents
                     if montant1_str and montant2_str:
                         try:
-                            # Nettoyer les montants en gérant le format français
-                            montant1_clean = montant1_str.strip()
-                            montant2_clean = montant2_str.strip()
-                            
-                            # Si format français (virgule comme séparateur décimal), convertir
-                            if ',' in montant1_clean and '.' not in montant1_clean.replace(',', '', 1):
-                                montant1_clean = montant1_clean.replace(' ', '').replace(',', '.')
-                            else:
-                                montant1_clean = montant1_clean.replace(' ', '').replace(',', '')
-                            
-                            if ',' in montant2_clean and '.' not in montant2_clean.replace(',', '', 1):
-                                montant2_clean = montant2_clean.replace(' ', '').replace(',', '.')
-                            else:
-                                montant2_clean = montant2_clean.replace(' ', '').replace(',', '')
-                            
-                            montant1 = float(montant1_clean)
-                            montant2 = float(montant2_clean)
+                            montant1 = _parse_montant(montant1_str)
+                            montant2 = _parse_montant(montant2_str)
                             lot.montant_estime = montant1
                             lot.montant_maximum = montant2
-                            logger.debug(f"💰 Lot {numero} collé: {intitule[:30]}... - {montant1}€/{montant2}€")
+                            logger.debug("💰 Lot %s collé: %s... - %s€/%s€", numero, intitule[:30], montant1, montant2)
                         except (ValueError, IndexError) as e:
                             logger.warning(f"Erreur extraction montants lot collé {numero}: {e}")
                     else:
-                        logger.debug(f"📦 Lot {numero} collé: {intitule[:30]}... (sans montants)")
+                        logger.debug("📦 Lot %s collé: %s... (sans montants)", numero, intitule[:30])
                     
                     lots.append(lot)
             
@@ -625,20 +729,10 @@ class LineAnalysisStrategy(LotDetectionStrategy):
             Lot détecté ou None
         """
         try:
-            # Pattern pour détecter un lot collé à la fin d'une ligne
-            # Pattern amélioré pour détecter les lots sans montants
-            collated_patterns = [
-                r'(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*\d+\s+sur\s+\d+\s+(\d+)\s+([\w][\w\s/().,-]+?)(?:\s|$)',
-                r'\d+\s+sur\s+\d+\s+(\d+)\s+([\w][\w\s/().,-]+?)(?:\s|$)',
-                r'(\d+)\s+([\w][\w\s/().,-]+?)(?=\s+\d+\s+[\w]|$)',
-                r'(\d+)\s+([\w][\w\s/().,-]+?)(?=\s*$)',
-                # Pattern pour capturer l'intitulé complet jusqu'à la fin de ligne
-                r'(\d+)\s+([\w][\w\s/().,-]+)'
-            ]
-            
-            # Tester tous les patterns
-            for pattern in collated_patterns:
-                match = re.search(pattern, line)
+            # Tester tous les patterns (préfiltre littéral sur la pagination)
+            patterns = self.COLLATED_END_PATTERNS if 'sur' in line else self.COLLATED_END_UNPAGINATED_PATTERNS
+            for pattern in patterns:
+                match = pattern.search(line)
                 
                 if match:
                     # Adapter selon le pattern utilisé
@@ -653,10 +747,15 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                         continue
                     
                     # Filtrer les faux lots - Limite assouplie à 200 lots pour capturer tous les lots
-                    if not numero_str.isdigit() or int(numero_str) > 200 or int(numero_str) < 1:
+                    if not numero_str.isdigit():
                         continue
-                    
                     numero = int(numero_str)
+                    if numero > 200 or numero < 1:
+                        continue
+                    
+                    # Le nettoyage ne peut que raccourcir l'intitulé : rejet anticipé
+                    if len(intitule_raw) < 3:
+                        continue
                     intitule = self._clean_title(intitule_raw)
                     
                     # Vérifier que c'est bien un lot (pas un numéro de page, etc.)
@@ -668,16 +767,9 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                         continue
                     
                     # Filtrer les faux lots (titres de sections, etc.)
-                    faux_lots_keywords = [
-                        'objet de la consultation', 'nomenclature communautaire', 'lieux d',
-                        'contenu du dossier', 'mise', 'modification du dce', 'questions des candidats',
-                        'modalit', 'horodatage', 'copie de sauvegarde', 'antivirus',
-                        'documents', 'examen des candidatures', 'jugement des offres', 'mise au point'
-                    ]
-                    
                     intitule_lower = intitule.lower()
-                    if any(keyword in intitule_lower for keyword in faux_lots_keywords):
-                        logger.debug(f"Faux lot ignoré: {numero} - {intitule[:30]}...")
+                    if any(keyword in intitule_lower for keyword in self.COLLATED_END_FALSE_LOT_KEYWORDS):
+                        logger.debug("Faux lot ignoré: %s - %s...", numero, intitule[:30])
                         continue
                     
                     lot = LotInfo(
@@ -686,7 +778,7 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                         source='line_analysis_collated_end'
                     )
                     
-                    logger.debug(f"🔗 Lot collé détecté à la fin de la ligne {line_index + 1}: {numero} - {intitule[:50]}... (pattern: {pattern[:50]}...)")
+                    logger.debug("🔗 Lot collé détecté à la fin de la ligne %s: %s - %s... (pattern: %.50s...)", line_index + 1, numero, intitule[:50], pattern.pattern)
                     
                     return lot
             
@@ -709,11 +801,7 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                 next_line = lines[j].strip()
 
                 # Si on trouve un nouveau lot, arrêter
-                if (
-                    re.match(r'^\d+\s+[\w]', next_line)
-                    or re.match(r'^(?:LOT|Lot)\s*\d+', next_line)
-                    or re.match(r'^\d+[.-]', next_line)
-                ):
+                if self.NEW_LOT_LINE_RE.match(next_line):
                     break
 
                 # Si la ligne est vide, continuer
@@ -721,29 +809,14 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                     continue
 
                 # Chercher des montants dans cette ligne
-                montant_match = re.search(r'(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?', next_line)
+                montant_match = self.AMOUNT_PAIR_RE.search(next_line)
                 if montant_match:
                     try:
-                        # Nettoyer les montants en gérant le format français
-                        montant1_str = montant_match.group(1).strip()
-                        montant2_str = montant_match.group(2).strip()
-                        
-                        # Si format français (virgule comme séparateur décimal), convertir
-                        if ',' in montant1_str and '.' not in montant1_str.replace(',', '', 1):
-                            montant1_str = montant1_str.replace(' ', '').replace(',', '.')
-                        else:
-                            montant1_str = montant1_str.replace(' ', '').replace(',', '')
-                        
-                        if ',' in montant2_str and '.' not in montant2_str.replace(',', '', 1):
-                            montant2_str = montant2_str.replace(' ', '').replace(',', '.')
-                        else:
-                            montant2_str = montant2_str.replace(' ', '').replace(',', '')
-                        
-                        montant1 = float(montant1_str)
-                        montant2 = float(montant2_str)
+                        montant1 = _parse_montant(montant_match.group(1))
+                        montant2 = _parse_montant(montant_match.group(2))
                         current_lot.montant_estime = montant1
                         current_lot.montant_maximum = montant2
-                        logger.debug(f"💰 Montants trouvés pour lot {current_lot.numero}: {montant1}€/{montant2}€")
+                        logger.debug("💰 Montants trouvés pour lot %s: %s€/%s€", current_lot.numero, montant1, montant2)
                         break  # Arrêter après avoir trouvé les montants
                     except ValueError:
                         pass
@@ -751,21 +824,17 @@ class LineAnalysisStrategy(LotDetectionStrategy):
                 # Si la ligne contient du texte et pas de montant, l'ajouter à l'intitulé
                 if (
                     next_line
-                    and not re.match(r'^\d{1,3}(?:\s\d{3})*\s*[€]', next_line)
-                    and not re.match(r'^[€\s\d,.-]+$', next_line)
-                    and not re.match(r'^[A-Z\s]+$', next_line)
+                    and not self.NON_TITLE_LINE_RE.match(next_line)
                     and len(next_line) > 3
-                    and not re.match(r'^[A-Z]{2,}\s*$', next_line)
-                    and not re.match(r'^(?:LOT|Lot)\s*\d+', next_line)
-                    and not re.match(r'^\d+[.-]', next_line)
-                    and not re.match(r'^\d+\s+[\w]', next_line)
+                    and not self.UPPERCASE_WORD_LINE_RE.match(next_line)
+                    and not self.NEW_LOT_LINE_RE.match(next_line)
                 ):
                     # Vérifier que ce n'est pas un nouveau lot (pattern plus strict)
-                    if not re.match(r'^\d+\s+[\w][\w]', next_line):
+                    if not self.STRICT_NEW_LOT_RE.match(next_line):
                         if current_lot.intitule and not current_lot.intitule.endswith(' '):
                             current_lot.intitule += ' '
                         current_lot.intitule += next_line
-                    logger.debug(f"Intitulé étendu pour lot {current_lot.numero}: {current_lot.intitule[:50]}...")
+                    logger.debug("Intitulé étendu pour lot %s: %s...", current_lot.numero, current_lot.intitule[:50])
 
         except Exception as e:
             logger.error(f"Erreur extension intitulé lot {current_lot.numero}: {e}")
@@ -780,6 +849,12 @@ class LineAnalysisStrategy(LotDetectionStrategy):
 class MultiLineTitlesStrategy(LotDetectionStrategy):
     """Détection spécialisée pour les intitulés multi-lignes"""
     
+    # Pattern très permissif pour capturer les intitulés multi-lignes (pas de '.', DOTALL inutile)
+    MULTI_LINE_PATTERN = re.compile(
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)(?:\n(?!\d+\s)[^\W\d_\s/-]{1,300}?){0,10}(?=\n\d+\s|\n\n|$)',
+        re.MULTILINE
+    )
+    
     def detect_lots(self, text: str) -> List[LotInfo]:
         """Détecte les lots avec intitulés multi-lignes"""
         lots = []
@@ -787,71 +862,54 @@ class MultiLineTitlesStrategy(LotDetectionStrategy):
         try:
             logger.debug("🔍 Détection des intitulés multi-lignes...")
             
-            # Pattern très permissif pour capturer les intitulés multi-lignes
-            multi_line_pattern = r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]+?)(?:\n(?!\d+\s)[^\W\d_\s/-]+?)*(?=\n\d+\s|\n\n|$)'
-            
-            matches = re.findall(multi_line_pattern, text, re.MULTILINE | re.DOTALL)
+            # En-têtes de lots relevés au premier lot retenu, puis partagés par les suivants
+            lot_headers = None
             
-            if matches:
-                logger.debug(f"📋 {len(matches)} intitulés multi-lignes détectés")
+            for match in self.MULTI_LINE_PATTERN.finditer(text):
+                numero_str = match.group(1).strip()
+                intitule_raw = match.group(2).strip()
                 
-                for match in matches:
-                    numero_str = match[0].strip()
-                    intitule_raw = match[1].strip()
-                    
-                    # Filtrer les faux lots - Limite assouplie à 200 lots pour capturer tous les lots
-                    if not numero_str.isdigit() or int(numero_str) > 200 or int(numero_str) < 1:
-                        continue
-                    
-                    numero = int(numero_str)
-                    intitule = self._clean_title(intitule_raw)
-                    
-                    # Valider l'intitulé
-                    if not self._is_valid_lot_intitule(intitule):
-                        continue
-                    
-                    # Chercher les montants dans le contexte du lot
-                    lot_context = self._extract_lot_context(text, numero)
-                    montant_estime, montant_maximum = self._extract_montants_from_text(lot_context)
-                    
-                    lot_info = LotInfo(
-                        numero=numero,
-                        intitule=intitule,
-                        montant_estime=montant_estime,
-                        montant_maximum=montant_maximum,
-                        source='multi_line_titles'
-                    )
-                    
-                    lots.append(lot_info)
-                    logger.debug(f"📦 Lot multi-lignes: {numero} - {intitule[:50]}...")
+                # Filtrer les faux lots - Limite assouplie à 200 lots pour capturer tous les lots
+                if not numero_str.isdigit():
+                    continue
+                numero = int(numero_str)
+                if numero > 200 or numero < 1:
+                    continue
+                
+                intitule = self._clean_title(intitule_raw)
+                
+                # Valider l'intitulé
+                if not self._is_valid_lot_intitule(intitule):
+                    continue
+                
+                # Chercher les montants dans le contexte du lot
+                if lot_headers is None:
+                    lot_headers = _index_lot_headers(text)
+                lot_context = self._extract_lot_context(text, numero, lot_headers)
+                montant_estime, montant_maximum = self._extract_montants_from_text(lot_context)
+                
+                lot_info = LotInfo(
+                    numero=numero,
+                    intitule=intitule,
+                    montant_estime=montant_estime,
+                    montant_maximum=montant_maximum,
+                    source='multi_line_titles'
+                )
+                
+                lots.append(lot_info)
+                logger.debug("📦 Lot multi-lignes: %s - %s...", numero, intitule[:50])
+            
+            logger.debug("📋 %s intitulés multi-lignes détectés", len(lots))
             
         except Exception as e:
             logger.error(f"Erreur détection multi-lignes: {e}")
         
         return lots
     
-    def _extract_lot_context(self, text: str, lot_numero: int) -> str:
+    def _extract_lot_context(self, text: str, lot_numero: int,
+                             lot_headers: Optional[Tuple[List[Tuple[str, int]], ...]] = None) -> str:
         """Extrait le contexte autour d'un lot spécifique"""
-        try:
-            # Chercher le lot dans le texte
-            lot_pattern = rf'lot\s*n°?\s*{lot_numero}[^\n]*\n(.*?)(?=\nlot\s*n°?\s*\d+|\n\n|$)'
-            match = re.search(lot_pattern, text, re.IGNORECASE | re.DOTALL)
-            
-            if match:
-                return match.group(1)
-            
-            # Pattern alternatif plus large
-            lot_pattern_alt = rf'lot\s*{lot_numero}[^\n]*\n(.*?)(?=\nlot\s*\d+|\n\n|$)'
-            match_alt = re.search(lot_pattern_alt, text, re.IGNORECASE | re.DOTALL)
-            
-            if match_alt:
-                return match_alt.group(1)
-            
-            return ""
-            
-        except Exception as e:
-            logger.error(f"Erreur extraction contexte lot {lot_numero}: {e}")
-            return ""
+        return _find_lot_context(text, lot_numero, lot_headers)
     
     def get_strategy_name(self) -> str:
         return "MultiLineTitles"
@@ -859,6 +917,161 @@ class MultiLineTitlesStrategy(LotDetectionStrategy):
 class FlexiblePatternsStrategy(LotDetectionStrategy):
     """Détection avec patterns flexibles (fallback)"""
     
+    # Section des lots (IGNORECASE inclus à la compilation)
+    SECTION_PATTERN = re.compile(
+        r'(allotissement|lotissement|répartition|lots?\b|lot\s*n°|lot\s*numéro)([\s\S]*?)(?=\n\s*(article|chapitre|section|annexe)\b|\Z)',
+        re.IGNORECASE
+    )
+    
+    # Patterns flexibles pour détecter les lots (partagés par toutes les instances)
+    FLEXIBLE_PATTERNS = [
+        # Pattern 1: Numéro + intitulé multi-lignes complet
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?:\n(?!\d+\s)[\w\s/().-]{1,300}?){0,10}(?=\n\d+\s|\n\n|$)',
+        # Pattern 2: Numéro + intitulé multi-lignes avec montants
+        # (intitulé et lignes de continuation sans saut de ligne interne : découpage
+        # unique, pas de retour arrière exponentiel quand les montants sont absents,
+        # et l'intitulé ne déborde pas sur la ligne numérotée du lot suivant)
+        r'(?:^|\n)(\d+)\s+([\w](?:[\w/().,-]|[^\S\n]){1,299}?)(?:\n(?!\d+\s)(?:[\w/().-]|[^\S\n]){1,300}?){0,10}\s+(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?',
+        # Pattern 3: Format tableau très permissif
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)(?:\n(?!\d+\s)[^\W\d_\s/-]{1,300}?){0,10}\s+(\d{1,3}(?:\s\d{3})*)\s+(\d{1,3}(?:\s\d{3})*)\s*',
+        # Pattern 4: Format très permissif multi-lignes
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?:\n(?!\d+\s)[\w\s/().-]{1,300}?){0,10}',
+        # Pattern 5: Format tableau précis
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)\s+(\d{1,3}(?:\s\d{3})*)\s+(\d{1,3}(?:\s\d{3})*)\s*(?:\n|$)',
+        # Pattern 6: Format avec caractères spéciaux
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)\s+(\d{1,3}(?:\s\d{3})*)\s*[€]\s+(\d{1,3}(?:\s\d{3})*)\s*[€]',
+        # Pattern 7: Format plus permissif
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)\s+(\d{1,3}(?:\s\d{3})*)\s+(\d{1,3}(?:\s\d{3})*)',
+        # Pattern 8: Format avec montants dans l'intitulé
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)\s+(\d{1,3}(?:\s\d{3})*)\s+(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*',
+        # Pattern 9: Numéro + Intitulé + Montant
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)\s+(\d{1,3}(?:\s\d{3})*)\s*[€]',
+        # Pattern 10: Lot + Numéro + Intitulé
+        r'(?:lot|Lot)\s*(\d+)[\s:]+([\w][^\W\d_\s/-]{1,299}?)(?:\n|$)',
+        # Pattern 11: Numéro + Description + Montant
+        r'(?:^|\n)(\d+)\s+([^€\n]{10,100})\s+(\d{1,3}(?:\s\d{3})*)\s*[€]',
+        # Pattern 12: Format très général
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{10,80})(?:\n|$)',
+        # Pattern 13: Format avec tirets ou points
+        r'(?:^|\n)(\d+)[\s.-]+([\w][^\W\d_\s/-]{10,80})(?:\n|$)',
+        # Pattern 14: Format avec parenthèses
+        r'(?:^|\n)(\d+)\s*\(([\w][^\W\d_\s/-]{10,80})\)(?:\n|$)',
+        # Pattern 15: Format très permissif
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{5,100})(?:\n|$)',
+        # Pattern 16: Format avec "Article" ou "Section"
+        r'(?:article|Article|section|Section)\s*(\d+)[\s:]+([\w][^\W\d_\s/-]{10,80})(?:\n|$)',
+        # Pattern 17: Format très permissif pour noms longs
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/()-]{15,150})(?:\s+\d|$|\n)',
+        # Pattern 18: Format avec caractères spéciaux étendus
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/()-]{10,120})(?:\s+\d|$|\n)',
+        # Pattern 19: Format multi-mots avec continuation
+        r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/()-]+?)(?:\s+\d{1,3}(?:\s\d{3})*|$|\n)',
+        # Pattern 20: Format très général pour descriptions longues
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{10,200})(?:\s+\d|$|\n)',
+        # Pattern 21: Format avec "Prestation" ou "Service"
+        r'(?:prestation|Prestation|service|Service)\s*(\d+)[\s:]+([\w][^\W\d_\s/-]{10,80})(?:\n|$)',
+        # Pattern 22: Format simple pour noms courts
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{5,50})(?:\s|$)',
+        # Pattern 23: Format très simple
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{1,299}?)(?:\s|$)',
+        # Pattern 24: Format avec "LOT" ou "Lot" - capture jusqu'à la fin
+        r'(?:^|\n)(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]{1,299}?)(?:\s+\d|$)',
+        # Pattern 25: Format "LOT" très permissif
+        r'(?:^|\n)(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+)',
+        # Pattern 26: Format ultra-permissif pour noms très longs
+        r'(?:^|\n)(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]{1,299}?)(?:\s|$)',
+        # Pattern 27: Format ultra-simple
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+)',
+        # Pattern 28: Format avec montants sur la même ligne
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{1,299}?)\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?',
+        # Pattern 29: Format "LOT" avec montants
+        r'(?:^|\n)(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]{1,299}?)\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?',
+        # Pattern 30: Format générique avec montants (virgules)
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{1,299}?)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:,\d{3})*)\s*[€]?',
+        # Pattern 31: Format générique avec montants (sans espaces)
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{1,299}?)\s*-\s*(\d+)[€]?\s*-\s*(\d+)[€]?',
+        # Pattern 32: Format générique avec montants (k€)
+        r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{1,299}?)\s*-\s*(\d+(?:\.\d+)?k)[€]?\s*-\s*(\d+(?:\.\d+)?k)[€]?'
+    ]
+    # Mêmes patterns compilés une fois (aucun '.' hors classe : MULTILINE suffit)
+    FLEXIBLE_REGEXES = tuple(re.compile(pattern, re.MULTILINE) for pattern in FLEXIBLE_PATTERNS)
+    # Littéraux obligatoires de chaque pattern (tous les tuples requis, au moins
+    # un littéral par tuple) : un pattern dont un littéral est absent du texte
+    # ne peut pas correspondre et n'est pas exécuté. Patterns sensibles à la casse.
+    _EURO = ('€',)
+    _DASH = ('-',)
+    _LOT_WORD = ('LOT', 'Lot')
+    FLEXIBLE_PATTERN_GATES = {
+        5: (_EURO,),
+        8: (_EURO,),
+        9: (('lot', 'Lot'),),
+        10: (_EURO,),
+        13: (('(',), (')',)),
+        15: (('article', 'Article', 'section', 'Section'),),
+        20: (('prestation', 'Prestation', 'service', 'Service'),),
+        23: (_LOT_WORD,),
+        24: (_LOT_WORD,),
+        25: (_LOT_WORD,),
+        27: (_DASH,),
+        28: (_LOT_WORD, _DASH),
+        29: (_DASH,),
+        30: (_DASH,),
+        31: (_DASH, ('k',)),
+    }
+    del _EURO, _DASH, _LOT_WORD
+    
+    # Base Hyperscan compilée à la demande (None = pas encore compilée, False = indisponible)
+    _hs_database = None
+    
+    @classmethod
+    def _get_hyperscan_database(cls):
+        """Compile une seule fois la base Hyperscan des patterns flexibles (mode pré-filtre)"""
+        if cls._hs_database is None:
+            try:
+                flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+                         | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                         | hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_DOTALL)
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[pattern.encode('utf-8') for pattern in cls.FLEXIBLE_PATTERNS],
+                    ids=list(range(len(cls.FLEXIBLE_PATTERNS))),
+                    elements=len(cls.FLEXIBLE_PATTERNS),
+                    flags=[flags] * len(cls.FLEXIBLE_PATTERNS)
+                )
+                cls._hs_database = database
+            except Exception as e:
+                logger.warning(f"Hyperscan indisponible pour les patterns flexibles: {e}")
+                cls._hs_database = False
+        return cls._hs_database
+    
+    def _candidate_pattern_ids(self, search_text: str) -> Optional[set]:
+        """
+        Pré-filtre en une seule passe Hyperscan les patterns susceptibles de correspondre
+        
+        Returns:
+            Indices des patterns ayant au moins une correspondance (sur-ensemble),
+            ou None si Hyperscan n'est pas disponible
+        """
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        
+        database = self._get_hyperscan_database()
+        if not database:
+            return None
+        
+        hits = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+        
+        try:
+            database.scan(search_text.encode('utf-8'), match_event_handler=on_match)
+        except Exception as e:
+            logger.debug("Erreur scan Hyperscan: %s", e)
+            return None
+        
+        return hits
+    
     def detect_lots(self, text: str) -> List[LotInfo]:
         """Détecte les lots avec des patterns flexibles"""
         lots = []
@@ -867,104 +1080,42 @@ class FlexiblePatternsStrategy(LotDetectionStrategy):
             logger.debug("🔍 Détection avec patterns flexibles...")
             
             # Limiter l'analyse à la section des lots si détectable
-            section_pattern = r'(allotissement|lotissement|répartition|lots?\b|lot\s*n°|lot\s*numéro)([\s\S]*?)(?=\n\s*(article|chapitre|section|annexe)\b|\Z)'
-            section_match = re.search(section_pattern, text, re.IGNORECASE)
+            section_match = self.SECTION_PATTERN.search(text)
             search_text = section_match.group(0) if section_match else text
 
-            # Patterns flexibles pour détecter les lots
-            flexible_patterns = [
-                # Pattern 1: Numéro + intitulé multi-lignes complet
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)(?:\n(?!\d+\s)[\w\s/().-]+?)*(?=\n\d+\s|\n\n|$)',
-                # Pattern 2: Numéro + intitulé multi-lignes avec montants
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)(?:\n(?!\d+\s)[\w\s/().-]+?)*\s+(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?',
-                # Pattern 3: Format tableau très permissif
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]+?)(?:\n(?!\d+\s)[^\W\d_\s/-]+?)*\s+(\d{1,3}(?:\s\d{3})*)\s+(\d{1,3}(?:\s\d{3})*)\s*',
-                # Pattern 4: Format très permissif multi-lignes
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)(?:\n(?!\d+\s)[\w\s/().-]+?)*',
-                # Pattern 5: Format tableau précis
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]+?)\s+(\d{1,3}(?:\s\d{3})*)\s+(\d{1,3}(?:\s\d{3})*)\s*(?:\n|$)',
-                # Pattern 6: Format avec caractères spéciaux
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]+?)\s+(\d{1,3}(?:\s\d{3})*)\s*[€]\s+(\d{1,3}(?:\s\d{3})*)\s*[€]',
-                # Pattern 7: Format plus permissif
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]+?)\s+(\d{1,3}(?:\s\d{3})*)\s+(\d{1,3}(?:\s\d{3})*)',
-                # Pattern 8: Format avec montants dans l'intitulé
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]+?)\s+(\d{1,3}(?:\s\d{3})*)\s+(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*',
-                # Pattern 9: Numéro + Intitulé + Montant
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]+?)\s+(\d{1,3}(?:\s\d{3})*)\s*[€]',
-                # Pattern 10: Lot + Numéro + Intitulé
-                r'(?:lot|Lot)\s*(\d+)[\s:]+([\w][^\W\d_\s/-]+?)(?:\n|$)',
-                # Pattern 11: Numéro + Description + Montant
-                r'(?:^|\n)(\d+)\s+([^€\n]{10,100})\s+(\d{1,3}(?:\s\d{3})*)\s*[€]',
-                # Pattern 12: Format très général
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{10,80})(?:\n|$)',
-                # Pattern 13: Format avec tirets ou points
-                r'(?:^|\n)(\d+)[\s.-]+([\w][^\W\d_\s/-]{10,80})(?:\n|$)',
-                # Pattern 14: Format avec parenthèses
-                r'(?:^|\n)(\d+)\s*\(([\w][^\W\d_\s/-]{10,80})\)(?:\n|$)',
-                # Pattern 15: Format très permissif
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/-]{5,100})(?:\n|$)',
-                # Pattern 16: Format avec "Article" ou "Section"
-                r'(?:article|Article|section|Section)\s*(\d+)[\s:]+([\w][^\W\d_\s/-]{10,80})(?:\n|$)',
-                # Pattern 17: Format très permissif pour noms longs
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/()-]{15,150})(?:\s+\d|$|\n)',
-                # Pattern 18: Format avec caractères spéciaux étendus
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/()-]{10,120})(?:\s+\d|$|\n)',
-                # Pattern 19: Format multi-mots avec continuation
-                r'(?:^|\n)(\d+)\s+([\w][^\W\d_\s/()-]+?)(?:\s+\d{1,3}(?:\s\d{3})*|$|\n)',
-                # Pattern 20: Format très général pour descriptions longues
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{10,200})(?:\s+\d|$|\n)',
-                # Pattern 21: Format avec "Prestation" ou "Service"
-                r'(?:prestation|Prestation|service|Service)\s*(\d+)[\s:]+([\w][^\W\d_\s/-]{10,80})(?:\n|$)',
-                # Pattern 22: Format simple pour noms courts
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]{5,50})(?:\s|$)',
-                # Pattern 23: Format très simple
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)(?:\s|$)',
-                # Pattern 24: Format avec "LOT" ou "Lot" - capture jusqu'à la fin
-                r'(?:^|\n)(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+?)(?:\s+\d|$)',
-                # Pattern 25: Format "LOT" très permissif
-                r'(?:^|\n)(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+)',
-                # Pattern 26: Format ultra-permissif pour noms très longs
-                r'(?:^|\n)(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+?)(?:\s|$)',
-                # Pattern 27: Format avec numéro seul
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)(?:\s|$)',
-                # Pattern 28: Format ultra-simple
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+)',
-                # Pattern 29: Format avec montants sur la même ligne
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?',
-                # Pattern 30: Format "LOT" avec montants
-                r'(?:^|\n)(?:LOT|Lot)\s*(\d+)[\s:-]+([\w][\w\s/().,-]+?)\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:\s\d{3})*)\s*[€]?',
-                # Pattern 31: Format générique avec montants (virgules)
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*[€]?\s*-\s*(\d{1,3}(?:,\d{3})*)\s*[€]?',
-                # Pattern 32: Format générique avec montants (sans espaces)
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)\s*-\s*(\d+)[€]?\s*-\s*(\d+)[€]?',
-                # Pattern 33: Format générique avec montants (k€)
-                r'(?:^|\n)(\d+)\s+([\w][\w\s/().,-]+?)\s*-\s*(\d+(?:\.\d+)?k)[€]?\s*-\s*(\d+(?:\.\d+)?k)[€]?'
-            ]
-            
             # Essayer tous les patterns et garder le meilleur résultat
             best_matches = []
             best_pattern = None
             best_quality_score = 0
             
-            for i, pattern in enumerate(flexible_patterns):
+            # Pré-filtrage optionnel : un seul scan pour écarter les patterns sans correspondance
+            candidate_ids = self._candidate_pattern_ids(search_text)
+            
+            for i, pattern in enumerate(self.FLEXIBLE_REGEXES):
+                if candidate_ids is not None and i not in candidate_ids:
+                    continue
+                gates = self.FLEXIBLE_PATTERN_GATES.get(i)
+                if gates and not all(
+                        any(literal in search_text for literal in alternatives) for alternatives in gates):
+                    continue
                 try:
-                    pattern_matches = re.findall(pattern, search_text, re.MULTILINE | re.DOTALL)
+                    pattern_matches = pattern.findall(search_text)
                     if pattern_matches:
                         # Calculer un score de qualité basé sur la longueur moyenne des noms
                         avg_name_length = sum(len(match[1]) for match in pattern_matches) / len(pattern_matches)
                         quality_score = len(pattern_matches) * avg_name_length
                         
-                        # Bonus pour les patterns avec montants (patterns 29-33)
-                        if i >= 28:  # Patterns 29-33 (index 28-32)
+                        # Bonus pour les patterns avec montants (patterns 28-32)
+                        if i >= 27:  # Patterns 28-32 (index 27-31)
                             # Vérifier si le pattern capture des montants
                             has_amounts = any(len(match) >= 4 for match in pattern_matches)
                             if has_amounts:
                                 quality_score *= 2  # Double le score pour les patterns avec montants
-                                logger.debug(f"📈 Pattern {i+1}: {len(pattern_matches)} lots trouvés (qualité: {quality_score:.1f}) - AVEC MONTANTS")
+                                logger.debug("📈 Pattern %s: %s lots trouvés (qualité: %.1f) - AVEC MONTANTS", i+1, len(pattern_matches), quality_score)
                             else:
-                                logger.debug(f"📈 Pattern {i+1}: {len(pattern_matches)} lots trouvés (qualité: {quality_score:.1f})")
+                                logger.debug("📈 Pattern %s: %s lots trouvés (qualité: %.1f)", i+1, len(pattern_matches), quality_score)
                         else:
-                            logger.info(f"📈 Pattern {i+1}: {len(pattern_matches)} lots trouvés (qualité: {quality_score:.1f})")
+                            logger.info("📈 Pattern %s: %s lots trouvés (qualité: %.1f)", i+1, len(pattern_matches), quality_score)
                         
                         # Choisir le pattern avec le meilleur score de qualité
                         if quality_score > best_quality_score:
@@ -977,27 +1128,34 @@ class FlexiblePatternsStrategy(LotDetectionStrategy):
             matches = best_matches
             
             if matches:
-                logger.debug(f"📋 {len(matches)} lots flexibles détectés")
+                logger.debug("📋 %s lots flexibles détectés", len(matches))
                 
                 for match in matches:
                     if len(match) >= 2:
                         numero_str = match[0].strip()
-                        # Filtrer les faux lots - Limite assouplie à 200 lots pour capturer tous les lots
-                        if not numero_str.isdigit() or int(numero_str) > 200 or int(numero_str) < 1:
+                        # Filtrer les faux lots avant tout nettoyage ou parsing de montant
+                        # Limite assouplie à 200 lots pour capturer tous les lots
+                        if not numero_str.isdigit():
                             continue
-                        
                         numero = int(numero_str)
-                        intitule = self._clean_title(match[1].strip() if len(match) > 1 else f"Lot {numero}")
+                        if numero > 200 or numero < 1:
+                            continue
+                        
+                        intitule_raw = match[1].strip()
+                        if not intitule_raw:
+                            continue
+                        intitule = self._clean_title(intitule_raw)
                         
                         # Valider l'intitulé
                         if not self._is_valid_lot_intitule(intitule):
                             continue
                         
                         # Gérer les montants selon le nombre de groupes capturés
+                        # (uniquement pour les correspondances déjà validées)
                         montant_estime = 0.0
                         montant_maximum = 0.0
                         
-                        if len(match) >= 3:
+                        if len(match) == 3:
                             try:
                                 montant_str = match[2].replace(' ', '')
                                 # Gérer les formats k€
@@ -1008,11 +1166,11 @@ class FlexiblePatternsStrategy(LotDetectionStrategy):
                                     montant_str = montant_str.replace(',', '')
                                     montant_estime = float(montant_str)
                                 montant_maximum = montant_estime
-                                logger.debug(f"💰 Montant unique détecté pour lot {numero}: {montant_estime} €")
+                                logger.debug("💰 Montant unique détecté pour lot %s: %s €", numero, montant_estime)
                             except ValueError:
                                 pass
                         
-                        if len(match) >= 4:
+                        elif len(match) >= 4:
                             try:
                                 # Gérer les formats k€ et virgules
                                 montant1_str = match[2].replace(' ', '')
@@ -1033,9 +1191,10 @@ class FlexiblePatternsStrategy(LotDetectionStrategy):
                                     montant2_str = montant2_str.replace(',', '')
                                     montant_maximum = float(montant2_str)
                                 
-                                logger.debug(f"💰 Montants détectés pour lot {numero}: {montant_estime} € - {montant_maximum} €")
+                                logger.debug("💰 Montants détectés pour lot %s: %s € - %s €", numero, montant_estime, montant_maximum)
                             except ValueError:
-                                pass
+                                # Second montant illisible : le maximum reprend l'estimation
+                                montant_maximum = montant_estime
                         
                         lot_info = LotInfo(
                             numero=numero,
@@ -1046,7 +1205,7 @@ class FlexiblePatternsStrategy(LotDetectionStrategy):
                         )
                         
                         lots.append(lot_info)
-                        logger.debug(f"📦 Lot flexible: {numero} - {intitule[:50]}...")
+                        logger.debug("📦 Lot flexible: %s - %s...", numero, intitule[:50])
             
         except Exception as e:
             logger.error(f"Erreur détection patterns flexibles: {e}")
@@ -1059,6 +1218,13 @@ class FlexiblePatternsStrategy(LotDetectionStrategy):
 class ExcelTableStrategy(LotDetectionStrategy):
     """Détection dans les tableaux Excel"""
     
+    # Lignes de tableau Excel, de la plus complète à la plus simple
+    EXCEL_ROW_PATTERNS = tuple(re.compile(pattern, re.MULTILINE) for pattern in (
+        r'(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)\s+(\d+(?:[.,]\d+)?)\s+(\d+(?:[.,]\d+)?)',
+        r'(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)\s+(\d+(?:[.,]\d+)?)',
+        r'(\d+)\s+([\w][^\W\d_\s/-]{1,299}?)'
+    ))
+    
     def detect_lots(self, text: str) -> List[LotInfo]:
         """Détecte les lots dans les données Excel"""
         lots = []
@@ -1069,27 +1235,22 @@ class ExcelTableStrategy(LotDetectionStrategy):
             # Pour les données Excel, on suppose que le texte contient des informations structurées
             # On cherche des patterns spécifiques aux tableaux Excel
             
-            # Pattern pour les lignes de tableau Excel
-            excel_patterns = [
-                r'(\d+)\s+([\w][^\W\d_\s/-]+?)\s+(\d+(?:[.,]\d+)?)\s+(\d+(?:[.,]\d+)?)',
-                r'(\d+)\s+([\w][^\W\d_\s/-]+?)\s+(\d+(?:[.,]\d+)?)',
-                r'(\d+)\s+([\w][^\W\d_\s/-]+?)'
-            ]
-            
-            for pattern in excel_patterns:
-                matches = re.findall(pattern, text, re.MULTILINE)
+            for pattern in self.EXCEL_ROW_PATTERNS:
+                matches = pattern.findall(text)
                 
                 if matches and len(matches) >= 3:  # Seuil minimum pour considérer l'extraction réussie
-                    logger.debug(f"📋 {len(matches)} lots Excel détectés avec pattern")
+                    logger.debug("📋 %s lots Excel détectés avec pattern", len(matches))
                     
                     for match in matches:
                         if len(match) >= 2:
                             numero_str = match[0].strip()
                             # Filtrer les faux lots - Limite assouplie à 200 lots pour capturer tous les lots
-                            if not numero_str.isdigit() or int(numero_str) > 200 or int(numero_str) < 1:
+                            if not numero_str.isdigit():
                                 continue
-                            
                             numero = int(numero_str)
+                            if numero > 200 or numero < 1:
+                                continue
+                            
                             intitule = self._clean_title(match[1].strip())
                             
                             # Valider l'intitulé
@@ -1100,19 +1261,20 @@ class ExcelTableStrategy(LotDetectionStrategy):
                             montant_estime = 0.0
                             montant_maximum = 0.0
                             
-                            if len(match) >= 3:
+                            if len(match) == 3:
                                 try:
                                     montant_estime = float(match[2].replace(',', '.'))
                                     montant_maximum = montant_estime
                                 except ValueError:
                                     pass
                             
-                            if len(match) >= 4:
+                            elif len(match) >= 4:
                                 try:
                                     montant_estime = float(match[2].replace(',', '.'))
                                     montant_maximum = float(match[3].replace(',', '.'))
                                 except ValueError:
-                                    pass
+                                    # Second montant illisible : le maximum reprend l'estimation
+                                    montant_maximum = montant_estime
                             
                             lot_info = LotInfo(
                                 numero=numero,
@@ -1123,7 +1285,7 @@ class ExcelTableStrategy(LotDetectionStrategy):
                             )
                             
                             lots.append(lot_info)
-                            logger.debug(f"📦 Lot Excel: {numero} - {intitule[:50]}...")
+                            logger.debug("📦 Lot Excel: %s - %s...", numero, intitule[:50])
                     
                     break  # Utiliser le premier pattern qui fonctionne
             
@@ -1138,6 +1300,17 @@ class ExcelTableStrategy(LotDetectionStrategy):
 class LotDetector:
     """Détecteur de lots principal utilisant plusieurs stratégies"""
     
+    # Toutes les stratégies exigent un numéro de lot : sans chiffre, aucune ne peut aboutir
+    LOT_NUMBER_HINT_RE = re.compile(r'\d')
+    
+    # Derniers résultats fusionnés {texte: (stratégies ayant trouvé des lots, lots)},
+    # partagés entre instances : l'interface recrée les extracteurs et relance la
+    # détection sur le même document à chaque interaction. Les sessions Streamlit
+    # tournant dans des threads distincts, les accès passent par le verrou.
+    _DETECTION_CACHE: Dict[str, Tuple[Tuple[str, ...], Tuple[LotInfo, ...]]] = {}
+    _DETECTION_CACHE_LOCK = threading.Lock()
+    DETECTION_CACHE_SIZE = 8
+    
     def __init__(self):
         """Initialise le détecteur avec toutes les stratégies"""
         self.strategies = [
@@ -1172,6 +1345,11 @@ class LotDetector:
         try:
             self.performance_metrics['total_detections'] += 1
             
+            # Préfiltre peu coûteux avant de lancer les cinq stratégies sur tout le texte
+            if not self.LOT_NUMBER_HINT_RE.search(text):
+                logger.warning("⚠️ Aucune stratégie n'a réussi à détecter des lots")
+                return []
+            
             if preferred_strategy:
                 # Utiliser la stratégie préférée
                 strategy = self._get_strategy_by_name(preferred_strategy.value)
@@ -1183,6 +1361,17 @@ class LotDetector:
                             self.performance_metrics['strategy_usage'].get(strategy.get_strategy_name(), 0) + 1
                         return lots
             
+            with self._DETECTION_CACHE_LOCK:
+                cached = self._DETECTION_CACHE.get(text)
+            if cached is not None:
+                strategy_names, cached_lots = cached
+                for strategy_name in strategy_names:
+                    self.performance_metrics['strategy_usage'][strategy_name] = \
+                        self.performance_metrics['strategy_usage'].get(strategy_name, 0) + 1
+                return self._record_merged_detection(
+                    [replace(lot) for lot in cached_lots], len(strategy_names), start_time
+                )
+            
             # NOUVEAU: Essayer TOUTES les stratégies et fusionner les résultats
             all_lots_by_strategy = {}
             
@@ -1192,36 +1381,56 @@ class LotDetector:
                     if lots:
                         strategy_name = strategy.get_strategy_name()
                         all_lots_by_strategy[strategy_name] = lots
-                        logger.debug(f"📈 {strategy_name}: {len(lots)} lots détectés")
+                        logger.debug("📈 %s: %s lots détectés", strategy_name, len(lots))
                         self.performance_metrics['strategy_usage'][strategy_name] = \
                             self.performance_metrics['strategy_usage'].get(strategy_name, 0) + 1
                 except Exception as e:
                     logger.warning(f"Erreur avec la stratégie {strategy.get_strategy_name()}: {e}")
             
             # Fusionner intelligemment tous les lots détectés
-            if all_lots_by_strategy:
-                merged_lots = self._merge_lots_from_all_strategies(all_lots_by_strategy)
-                
-                if merged_lots:
-                    # Mettre à jour le temps moyen de détection
-                    detection_time = time.time() - start_time
-                    self.performance_metrics['average_detection_time'] = (
-                        (self.performance_metrics['average_detection_time'] * 
-                         (self.performance_metrics['total_detections'] - 1) + detection_time) /
-                        self.performance_metrics['total_detections']
-                    )
-                    
-                    logger.info(f"✅ Fusion: {len(merged_lots)} lots uniques détectés depuis {len(all_lots_by_strategy)} stratégies")
-                    self.performance_metrics['successful_detections'] += 1
-                    return merged_lots
-            
-            logger.warning("⚠️ Aucune stratégie n'a réussi à détecter des lots")
-            return []
+            merged_lots = self._merge_lots_from_all_strategies(all_lots_by_strategy) if all_lots_by_strategy else []
+            self._cache_detection(text, tuple(all_lots_by_strategy), merged_lots)
+            return self._record_merged_detection(merged_lots, len(all_lots_by_strategy), start_time)
             
         except Exception as e:
             logger.error(f"Erreur lors de la détection des lots: {e}")
             return []
     
+    def _record_merged_detection(self, merged_lots: List[LotInfo], strategy_count: int,
+                                 start_time: float) -> List[LotInfo]:
+        """Met à jour les métriques et journalise le résultat d'une détection fusionnée"""
+        if merged_lots:
+            # Mettre à jour le temps moyen de détection
+            detection_time = time.time() - start_time
+            self.performance_metrics['average_detection_time'] = (
+                (self.performance_metrics['average_detection_time'] * 
+                 (self.performance_metrics['total_detections'] - 1) + detection_time) /
+                self.performance_metrics['total_detections']
+            )
+            
+            logger.info("✅ Fusion: %s lots uniques détectés depuis %s stratégies", len(merged_lots), strategy_count)
+            self.performance_metrics['successful_detections'] += 1
+            return merged_lots
+        
+        logger.warning("⚠️ Aucune stratégie n'a réussi à détecter des lots")
+        return []
+    
+    def _cache_detection(self, text: str, strategy_names: Tuple[str, ...], lots: List[LotInfo]):
+        """Mémorise une détection (copies des lots : l'appelant peut modifier les siens)"""
+        entry = (strategy_names, tuple(replace(lot) for lot in lots))
+        with self._DETECTION_CACHE_LOCK:
+            cache = self._DETECTION_CACHE
+            if len(cache) >= self.DETECTION_CACHE_SIZE:
+                # Évincer la plus ancienne entrée (ordre d'insertion du dict)
+                cache.pop(next(iter(cache)), None)
+            cache[text] = entry
+    
+    @classmethod
+    def clear_detection_cache(cls):
+        """Vide le cache des détections partagé entre instances"""
+        with cls._DETECTION_CACHE_LOCK:
+            cls._DETECTION_CACHE.clear()
+    
     def _merge_lots_from_all_strategies(self, all_lots_by_strategy: Dict[str, List[LotInfo]]) -> List[LotInfo]:
         """
         Fusionne intelligemment les lots détectés par toutes les stratégies
@@ -1243,7 +1452,7 @@ class LotDetector:
                 continue
             
             lots = all_lots_by_strategy[strategy_name]
-            logger.debug(f"🔗 Fusion depuis {strategy_name}: {len(lots)} lots")
+            logger.debug("🔗 Fusion depuis %s: %s lots", strategy_name, len(lots))
             
             for lot in lots:
                 numero = lot.numero
@@ -1251,7 +1460,7 @@ class LotDetector:
                 # Si le lot n'existe pas encore, l'ajouter
                 if numero not in merged_lots:
                     merged_lots[numero] = lot
-                    logger.debug(f"  ➕ Lot {numero} ajouté depuis {strategy_name}")
+                    logger.debug("  ➕ Lot %s ajouté depuis %s", numero, strategy_name)
                 else:
                     # Le lot existe déjà, améliorer les données si possible
                     existing_lot = merged_lots[numero]
@@ -1259,25 +1468,25 @@ class LotDetector:
                     # Préférer un intitulé plus long (plus complet)
                     if len(lot.intitule) > len(existing_lot.intitule) and lot.intitule:
                         existing_lot.intitule = lot.intitule
-                        logger.debug(f"  ✏️ Lot {numero}: intitulé amélioré depuis {strategy_name}")
+                        logger.debug("  ✏️ Lot %s: intitulé amélioré depuis %s", numero, strategy_name)
                     
                     # Préférer des montants si non présents
                     if (existing_lot.montant_estime == 0 and lot.montant_estime > 0):
                         existing_lot.montant_estime = lot.montant_estime
-                        logger.debug(f"  💰 Lot {numero}: montant estimé ajouté depuis {strategy_name}")
+                        logger.debug("  💰 Lot %s: montant estimé ajouté depuis %s", numero, strategy_name)
                     
                     if (existing_lot.montant_maximum == 0 and lot.montant_maximum > 0):
                         existing_lot.montant_maximum = lot.montant_maximum
-                        logger.debug(f"  💰 Lot {numero}: montant maximum ajouté depuis {strategy_name}")
+                        logger.debug("  💰 Lot %s: montant maximum ajouté depuis %s", numero, strategy_name)
                     
                     # Combiner les sources
                     if strategy_name not in existing_lot.source:
                         existing_lot.source += f",{strategy_name}"
         
         # Convertir le dictionnaire en liste triée par numéro
-        result = sorted(merged_lots.values(), key=lambda l: l.numero)
+        result = [merged_lots[numero] for numero in sorted(merged_lots)]
         
-        logger.info(f"🔗 Fusion terminée: {len(result)} lots uniques (sur {sum(len(lots) for lots in all_lots_by_strategy.values())} détections totales)")
+        logger.info("🔗 Fusion terminée: %s lots uniques (sur %s détections totales)", len(result), sum(len(lots) for lots in all_lots_by_strategy.values()))
         
         return result
     
@@ -1325,42 +1534,46 @@ class LotDetector:
         Returns:
             True si la mise à jour a réussi, False sinon
         """
+        for lot in lots:
+            if lot.numero == lot_numero:
+                return self._apply_lot_updates(lot, lot_numero, updates)
+        
+        logger.warning(f"⚠️ Lot {lot_numero} non trouvé dans la liste")
+        return False
+    
+    def _apply_lot_updates(self, lot: LotInfo, lot_numero: int, updates: Dict[str, Any]) -> bool:
+        """Applique les champs de mise à jour à un lot (True si la mise à jour a réussi)"""
         try:
-            for lot in lots:
-                if lot.numero == lot_numero:
-                    # Mettre à jour les champs disponibles
-                    if 'intitule' in updates:
-                        lot.intitule = str(updates['intitule'])
-                    if 'montant_estime' in updates:
-                        lot.montant_estime = float(updates['montant_estime']) if updates['montant_estime'] else 0.0
-                    if 'montant_maximum' in updates:
-                        lot.montant_maximum = float(updates['montant_maximum']) if updates['montant_maximum'] else 0.0
-                    if 'quantite_minimum' in updates:
-                        lot.quantite_minimum = int(updates['quantite_minimum']) if updates['quantite_minimum'] else 0
-                    if 'quantites_estimees' in updates:
-                        lot.quantites_estimees = str(updates['quantites_estimees'])
-                    if 'quantite_maximum' in updates:
-                        lot.quantite_maximum = int(updates['quantite_maximum']) if updates['quantite_maximum'] else 0
-                    if 'criteres_economique' in updates:
-                        lot.criteres_economique = str(updates['criteres_economique'])
-                    if 'criteres_techniques' in updates:
-                        lot.criteres_techniques = str(updates['criteres_techniques'])
-                    if 'autres_criteres' in updates:
-                        lot.autres_criteres = str(updates['autres_criteres'])
-                    if 'rse' in updates:
-                        lot.rse = str(updates['rse'])
-                    if 'contribution_fournisseur' in updates:
-                        lot.contribution_fournisseur = str(updates['contribution_fournisseur'])
-                    if 'source' in updates:
-                        lot.source = str(updates['source'])
-                    if 'confidence' in updates:
-                        lot.confidence = float(updates['confidence']) if updates['confidence'] else 1.0
-                    
-                    logger.debug(f"✅ Lot {lot_numero} mis à jour avec succès")
-                    return True
+            # Mettre à jour les champs disponibles
+            if 'intitule' in updates:
+                lot.intitule = str(updates['intitule'])
+            if 'montant_estime' in updates:
+                lot.montant_estime = float(updates['montant_estime']) if updates['montant_estime'] else 0.0
+            if 'montant_maximum' in updates:
+                lot.montant_maximum = float(updates['montant_maximum']) if updates['montant_maximum'] else 0.0
+            if 'quantite_minimum' in updates:
+                lot.quantite_minimum = int(updates['quantite_minimum']) if updates['quantite_minimum'] else 0
+            if 'quantites_estimees' in updates:
+                lot.quantites_estimees = str(updates['quantites_estimees'])
+            if 'quantite_maximum' in updates:
+                lot.quantite_maximum = int(updates['quantite_maximum']) if updates['quantite_maximum'] else 0
+            if 'criteres_economique' in updates:
+                lot.criteres_economique = str(updates['criteres_economique'])
+            if 'criteres_techniques' in updates:
+                lot.criteres_techniques = str(updates['criteres_techniques'])
+            if 'autres_criteres' in updates:
+                lot.autres_criteres = str(updates['autres_criteres'])
+            if 'rse' in updates:
+                lot.rse = str(updates['rse'])
+            if 'contribution_fournisseur' in updates:
+                lot.contribution_fournisseur = str(updates['contribution_fournisseur'])
+            if 'source' in updates:
+                lot.source = str(updates['source'])
+            if 'confidence' in updates:
+                lot.confidence = float(updates['confidence']) if updates['confidence'] else 1.0
             
-            logger.warning(f"⚠️ Lot {lot_numero} non trouvé dans la liste")
-            return False
+            logger.debug("✅ Lot %s mis à jour avec succès", lot_numero)
+            return True
             
         except Exception as e:
             logger.error(f"❌ Erreur lors de la mise à jour du lot {lot_numero}: {e}")
@@ -1377,12 +1590,22 @@ class LotDetector:
         Returns:
             Nombre de lots mis à jour avec succès
         """
+        # Index numéro -> premier lot portant ce numéro (comme update_lot),
+        # construit une fois au lieu d'un parcours de la liste par mise à jour
+        lots_by_numero = {}
+        for lot in lots:
+            lots_by_numero.setdefault(lot.numero, lot)
+        
         updated_count = 0
         for lot_numero, updates in updates_dict.items():
-            if self.update_lot(lots, lot_numero, updates):
+            lot = lots_by_numero.get(lot_numero)
+            if lot is None:
+                logger.warning(f"⚠️ Lot {lot_numero} non trouvé dans la liste")
+                continue
+            if self._apply_lot_updates(lot, lot_numero, updates):
                 updated_count += 1
         
-        logger.info(f"✅ {updated_count}/{len(updates_dict)} lots mis à jour")
+        logger.info("✅ %s/%s lots mis à jour", updated_count, len(updates_dict))
         return updated_count
     
     def convert_lot_to_dict(self, lot: LotInfo) -> Dict[str, Any]:
@@ -1395,22 +1618,7 @@ class LotDetector:
         Returns:
             Dictionnaire avec toutes les données du lot
         """
-        return {
-            'numero': lot.numero,
-            'intitule': lot.intitule,
-            'montant_estime': lot.montant_estime,
-            'montant_maximum': lot.montant_maximum,
-            'quantite_minimum': lot.quantite_minimum,
-            'quantites_estimees': lot.quantites_estimees,
-            'quantite_maximum': lot.quantite_maximum,
-            'criteres_economique': lot.criteres_economique,
-            'criteres_techniques': lot.criteres_techniques,
-            'autres_criteres': lot.autres_criteres,
-            'rse': lot.rse,
-            'contribution_fournisseur': lot.contribution_fournisseur,
-            'source': lot.source,
-            'confidence': lot.confidence
-        }
+        return asdict(lot)
     
     def convert_dict_to_lot(self, lot_dict: Dict[str, Any]) -> LotInfo:
         """
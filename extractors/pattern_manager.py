@@ -15,6 +15,36 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Options de compilation communes à tous les patterns d'extraction
+_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+def _uses_dot(pattern: str) -> bool:
+    """Indique si le pattern contient un '.' métacaractère (hors échappement et classes)"""
+    escaped = False
+    in_class = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '.':
+            return True
+    return False
+
+
+@lru_cache(maxsize=256)
+def _compile_shared(pattern: str) -> re.Pattern:
+    """Compile un pattern une seule fois pour toutes les instances (lève re.error)"""
+    # DOTALL n'a d'effet que sur '.', inutile de l'activer pour les autres patterns
+    flags = _PATTERN_FLAGS | re.DOTALL if _uses_dot(pattern) else _PATTERN_FLAGS
+    return re.compile(pattern, flags)
+
+
 class PatternManager:
     """Gestionnaire centralisé des patterns d'extraction"""
     
@@ -57,7 +87,7 @@ class PatternManager:
                 ],
                 'maxi': [
                     # Patterns avec contexte de maximum/plafond
-                    r'(?:maximum|maxi|plafond|limite|seuil|seuil)[\s\w]*(?:budgetaire|budgetaire|global|total|montant)[\s\w]*[:\s]*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?|HT|TTC)',
+                    r'(?:maximum|maxi|plafond|limite|seuil)[\s\w]*(?:budgetaire|global|total|montant)[\s\w]*[:\s]*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?|HT|TTC)',
                     r'(?:budget|montant|prix|coût|cout)[\s\w]*(?:maximum|maxi|plafond|limite|seuil)[\s\w]*[:\s]*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)',
                     r'(?:enveloppe|allocation|dotation)[\s\w]*(?:maximum|maxi|plafond|limite)[\s\w]*[:\s]*(\d{1,3}(?:[.,\s]\d{3})*(?:[.,]\d{2})?)\s*(?:€|euros?)',
                     # Patterns avec unités
@@ -109,12 +139,12 @@ class PatternManager:
             'references': {
                 'procedure': [
                     # Patterns spécifiques aux formats RESAH/UGAP
-                    r'(?:ref|réf|référence|code|identifiant|identifiant|numéro|numero|no)[\s\w]*[:\s]*(\d{4}-[A-Z]\d{3})',
-                    r'(?:ao|marché|marche|contrat|prestation)[\s\w]*(?:ref|réf|référence|code|identifiant|identifiant|numéro|numero|no)[\s\w]*[:\s]*(\d{4}-[A-Z]\d{3})',
+                    r'(?:ref|réf|référence|code|identifiant|numéro|numero|no)[\s\w]*[:\s]*(\d{4}-[A-Z]\d{3})',
+                    r'(?:ao|marché|marche|contrat|prestation)[\s\w]*(?:ref|réf|référence|code|identifiant|numéro|numero|no)[\s\w]*[:\s]*(\d{4}-[A-Z]\d{3})',
                     r'(\d{4}-[A-Z]\d{3})',  # Format direct 2024-R001
                     r'(\d{4}-[A-Z]\d{3}-\d{3}-\d{3})',  # Format complet 2024-R001-000-000
                     # Patterns génériques
-                    r'(?:ref|réf|référence|code|identifiant|identifiant|numéro|numero|no)[\s\w]*(?:procédure|procedure|ao|marché|marche|contrat|prestation)[\s\w]*[:\s]*([A-Z0-9\-_]+)',
+                    r'(?:ref|réf|référence|code|identifiant|numéro|numero|no)[\s\w]*(?:procédure|procedure|ao|marché|marche|contrat|prestation)[\s\w]*[:\s]*([A-Z0-9\-_]+)',
                     r'([A-Z]{2,}\d{4,})',  # Pattern pour codes comme AO2024001
                     r'([A-Z]{2,}-\d{4,})',  # Pattern pour codes comme AO-2024-001
                     r'([A-Z]{2,}_\d{4,})',  # Pattern pour codes comme AO_2024_001
@@ -196,25 +226,24 @@ class PatternManager:
                 ],
                 'lot_numero': [
                     # Patterns avec contexte de lot
-                    r'(?:lot|lot)[\s\w]*(?:n°|numero|numéro|no)[\s\w]*[:\s]*(\d+)',
-                    r'(?:lot|lot)[\s\w]*[:\s]*(\d+)',
+                    r'(?:lot)[\s\w]*(?:n°|numero|numéro|no)[\s\w]*[:\s]*(\d+)',
+                    r'(?:lot)[\s\w]*[:\s]*(\d+)',
                     r'lot[\s\w]*(\d+)',
                     # Patterns avec contexte de marché
-                    r'(?:marché|marche|contrat|prestation)[\s\w]*(?:lot|lot)[\s\w]*(?:n°|numero|numéro|no)[\s\w]*[:\s]*(\d+)',
+                    r'(?:marché|marche|contrat|prestation)[\s\w]*(?:lot)[\s\w]*(?:n°|numero|numéro|no)[\s\w]*[:\s]*(\d+)',
                     # Patterns génériques
-                    r'(\d+)[\s\w]*(?:lot|lot)'
+                    r'(\d+)[\s\w]*(?:lot)'
                 ],
                 'intitule_lot': [
                     # Patterns avec contexte de lot
-                    r'(?:intitulé|intitule|titre|objet|libellé|libelle)[\s\w]*(?:lot|lot)[\s\w]*[:\s]*([^,\n]{5,200})',
-                    r'(?:lot|lot)[\s\w]*[:\s]*([^,\n]{5,200})',
+                    r'(?:intitulé|intitule|titre|objet|libellé|libelle)[\s\w]*(?:lot)[\s\w]*[:\s]*([^,\n]{5,200})',
+                    r'(?:lot)[\s\w]*[:\s]*([^,\n]{5,200})',
                     # Patterns spécifiques aux formations
                     r'(?:réalisation|realisation)[\s\w]*(?:prestations|prestation)[\s\w]*(?:formations|formation)[\s\w]*(?:transverses|transverse|santé|sante|soins)[\s\w]*[:\s]*([^,\n]{5,200})',
                     # Patterns génériques
                     r'(?:intitulé|intitule|titre|objet|libellé|libelle)[\s\w]*[:\s]*([^,\n]{5,200})',
                     # Patterns spécifiques aux tableaux de lots
-                    r'(?:^|\n)\d+\s+([A-Z][A-Z\s/]+?)\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*\s*(?:\n|$)',
-                    r'(?:^|\n)\d+\s+([A-Z][A-Z\s/\n]+?)\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*\s*(?:\n|$)'
+                    r'(?:^|\n)\d+\s+([A-Z][A-Z\s/](?:[A-Z/]|\s++)*?)\s+\d{1,3}(?:\s\d{3})*\s+\d{1,3}(?:\s\d{3})*\s*(?:\n|$)'
                 ]
             },
             'criteres': {
@@ -226,12 +255,12 @@ class PatternManager:
                     r'(?:lot\s*\d+[^\n]*)?(?:économique|prix|coût|cout)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*points?)',
                     r'(?:critères?\s+d[\'"]attribution[^\n]*)?(?:économique|prix|coût|cout)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*points?)',
                     # Patterns spécifiques aux pourcentages
-                    r'(?:critères|critères|critères)[\s\w]*(?:économique|economique|prix|coût|cout|attribution)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
-                    r'(?:prix|coût|cout|économique|economique)[\s\w]*(?:critères|critères)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
+                    r'(?:critères)[\s\w]*(?:économique|economique|prix|coût|cout|attribution)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
+                    r'(?:prix|coût|cout|économique|economique)[\s\w]*(?:critères)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
                     r'(\d+(?:[.,]\d+)?\s*%)',  # Format direct 40%
                     # Patterns génériques
-                    r'(?:critères|critères|critères)[\s\w]*(?:économique|economique|prix|coût|cout|attribution)[\s\w]*[:\s]*([^,\n]{5,200})',
-                    r'(?:prix|coût|cout|économique|economique)[\s\w]*(?:critères|critères)[\s\w]*[:\s]*([^,\n]{5,200})'
+                    r'(?:critères)[\s\w]*(?:économique|economique|prix|coût|cout|attribution)[\s\w]*[:\s]*([^,\n]{5,200})',
+                    r'(?:prix|coût|cout|économique|economique)[\s\w]*(?:critères)[\s\w]*[:\s]*([^,\n]{5,200})'
                 ],
                 'techniques': [
                     # Patterns spécifiques aux tableaux de critères
@@ -241,12 +270,12 @@ class PatternManager:
                     r'(?:lot\s*\d+[^\n]*)?(?:technique|qualité|qualite)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*points?)',
                     r'(?:critères?\s+d[\'"]attribution[^\n]*)?(?:technique|qualité|qualite)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*points?)',
                     # Patterns spécifiques aux pourcentages
-                    r'(?:critères|critères|critères)[\s\w]*(?:techniques|technique|attribution)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
-                    r'(?:techniques|technique)[\s\w]*(?:critères|critères)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
+                    r'(?:critères)[\s\w]*(?:techniques|technique|attribution)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
+                    r'(?:techniques|technique)[\s\w]*(?:critères)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
                     r'(\d+(?:[.,]\d+)?\s*%)',  # Format direct 35%
                     # Patterns génériques
-                    r'(?:critères|critères|critères)[\s\w]*(?:techniques|technique|attribution)[\s\w]*[:\s]*([^,\n]{5,200})',
-                    r'(?:techniques|technique)[\s\w]*(?:critères|critères)[\s\w]*[:\s]*([^,\n]{5,200})'
+                    r'(?:critères)[\s\w]*(?:techniques|technique|attribution)[\s\w]*[:\s]*([^,\n]{5,200})',
+                    r'(?:techniques|technique)[\s\w]*(?:critères)[\s\w]*[:\s]*([^,\n]{5,200})'
                 ],
                 'autres': [
                     # Patterns spécifiques aux tableaux de critères
@@ -256,12 +285,12 @@ class PatternManager:
                     r'(?:lot\s*\d+[^\n]*)?(?:autre|autres|innovation|rse|environnement)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*points?)',
                     r'(?:critères?\s+d[\'"]attribution[^\n]*)?(?:autre|autres|innovation|rse|environnement)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*points?)',
                     # Patterns spécifiques aux pourcentages
-                    r'(?:autres|autres)[\s\w]*(?:critères|critères|attribution)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
-                    r'(?:critères|critères)[\s\w]*(?:autres|autres)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
+                    r'(?:autres)[\s\w]*(?:critères|attribution)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
+                    r'(?:critères)[\s\w]*(?:autres)[\s\w]*[:\s]*(\d+(?:[.,]\d+)?\s*%)',
                     r'(\d+(?:[.,]\d+)?\s*%)',  # Format direct 15%
                     # Patterns génériques
-                    r'(?:autres|autres)[\s\w]*(?:critères|critères|attribution)[\s\w]*[:\s]*([^,\n]{5,200})',
-                    r'(?:critères|critères)[\s\w]*(?:autres|autres)[\s\w]*[:\s]*([^,\n]{5,200})'
+                    r'(?:autres)[\s\w]*(?:critères|attribution)[\s\w]*[:\s]*([^,\n]{5,200})',
+                    r'(?:critères)[\s\w]*(?:autres)[\s\w]*[:\s]*([^,\n]{5,200})'
                 ]
             },
             'quantites': {
@@ -530,7 +559,7 @@ class PatternManager:
             return self.compiled_patterns[pattern]
         
         try:
-            compiled = re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+            compiled = _compile_shared(pattern)
             self.compiled_patterns[pattern] = compiled
             self.performance_stats['total_compilations'] += 1
             return compiled
@@ -7,20 +7,88 @@ Utilise le détecteur de lots et les patterns modulaires.
 """
 
 import logging
+import os
 import re
+import tempfile
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from io import BytesIO
-from typing import Dict, Any, List, Optional
+from pickle import PicklingError
+from typing import Dict, Any, List, Optional, Tuple
 from .base_extractor import BaseExtractor
 from .pattern_manager import PatternManager
-from .lot_detector import LotDetector, LotInfo
+from .lot_detector import LotDetector, LotInfo, _find_lot_context, _index_lot_headers
 from .validation_engine import ValidationEngine
 
 logger = logging.getLogger(__name__)
 
+# Groupe final des patterns de critères en pourcentage ('40 %', '12,5%')
+_PERCENT_GROUP = r'(\d+(?:[.,]\d+)?\s*%)'
+
+# Lignes à ignorer lors de la recherche du titre (dates, références type '2024-R001')
+_DATE_LINE_RE = re.compile(r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+_REFERENCE_LINE_RE = re.compile(r'^\d{4}-[A-Z]\d{3}')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Séparateurs génériques de fin de section pour _split_into_sections
+_SECTION_STOPS = ("\n\n", "\narticle", "\nsection", "\nchapitre", "\nannexe", "\nlot ")
+
+
+@lru_cache(maxsize=512)
+def _requires_percent(pattern: str) -> bool:
+    """
+    Indique si un pattern ne peut correspondre qu'à un texte contenant '%'
+    
+    Vrai quand le pattern se termine par le groupe pourcentage et ne contient
+    pas d'alternative '|' de premier niveau (hors groupes et classes).
+    """
+    if not pattern.endswith(_PERCENT_GROUP):
+        return False
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return False
+    return True
+
+
+# Extracteur propre à chaque processus du pool d'analyse de batch_extract_from_pdfs
+_batch_worker_extractor = None
+
+
+def _init_batch_worker(pattern_manager: PatternManager, validation_engine: ValidationEngine) -> None:
+    """Initialise l'extracteur du processus (une fois par processus du pool)"""
+    global _batch_worker_extractor
+    _batch_worker_extractor = PDFExtractor(pattern_manager, validation_engine)
+
+
+def _extract_in_batch_worker(text: str) -> List[Dict[str, Any]]:
+    """Extrait les données d'un texte dans un processus du pool"""
+    return _batch_worker_extractor.extract(text)
+
+
 class PDFExtractor(BaseExtractor):
     """Extracteur spécialisé pour les documents PDF"""
     
+    # Résolution de rendu pour l'OCR : la précision de Tesseract plafonne vers
+    # 200 DPI pour des documents texte (RC, CCTP), 300 DPI coûte 2,25x plus de pixels
+    OCR_DPI = 200
+    
     def __init__(self, pattern_manager: PatternManager = None, validation_engine: ValidationEngine = None):
         """
         Initialise l'extracteur PDF
@@ -33,6 +101,8 @@ class PDFExtractor(BaseExtractor):
         self.lot_detector = LotDetector()
         self.pattern_manager = pattern_manager or PatternManager()
         self.validation_engine = validation_engine or ValidationEngine()
+        # Critères déjà extraits pour le dernier texte : (texte, {numero_lot: critères})
+        self._criteres_lot_cache = None
     
     def extract(self, source: Any, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -47,6 +117,8 @@ class PDFExtractor(BaseExtractor):
         """
         try:
             logger.info("📄 Début de l'extraction PDF...")
+            # Les patterns ont pu être modifiés depuis la dernière extraction
+            self._criteres_lot_cache = None
             
             # Extraire le texte du PDF
             text_content = self._extract_text_from_pdf(source)
@@ -76,6 +148,90 @@ class PDFExtractor(BaseExtractor):
                 'error_details': str(e)
             }]
     
+    def batch_extract_from_pdfs(self, pdf_paths: List[str],
+                                max_workers: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Extrait les données de plusieurs fichiers PDF
+        
+        Les PDFs sans couche texte sont regroupés et passés à Tesseract en une
+        seule invocation (mode liste d'images) : le modèle n'est chargé qu'une
+        fois pour toutes les pages de tous les documents scannés du lot.
+        L'analyse des textes (regex, pur Python) est ensuite répartie sur
+        plusieurs processus, le GIL empêchant tout gain avec des threads.
+        
+        Args:
+            pdf_paths: Chemins des fichiers PDF
+            max_workers: Nombre de processus d'analyse (défaut : nombre de CPU)
+            
+        Returns:
+            Liste des données extraites, une entrée par fichier (dans l'ordre)
+        """
+        # Un seul fichier : rien à mutualiser, chemin classique
+        if len(pdf_paths) <= 1:
+            results = []
+            for path in pdf_paths:
+                with open(path, 'rb') as f:
+                    results.append(self.extract(f))
+            return results
+        
+        pdf_contents = []
+        texts = []
+        for path in pdf_paths:
+            try:
+                with open(path, 'rb') as f:
+                    pdf_bytes = f.read()
+            except OSError as e:
+                logger.error(f"Erreur lecture fichier {path}: {e}")
+                pdf_bytes = b""
+            pdf_contents.append(pdf_bytes)
+            texts.append(self._extract_text_from_bytes(pdf_bytes, allow_ocr=False) if pdf_bytes else "")
+        
+        # OCR groupé des documents restés sans texte
+        scanned = [i for i, text in enumerate(texts) if not text and pdf_contents[i]]
+        if scanned:
+            ocr_texts = self._ocr_pdfs_batch([pdf_contents[i] for i in scanned])
+            for i, ocr_text in zip(scanned, ocr_texts):
+                if ocr_text and len(ocr_text.strip()) > 100:
+                    texts[i] = ocr_text
+        
+        for path, text in zip(pdf_paths, texts):
+            if not text:
+                logger.warning(f"⚠️ Aucun contenu texte extrait de {path}")
+        
+        to_extract = [text for text in texts if text]
+        extracted = self._extract_texts_in_processes(to_extract, max_workers)
+        if extracted is None:
+            extracted = [self.extract(text) for text in to_extract]
+        
+        extracted_iter = iter(extracted)
+        return [next(extracted_iter) if text else [] for text in texts]
+    
+    def _extract_texts_in_processes(self, texts: List[str],
+                                    max_workers: Optional[int] = None) -> Optional[List[List[Dict[str, Any]]]]:
+        """
+        Analyse des textes dans un pool de processus
+        
+        Chaque processus construit son propre extracteur à partir des mêmes
+        gestionnaire de patterns et moteur de validation.
+        
+        Returns:
+            Données extraites de chaque texte (dans l'ordre), ou None si le
+            traitement parallèle est inutile ou indisponible
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(texts))
+        if workers <= 1:
+            return None
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                     initargs=(self.pattern_manager, self.validation_engine)) as executor:
+                return list(executor.map(_extract_in_batch_worker, texts))
+        except (BrokenProcessPool, OSError, PicklingError) as e:
+            # Seuls le démarrage du pool et la sérialisation sont rattrapés :
+            # une erreur d'extract() dans un processus remonte telle quelle
+            logger.debug(f"Analyse parallèle indisponible, traitement séquentiel: {e}")
+            return None
+    
     def _extract_text_from_pdf(self, source: Any) -> str:
         """
         Extrait le texte d'un PDF
@@ -142,17 +298,22 @@ class PDFExtractor(BaseExtractor):
             )
             return ""
     
-    def _extract_text_from_bytes(self, pdf_bytes: bytes) -> str:
+    def _extract_text_from_bytes(self, pdf_bytes: bytes, allow_ocr: bool = True) -> str:
         """
         Extrait le texte depuis des bytes PDF avec support OCR pour PDFs scannés
         
         Args:
             pdf_bytes: Contenu PDF en bytes
+            allow_ocr: Recourir à l'OCR si aucune couche texte n'est exploitable
             
         Returns:
             Texte extrait
         """
         try:
+            # PDF sans couche texte (scanné) : pdfplumber et PyMuPDF ne trouveraient
+            # rien de plus que PyPDF2, on passe directement à l'OCR
+            scanned_pdf = False
+            
             # Essayer d'abord avec PyPDF2
             try:
                 import PyPDF2
@@ -160,60 +321,79 @@ class PDFExtractor(BaseExtractor):
                 pdf_file = BytesIO(pdf_bytes)
                 pdf_reader = PyPDF2.PdfReader(pdf_file)
                 
-                text = ""
+                # Accumuler les pages dans une liste puis joindre (coût linéaire)
+                parts = []
                 for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                    parts.append(page.extract_text())
+                    parts.append("\n")
+                text = "".join(parts)
                 
                 if text.strip() and len(text.strip()) > 100:
                     logger.info("✅ Texte extrait avec PyPDF2")
                     return text
+                
+                # Plusieurs pages, quasiment aucun caractère alphanumérique et aucune
+                # police déclarée : document scanné
+                if (len(pdf_reader.pages) > 1
+                        and sum(1 for ch in text if ch.isalnum()) < 100
+                        and not self._pdf_has_fonts(pdf_reader)):
+                    scanned_pdf = True
+                    logger.info("📷 PDF scanné détecté (aucune couche texte), passage direct à l'OCR")
                     
             except ImportError:
                 logger.warning("PyPDF2 non disponible")
             except Exception as e:
                 logger.warning(f"Erreur PyPDF2: {e}")
             
-            # Essayer avec pdfplumber
-            try:
-                import pdfplumber
-                
-                with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                
-                if text.strip() and len(text.strip()) > 100:
-                    logger.info("✅ Texte extrait avec pdfplumber")
-                    return text
+            if not scanned_pdf:
+                # Essayer avec pdfplumber
+                try:
+                    import pdfplumber
                     
-            except ImportError:
-                logger.warning("pdfplumber non disponible")
-            except Exception as e:
-                logger.warning(f"Erreur pdfplumber: {e}")
+                    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+                        parts = []
+                        for page in pdf.pages:
+                            page_text = page.extract_text()
+                            if page_text:
+                                parts.append(page_text)
+                                parts.append("\n")
+                    text = "".join(parts)
+                    
+                    if text.strip() and len(text.strip()) > 100:
+                        logger.info("✅ Texte extrait avec pdfplumber")
+                        return text
+                        
+                except ImportError:
+                    logger.warning("pdfplumber non disponible")
+                except Exception as e:
+                    logger.warning(f"Erreur pdfplumber: {e}")
             
-            # Essayer avec pymupdf
-            try:
-                import fitz  # PyMuPDF
-                
-                pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-                text = ""
-                
-                for page_num in range(pdf_document.page_count):
-                    page = pdf_document[page_num]
-                    text += page.get_text() + "\n"
-                
-                pdf_document.close()
-                
-                if text.strip() and len(text.strip()) > 100:
-                    logger.info("✅ Texte extrait avec PyMuPDF")
-                    return text
+                # Essayer avec pymupdf
+                try:
+                    import fitz  # PyMuPDF
                     
-            except ImportError:
-                logger.warning("PyMuPDF non disponible")
-            except Exception as e:
-                logger.warning(f"Erreur PyMuPDF: {e}")
+                    pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+                    parts = []
+                    
+                    for page_num in range(pdf_document.page_count):
+                        page = pdf_document[page_num]
+                        parts.append(page.get_text())
+                        parts.append("\n")
+                    
+                    pdf_document.close()
+                    text = "".join(parts)
+                    
+                    if text.strip() and len(text.strip()) > 100:
+                        logger.info("✅ Texte extrait avec PyMuPDF")
+                        return text
+                        
+                except ImportError:
+                    logger.warning("PyMuPDF non disponible")
+                except Exception as e:
+                    logger.warning(f"Erreur PyMuPDF: {e}")
+            
+            if not allow_ocr:
+                return ""
             
             # Si peu ou pas de texte, essayer OCR (PDF scanné)
             text = self._extract_text_with_ocr(pdf_bytes)
@@ -228,6 +408,28 @@ class PDFExtractor(BaseExtractor):
             logger.error(f"Erreur extraction texte depuis bytes: {e}")
             return ""
     
+    def _pdf_has_fonts(self, pdf_reader: Any) -> bool:
+        """
+        Indique si au moins une page du PDF déclare des polices (couche texte)
+        
+        Args:
+            pdf_reader: Lecteur PyPDF2 déjà ouvert
+            
+        Returns:
+            True si une page référence des polices, False sinon
+        """
+        for page in pdf_reader.pages:
+            try:
+                resources = page.get('/Resources')
+                if resources is not None:
+                    resources = resources.get_object()
+                    if '/Font' in resources:
+                        return True
+            except Exception:
+                # Dans le doute, ne pas court-circuiter les autres extracteurs
+                return True
+        return False
+    
     def _extract_text_with_ocr(self, pdf_bytes: bytes) -> str:
         """
         Extrait le texte d'un PDF scanné avec OCR
@@ -239,23 +441,40 @@ class PDFExtractor(BaseExtractor):
             Texte extrait via OCR
         """
         try:
-            # Essayer avec pytesseract
+            # Essayer avec Tesseract (tesserocr en priorité, sinon pytesseract)
             try:
-                import pytesseract
-                from pdf2image import convert_from_bytes
+                from pdf2image import pdfinfo_from_bytes
                 
-                # Convertir le PDF en images
-                images = convert_from_bytes(pdf_bytes, dpi=300)
+                # Les pages sont rendues une par une dans les workers OCR : le rendu
+                # est parallélisé et seules max_workers pages sont en mémoire à la fois
+                page_count = int(pdfinfo_from_bytes(pdf_bytes).get('Pages', 0))
+                page_numbers = list(range(1, page_count + 1))
                 
-                ocr_text = ""
-                for img in images:
-                    # Extraire le texte avec OCR (français)
-                    page_text = pytesseract.image_to_string(img, lang='fra')
-                    if page_text:
-                        ocr_text += page_text + "\n"
+                # OCR des pages en parallèle (l'ordre des pages est conservé)
+                max_workers = max(1, min(page_count, os.cpu_count() or 1))
+                try:
+                    # API in-process : le modèle LSTM est chargé une fois par worker
+                    # au lieu d'un processus tesseract + chargement par page
+                    page_texts = self._ocr_pages_with_tesserocr(pdf_bytes, page_numbers, max_workers)
+                    engine = 'tesserocr'
+                except (ImportError, RuntimeError) as e:
+                    logger.debug("tesserocr indisponible (%s), repli sur pytesseract", e)
+                    import pytesseract
+                    
+                    def ocr_page(page_number: int) -> str:
+                        img = self._render_ocr_page(pdf_bytes, page_number)
+                        return pytesseract.image_to_string(img, lang='fra') if img is not None else ""
+                    
+                    # pytesseract lance un processus tesseract par appel, des threads
+                    # suffisent donc à occuper tous les cœurs
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        page_texts = list(executor.map(ocr_page, page_numbers))
+                    engine = 'pytesseract'
+                
+                ocr_text = "".join(page_text + "\n" for page_text in page_texts if page_text)
                 
                 if ocr_text.strip():
-                    logger.info(f"✅ OCR pytesseract: {len(ocr_text)} caractères extraits")
+                    logger.info(f"✅ OCR {engine}: {len(ocr_text)} caractères extraits")
                     return ocr_text
                     
             except ImportError:
@@ -266,16 +485,19 @@ class PDFExtractor(BaseExtractor):
             # Essayer avec easyocr (alternative)
             try:
                 import easyocr
+                from pdf2image import convert_from_bytes
                 
                 reader = easyocr.Reader(['fr', 'en'])
-                images = convert_from_bytes(pdf_bytes, dpi=300)
+                images = convert_from_bytes(pdf_bytes, dpi=self.OCR_DPI)
                 
-                ocr_text = ""
+                parts = []
                 for img in images:
                     results = reader.readtext(img)
                     page_text = "\n".join([result[1] for result in results])
                     if page_text:
-                        ocr_text += page_text + "\n"
+                        parts.append(page_text)
+                        parts.append("\n")
+                ocr_text = "".join(parts)
                 
                 if ocr_text.strip():
                     logger.info(f"✅ OCR easyocr: {len(ocr_text)} caractères extraits")
@@ -292,6 +514,133 @@ class PDFExtractor(BaseExtractor):
             logger.debug(f"Erreur OCR: {e}")
             return ""
     
+    def _render_ocr_page(self, pdf_bytes: bytes, page_number: int) -> Optional[Any]:
+        """
+        Rend une seule page du PDF pour l'OCR
+        
+        Rendu en niveaux de gris directement par poppler (pdftocairo) : Tesseract
+        binarise de toute façon et l'image est trois fois plus légère qu'en RGB.
+        
+        Args:
+            pdf_bytes: Contenu PDF en bytes
+            page_number: Numéro de page (à partir de 1)
+            
+        Returns:
+            Image PIL de la page, ou None si le rendu a échoué
+        """
+        from pdf2image import convert_from_bytes
+        
+        pages = convert_from_bytes(
+            pdf_bytes,
+            dpi=self.OCR_DPI,
+            grayscale=True,
+            first_page=page_number,
+            last_page=page_number,
+            use_pdftocairo=True
+        )
+        return pages[0] if pages else None
+    
+    def _ocr_pages_with_tesserocr(self, pdf_bytes: bytes, page_numbers: List[int], max_workers: int) -> List[str]:
+        """
+        OCR des pages avec l'API in-process tesserocr
+        
+        Chaque worker ouvre une seule instance PyTessBaseAPI pour un bloc de pages
+        contiguës, ce qui évite de recharger le modèle à chaque page.
+        
+        Args:
+            pdf_bytes: Contenu PDF en bytes
+            page_numbers: Numéros des pages à traiter
+            max_workers: Nombre maximal d'instances Tesseract en parallèle
+            
+        Returns:
+            Texte de chaque page, dans l'ordre des pages
+        """
+        import tesserocr
+        
+        def ocr_chunk(chunk: List[int]) -> List[str]:
+            with tesserocr.PyTessBaseAPI(lang='fra') as api:
+                chunk_texts = []
+                for page_number in chunk:
+                    img = self._render_ocr_page(pdf_bytes, page_number)
+                    if img is None:
+                        chunk_texts.append("")
+                        continue
+                    api.SetImage(img)
+                    chunk_texts.append(api.GetUTF8Text())
+                return chunk_texts
+        
+        chunk_size = max(1, -(-len(page_numbers) // max_workers))  # division arrondie au supérieur
+        chunks = [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [text for chunk_texts in executor.map(ocr_chunk, chunks) for text in chunk_texts]
+    
+    def _ocr_pdfs_batch(self, pdf_contents: List[bytes]) -> List[str]:
+        """
+        OCR de plusieurs PDFs scannés en une seule invocation de Tesseract
+        
+        Toutes les pages sont rendues en TIFF dans un répertoire temporaire et
+        listées dans un fichier texte que Tesseract traite d'un seul tenant ; la
+        sortie est redécoupée par page sur les sauts de page (form feed).
+        En cas d'échec, chaque PDF repasse par l'OCR individuel.
+        
+        Args:
+            pdf_contents: Contenus des PDFs en bytes
+            
+        Returns:
+            Texte OCR de chaque PDF, dans l'ordre
+        """
+        try:
+            from pdf2image import convert_from_bytes
+            import pytesseract
+            
+            with tempfile.TemporaryDirectory() as tmpdir:
+                image_paths = []
+                page_counts = []
+                for index, pdf_bytes in enumerate(pdf_contents):
+                    paths = convert_from_bytes(
+                        pdf_bytes,
+                        dpi=self.OCR_DPI,
+                        grayscale=True,
+                        output_folder=tmpdir,
+                        output_file=f"pdf{index:04d}_",
+                        fmt='tiff',
+                        paths_only=True,
+                        use_pdftocairo=True
+                    )
+                    image_paths.extend(paths)
+                    page_counts.append(len(paths))
+                
+                list_path = os.path.join(tmpdir, 'imagelist.txt')
+                with open(list_path, 'w', encoding='utf-8') as f:
+                    f.write("\n".join(image_paths))
+                
+                # Un chemin vers un fichier texte est transmis tel quel à tesseract,
+                # qui le lit comme une liste d'images
+                page_texts = pytesseract.image_to_string(list_path, lang='fra').split("\f")
+            
+            if len(page_texts) < len(image_paths):
+                raise RuntimeError(
+                    f"sortie Tesseract incomplète ({len(page_texts)} pages pour {len(image_paths)} images)"
+                )
+            
+            ocr_texts = []
+            start = 0
+            for count in page_counts:
+                pages = page_texts[start:start + count]
+                ocr_texts.append("".join(page_text + "\n" for page_text in pages if page_text))
+                start += count
+            
+            logger.info(f"✅ OCR groupé: {len(image_paths)} pages de {len(pdf_contents)} PDFs")
+            return ocr_texts
+            
+        except ImportError:
+            logger.debug("pdf2image/pytesseract non disponibles pour l'OCR groupé")
+        except Exception as e:
+            logger.debug(f"Erreur OCR groupé: {e}")
+        
+        return [self._extract_text_with_ocr(pdf_bytes) for pdf_bytes in pdf_contents]
+    
     def _extract_tables_from_pdf(self, pdf_bytes: bytes) -> List[Dict[str, Any]]:
         """
         Extrait les tableaux structurés du PDF
@@ -324,7 +673,7 @@ class PDFExtractor(BaseExtractor):
                                     'columns': len(table[0]) if table else 0,
                                     'data': structured_table
                                 })
-                                logger.debug(f"📊 Tableau extrait page {page_num + 1}, table {table_index}: {len(structured_table)} entrées")
+                                logger.debug("📊 Tableau extrait page %s, table %s: %s entrées", page_num + 1, table_index, len(structured_table))
             
             if tables_data:
                 logger.info(f"✅ {len(tables_data)} tableaux structurés extraits du PDF")
@@ -441,7 +790,7 @@ class PDFExtractor(BaseExtractor):
                 lot_entry['text_source'] = text_content  # Pour l'enrichissement avec extraction_improver
                 
                 entries.append(lot_entry)
-                logger.info(f"📦 Entrée PDF créée pour le lot {lot.numero}: {lot.intitule[:50]}...")
+                logger.info("📦 Entrée PDF créée pour le lot %s: %.50s...", lot.numero, lot.intitule)
             
             logger.info(f"✅ Création des entrées PDF terminée: {len(entries)} entrées créées")
             
@@ -536,7 +885,7 @@ class PDFExtractor(BaseExtractor):
                     pattern_groups[field] = patterns
                 # Log pour les champs de dates importants
                 if field in ['date_limite', 'date_attribution', 'duree_marche', 'reconduction']:
-                    logger.debug(f"🔍 Patterns pour {field}: {len(patterns)} patterns chargés")
+                    logger.debug("🔍 Patterns pour %s: %s patterns chargés", field, len(patterns))
 
             # Extraire d'abord par sections pour réduire les faux positifs
             sections = self._split_into_sections(text_content)
@@ -544,11 +893,12 @@ class PDFExtractor(BaseExtractor):
             # Log des sections trouvées pour les dates
             for section_field in ['date_limite', 'date_attribution', 'duree_marche', 'reconduction', 'fin_sans_reconduction', 'fin_avec_reconduction']:
                 if section_field in sections:
-                    logger.info(f"📋 Section trouvée pour {section_field}: {sections[section_field][:100]}...")
+                    logger.info("📋 Section trouvée pour %s: %.100s...", section_field, sections[section_field])
                 else:
-                    logger.debug(f"⚠️ Pas de section trouvée pour {section_field}, recherche dans tout le texte")
+                    logger.debug("⚠️ Pas de section trouvée pour %s, recherche dans tout le texte", section_field)
 
             # Extraction combinée: par section (si disponible), sinon sur tout le texte
+            date_fields = ['date_limite', 'date_attribution', 'duree_marche', 'reconduction', 'fin_sans_reconduction', 'fin_avec_reconduction']
             if pattern_groups:
                 parallel_results = {}
                 for field, patterns in pattern_groups.items():
@@ -557,14 +907,17 @@ class PDFExtractor(BaseExtractor):
                         continue
                     
                     section_text = sections.get(field) or text_content
-                    # Exécuter extraction ciblée champ par champ pour passer la section
-                    values = self.extract_with_patterns(section_text, patterns, field)
+                    # Exécuter extraction ciblée champ par champ pour passer la section ;
+                    # seule la première valeur est retenue (les 3 premières sont loggées
+                    # pour les dates), inutile d'essayer les patterns suivants au-delà
+                    max_values = 3 if field in date_fields else 1
+                    values = self.extract_with_patterns(section_text, patterns, field, max_values=max_values)
                     parallel_results[field] = values
                     
                     # Log pour debug - TOUJOURS logger même si vide
-                    if field in ['date_limite', 'date_attribution', 'duree_marche', 'reconduction', 'fin_sans_reconduction', 'fin_avec_reconduction']:
+                    if field in date_fields:
                         if values:
-                            logger.info(f"✅ {field}: {values[:3]}")  # Afficher les 3 premières valeurs
+                            logger.info("✅ %s: %s", field, values[:3])  # Afficher les 3 premières valeurs
                         else:
                             logger.warning(f"❌ {field}: Aucune valeur trouvée (section: {bool(sections.get(field))}, patterns: {len(patterns)})")
                 for field, values in parallel_results.items():
@@ -588,7 +941,6 @@ class PDFExtractor(BaseExtractor):
             logger.info(f"📊 Informations générales extraites: {len(general_info)} champs")
             
             # Log explicite des dates extraites (avec liste complète des champs)
-            date_fields = ['date_limite', 'date_attribution', 'duree_marche', 'reconduction', 'fin_sans_reconduction', 'fin_avec_reconduction']
             logger.info(f"📋 Champs généraux disponibles: {list(general_info.keys())}")
             for date_field in date_fields:
                 if date_field in general_info:
@@ -614,13 +966,16 @@ class PDFExtractor(BaseExtractor):
                 if start == -1:
                     return ""
                 start_end = start + len(after)
-                next_positions = [lowered.find(u, start_end) for u in until]
-                next_positions = [p for p in next_positions if p != -1]
-                end = min(next_positions) if next_positions else len(text)
+                # Chaque séparateur n'est cherché que jusqu'au plus proche déjà
+                # trouvé : un séparateur absent ne parcourt plus tout le texte
+                end = len(text)
+                for u in until:
+                    p = lowered.find(u, start_end, end + len(u) - 1)
+                    if p != -1:
+                        end = p
                 return text[start_end:end]
 
-            # Définir des séparateurs génériques
-            stops = ["\n\n", "\narticle", "\nsection", "\nchapitre", "\nannexe", "\nlot "]
+            stops = _SECTION_STOPS
 
             # Map sections -> champs
             # IMPORTANT: Ajouter les sections pour les dates importantes
@@ -666,68 +1021,93 @@ class PDFExtractor(BaseExtractor):
         """
         criteres_par_lot = {}
         
-        try:
-            logger.info("🔍 Extraction des critères par lot...")
-            
-            # Pour chaque lot, chercher les critères dans son contexte
-            for lot in lots:
-                lot_numero = lot.numero
-                criteres_lot = {
-                    'criteres_economique': '',
-                    'criteres_techniques': '',
-                    'autres_criteres': ''
-                }
-                
-                # Chercher les critères dans le contexte du lot
-                lot_context = self._extract_lot_context(text_content, lot_numero)
-                if lot_context:
-                    # Extraire les critères depuis le contexte
-                    for critere_type in ['criteres_economique', 'criteres_techniques', 'autres_criteres']:
-                        patterns = self.pattern_manager.get_field_patterns(critere_type)
-                        if patterns:
-                            values = self.extract_with_patterns(lot_context, patterns, critere_type)
-                            if values:
-                                criteres_lot[critere_type] = values[0]
-                
-                criteres_par_lot[lot_numero] = criteres_lot
-                logger.info(f"📊 Critères lot {lot_numero}: Éco={criteres_lot['criteres_economique']}, Tech={criteres_lot['criteres_techniques']}")
-            
-        except Exception as e:
-            logger.error(f"Erreur extraction critères par lot: {e}")
+        logger.info("🔍 Extraction des critères par lot...")
+        
+        # Les patterns ne dépendent pas du lot : une seule résolution pour tous les lots
+        patterns_par_type = {
+            critere_type: self.pattern_manager.get_field_patterns(critere_type)
+            for critere_type in ('criteres_economique', 'criteres_techniques', 'autres_criteres')
+        }
+        
+        # Une seule passe sur le texte pour les en-têtes de tous les lots
+        lot_headers = _index_lot_headers(text_content)
+        
+        # Pour chaque lot, chercher les critères dans son contexte
+        for lot in lots:
+            lot_numero = lot.numero
+            if lot_numero in criteres_par_lot:
+                # Même numéro => même contexte => mêmes critères
+                continue
+            try:
+                criteres_lot = self._extract_criteres_for_lot(text_content, lot_numero, patterns_par_type, lot_headers)
+            except (re.error, ValueError, TypeError, IndexError) as e:
+                # Un lot en erreur ne doit pas priver les autres lots de leurs critères
+                logger.error("Erreur extraction critères lot %s: %s", lot_numero, e)
+                criteres_par_lot[lot_numero] = {}
+                continue
+            criteres_par_lot[lot_numero] = criteres_lot
+            logger.info("📊 Critères lot %s: Éco=%s, Tech=%s", lot_numero,
+                        criteres_lot['criteres_economique'], criteres_lot['criteres_techniques'])
         
         return criteres_par_lot
     
-    def _extract_lot_context(self, text: str, lot_numero: int) -> str:
+    def _extract_criteres_for_lot(self, text_content: str, lot_numero: int,
+                                  patterns_par_type: Dict[str, List[str]],
+                                  lot_headers: Optional[Tuple[List[Tuple[str, int]], ...]] = None) -> Dict[str, str]:
+        """
+        Extrait les critères d'attribution d'un seul lot depuis son contexte
+        
+        Les résultats sont mémorisés par numéro de lot pour le texte courant :
+        un nouvel appel pour le même lot (relance, repli) ne rescanne pas.
+        
+        Args:
+            text_content: Contenu texte du PDF
+            lot_numero: Numéro du lot
+            patterns_par_type: Patterns déjà résolus par type de critère
+            lot_headers: En-têtes de lots déjà relevés dans le texte (optionnel)
+            
+        Returns:
+            Dictionnaire des critères du lot
+        """
+        cached = self._criteres_lot_cache
+        if cached is None or not (cached[0] is text_content or cached[0] == text_content):
+            cached = self._criteres_lot_cache = (text_content, {})
+        if lot_numero in cached[1]:
+            return dict(cached[1][lot_numero])
+        
+        criteres_lot = {critere_type: '' for critere_type in patterns_par_type}
+        
+        # Chercher les critères dans le contexte du lot
+        lot_context = self._extract_lot_context(text_content, lot_numero, lot_headers)
+        if lot_context:
+            # Pré-passe unique : sans '%' dans le contexte, les patterns terminés par
+            # un pourcentage échoueraient après un parcours complet du contexte
+            has_percent = '%' in lot_context
+            for critere_type, patterns in patterns_par_type.items():
+                if not has_percent:
+                    patterns = [p for p in patterns if not _requires_percent(p)]
+                if patterns:
+                    values = self.extract_with_patterns(lot_context, patterns, critere_type, max_values=1)
+                    if values:
+                        criteres_lot[critere_type] = values[0]
+        
+        cached[1][lot_numero] = dict(criteres_lot)
+        return criteres_lot
+    
+    def _extract_lot_context(self, text: str, lot_numero: int,
+                             lot_headers: Optional[Tuple[List[Tuple[str, int]], ...]] = None) -> str:
         """
         Extrait le contexte autour d'un lot spécifique
         
         Args:
             text: Texte complet
             lot_numero: Numéro du lot
+            lot_headers: En-têtes de lots déjà relevés dans le texte (optionnel)
             
         Returns:
             Contexte du lot
         """
-        try:
-            # Chercher le lot dans le texte
-            lot_pattern = rf'lot\s*n°?\s*{lot_numero}[^\n]*\n(.*?)(?=\nlot\s*n°?\s*\d+|\n\n|$)'
-            match = re.search(lot_pattern, text, re.IGNORECASE | re.DOTALL)
-            
-            if match:
-                return match.group(1)
-            
-            # Pattern alternatif plus large
-            lot_pattern_alt = rf'lot\s*{lot_numero}[^\n]*\n(.*?)(?=\nlot\s*\d+|\n\n|$)'
-            match_alt = re.search(lot_pattern_alt, text, re.IGNORECASE | re.DOTALL)
-            
-            if match_alt:
-                return match_alt.group(1)
-            
-            return ""
-            
-        except Exception as e:
-            logger.error(f"Erreur extraction contexte lot {lot_numero}: {e}")
-            return ""
+        return _find_lot_context(text, lot_numero, lot_headers)
     
     def _get_field_type(self, field_name: str) -> str:
         """Détermine le type d'un champ pour le nettoyage"""
@@ -821,10 +1201,9 @@ class PDFExtractor(BaseExtractor):
             Titre du document ou None
         """
         try:
-            lines = text_content.split('\n')
-            
             # Prendre les 30 premières lignes (pour capturer le 2ème paragraphe aussi)
-            first_lines = lines[:30]
+            # sans découper le reste du document
+            first_lines = text_content.split('\n', 30)[:30]
             
             # Mots d'en-tête à exclure (ne sont pas le titre)
             header_keywords = [
@@ -865,12 +1244,12 @@ class PDFExtractor(BaseExtractor):
                         continue
                     
                     # Ignorer les dates et références
-                    if re.match(r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', line):
+                    if _DATE_LINE_RE.match(line):
                         if current_block:
                             break
                         i += 1
                         continue
-                    if re.match(r'^\d{4}-[A-Z]\d{3}', line):
+                    if _REFERENCE_LINE_RE.match(line):
                         if current_block:
                             break
                         i += 1
@@ -967,9 +1346,9 @@ class PDFExtractor(BaseExtractor):
                     continue
                 
                 # Ignorer les lignes qui sont des dates ou références
-                if re.match(r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', line):
+                if _DATE_LINE_RE.match(line):
                     continue
-                if re.match(r'^\d{4}-[A-Z]\d{3}', line):
+                if _REFERENCE_LINE_RE.match(line):
                     continue
                 
                 # Chercher des lignes principalement en majuscules significatives (titres longs)
@@ -1029,7 +1408,7 @@ class PDFExtractor(BaseExtractor):
             # Nettoyer le titre
             cleaned_title = best_candidate.strip()
             # Supprimer les caractères de formatage excessifs
-            cleaned_title = re.sub(r'\s+', ' ', cleaned_title)
+            cleaned_title = _WHITESPACE_RE.sub(' ', cleaned_title)
             # Limiter la longueur si vraiment trop long (garder jusqu'à 400 caractères pour phrases longues)
             if len(cleaned_title) > 400:
                 cleaned_title = cleaned_title[:400].rsplit(' ', 1)[0] + '...'
@@ -16,6 +16,9 @@ from .validation_engine import ValidationEngine
 
 logger = logging.getLogger(__name__)
 
+# Espaces multiples dans le titre du document
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class TextExtractor(BaseExtractor):
     """Extracteur spécialisé pour les documents texte"""
     
@@ -227,10 +230,9 @@ class TextExtractor(BaseExtractor):
             Titre du document ou None
         """
         try:
-            lines = text_content.split('\n')
-            
             # Prendre les 30 premières lignes (pour capturer le 2ème paragraphe aussi)
-            first_lines = lines[:30]
+            # sans découper le reste du document
+            first_lines = text_content.split('\n', 30)[:30]
             
             # Mots d'en-tête à exclure (ne sont pas le titre)
             header_keywords = [
@@ -435,7 +437,7 @@ class TextExtractor(BaseExtractor):
             # Nettoyer le titre
             cleaned_title = best_candidate.strip()
             # Supprimer les caractères de formatage excessifs
-            cleaned_title = re.sub(r'\s+', ' ', cleaned_title)
+            cleaned_title = _WHITESPACE_RE.sub(' ', cleaned_title)
             # Limiter la longueur si vraiment trop long (garder jusqu'à 400 caractères pour phrases longues)
             if len(cleaned_title) > 400:
                 cleaned_title = cleaned_title[:400].rsplit(' ', 1)[0] + '...'
@@ -15,6 +15,11 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Nettoyage d'un montant en une passe : suppression des espaces et de '€', virgule décimale
+_MONTANT_CLEAN = str.maketrans({' ': None, ',': '.', '€': None})
+# Caractères étrangers à un montant (seuls chiffres, séparateurs et espaces sont gardés)
+_MONTANT_NON_NUMERIC_RE = re.compile(r'[^\d,.\s]')
+
 class ValidationLevel(Enum):
     """Niveaux de validation"""
     ERROR = "error"
@@ -321,9 +326,8 @@ class ValidationEngine:
                 return 0.0
             
             # Nettoyer le montant
-            cleaned = re.sub(r'[^\d,.\s€]', '', value_str)
-            cleaned = cleaned.replace('€', '').replace('euros', '').replace('euro', '')
-            cleaned = cleaned.replace(' ', '').replace(',', '.')
+            cleaned = _MONTANT_NON_NUMERIC_RE.sub('', value_str)
+            cleaned = cleaned.translate(_MONTANT_CLEAN)
             
             if not cleaned:
                 return 0.0
@@ -482,8 +486,8 @@ class ValidationEngine:
                 
                 if estime and maxi:
                     try:
-                        estime_val = float(str(estime).replace(' ', '').replace(',', '.').replace('€', ''))
-                        maxi_val = float(str(maxi).replace(' ', '').replace(',', '.').replace('€', ''))
+                        estime_val = float(str(estime).translate(_MONTANT_CLEAN))
+                        maxi_val = float(str(maxi).translate(_MONTANT_CLEAN))
                         
                         if maxi_val < estime_val:
                             result.issues.append(ValidationIssue(
@@ -655,8 +659,8 @@ class ValidationEngine:
                 corrected_data.get('montant_global_estime')):
                 try:
                     # Nettoyer et convertir les montants
-                    maxi_str = str(corrected_data['montant_global_maxi']).replace(' ', '').replace(',', '.').replace('€', '')
-                    estime_str = str(corrected_data['montant_global_estime']).replace(' ', '').replace(',', '.').replace('€', '')
+                    maxi_str = str(corrected_data['montant_global_maxi']).translate(_MONTANT_CLEAN)
+                    estime_str = str(corrected_data['montant_global_estime']).translate(_MONTANT_CLEAN)
                     
                     maxi_val = float(maxi_str) if maxi_str else 0
                     estime_val = float(estime_str) if estime_str else 0
@@ -0,0 +1,39 @@
+"""
+🧪 Tests Unitaires - AOExtractorV2
+==================================
+
+Tests pour l'extracteur principal V2.
+"""
+
+import unittest
+from ao_extractor_v2 import AOExtractorV2
+from extractors.lot_detector import LotDetector
+
+
+class TestDetectLots(unittest.TestCase):
+    """Tests pour la détection de lots exposée par AOExtractorV2"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        # Le cache des détections est partagé entre instances : repartir à vide
+        LotDetector.clear_detection_cache()
+
+    def test_detect_lots_returns_dicts(self):
+        """Test que les lots détectés sont renvoyés sous forme de dictionnaires"""
+        text = (
+            "Lot 1 : Fourniture de matériel médical\n"
+            "Lot 2 : Maintenance des équipements\n"
+        )
+        lots = AOExtractorV2().detect_lots(text)
+
+        self.assertEqual([lot['numero'] for lot in lots], [1, 2])
+        self.assertTrue(all(isinstance(lot, dict) for lot in lots))
+        self.assertIn('montant_estime', lots[0])
+
+    def test_detect_lots_without_lots(self):
+        """Test qu'un texte sans lot renvoie une liste vide"""
+        self.assertEqual(AOExtractorV2().detect_lots("Aucun allotissement."), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
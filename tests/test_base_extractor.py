@@ -0,0 +1,35 @@
+"""
+🧪 Tests Unitaires - BaseExtractor
+==================================
+
+Tests pour les fonctionnalités communes des extracteurs.
+"""
+
+import unittest
+from unittest.mock import patch
+from extractors import base_extractor
+from extractors.pdf_extractor import PDFExtractor
+
+
+@unittest.skipUnless(base_extractor.AHOCORASICK_AVAILABLE, "pyahocorasick non installé")
+class TestUniverseKeywordsAhoCorasick(unittest.TestCase):
+    """Tests de l'automate Aho-Corasick face à la recherche par sous-chaîne"""
+
+    TEXT = "fourniture de materiel biomedical et maintenance du logiciel de radiologie en saas"
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.extractor = PDFExtractor()
+
+    def test_same_keywords_as_substring_fallback(self):
+        """Test que les mots-clés trouvés sont identiques avec et sans pyahocorasick"""
+        with_automaton = self.extractor._find_universe_keywords(self.TEXT)
+        with patch.object(base_extractor, 'AHOCORASICK_AVAILABLE', False):
+            without_automaton = self.extractor._find_universe_keywords(self.TEXT)
+
+        self.assertEqual(with_automaton, without_automaton)
+        self.assertIn('biomedical', with_automaton)
+
+
+if __name__ == '__main__':
+    unittest.main()
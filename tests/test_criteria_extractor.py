@@ -0,0 +1,46 @@
+"""
+🧪 Tests Unitaires - CriteriaExtractor
+======================================
+
+Tests pour les alternations fusionnées de l'extracteur de critères.
+"""
+
+import re
+import unittest
+import criteria_extractor
+from criteria_extractor import CriteriaExtractor, _fuse_patterns
+
+
+@unittest.skipUnless(criteria_extractor.RE2_AVAILABLE, "google-re2 non installé")
+class TestFusedPatternsRe2(unittest.TestCase):
+    """Tests des alternations compilées par RE2 face au module re"""
+
+    TEXT = (
+        "Critères d'attribution\n"
+        "Prix : 40 %\n"
+        "Critère technique : 50,5%\n"
+        "Critère RSE et développement durable : 9,5 % \n"
+        "Pondération du délai de livraison 10 points\n"
+    )
+
+    def test_same_matches_as_re(self):
+        """Test que chaque alternation fusionnée donne les mêmes correspondances qu'avec re"""
+        extractor = CriteriaExtractor()
+        for category, fused in extractor.fused_patterns.items():
+            with self.subTest(category=category):
+                self.assertNotIsInstance(fused, re.Pattern)
+                expected = re.compile('|'.join(f'(?:{p.pattern})' for p in extractor.patterns[category]),
+                                      re.IGNORECASE)
+                self.assertEqual(
+                    [(m.span(), m.group(0), m.lastindex) for m in fused.finditer(self.TEXT)],
+                    [(m.span(), m.group(0), m.lastindex) for m in expected.finditer(self.TEXT)]
+                )
+
+    def test_fuse_patterns_matches_unicode_spaces(self):
+        """Test que \\s et \\d gardent leur sens Unicode une fois réécrits pour RE2"""
+        fused = _fuse_patterns([re.compile(r'(\d+)\s*%')])
+        self.assertEqual(fused.search("total \u0664\u0660\u00a0%").group(1), "\u0664\u0660")
+
+
+if __name__ == '__main__':
+    unittest.main()
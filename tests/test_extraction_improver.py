@@ -0,0 +1,152 @@
+"""
+🧪 Tests Unitaires - ExtractionImprover
+======================================
+
+Tests pour les patterns de lots de l'améliorateur d'extraction.
+"""
+
+import unittest
+from unittest.mock import patch
+import extraction_improver
+from extraction_improver import ExtractionImprover
+from tests.timing import MAX_LINEAR_GROWTH, growth_ratio
+
+
+class TestExtractionImproverLotPatterns(unittest.TestCase):
+    """Tests pour les patterns de lots (numéro, intitulé)"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.improver = ExtractionImprover()
+
+    def test_lot_numero_from_table(self):
+        """Test extraction du numéro de lot depuis le tableau des lots"""
+        text = "Lot N° Intitulé Montant\n3 FOURNITURE DE MATERIEL 100 000 200 000\n"
+        numero = self.improver._extract_lot_numero_intelligent(text, {}, {})
+        self.assertEqual(numero, 3)
+
+    @staticmethod
+    def _whitespace_run_text(length):
+        return (
+            "Lot N° Intitulé Montant\n"
+            "1 A" + " " * length + "x\n"
+            "2 FOURNITURE DE MATERIEL 100 000 200 000\n"
+        )
+
+    def _extract_lot_fields(self, text):
+        # Section des lots relocalisée à chaque mesure (pas de cache)
+        self.improver._lots_section_cache = None
+        return (self.improver._extract_lot_numero_intelligent(text, {}, {}),
+                self.improver._extract_intitule_lot_intelligent(text, {}, {}))
+
+    def test_long_whitespace_run_is_linear(self):
+        """Test qu'une longue suite d'espaces dans un intitulé ne fait pas exploser le temps"""
+        numero, intitule = self._extract_lot_fields(self._whitespace_run_text(20000))
+        self.assertEqual(numero, 2)
+        self.assertEqual(intitule, "FOURNITURE DE MATERIEL")
+
+        def run(length):
+            self._extract_lot_fields(self._whitespace_run_text(length))
+
+        self.assertLess(growth_ratio(run, 20000), MAX_LINEAR_GROWTH)
+
+    def test_long_uppercase_run_is_linear(self):
+        """Test qu'un très long intitulé en majuscules reste traité en temps linéaire"""
+        def run(length):
+            self._extract_lot_fields("Lot N° Intitulé Montant\n1 " + "A" * length + " 100 €\n")
+
+        self.assertLess(growth_ratio(run, 20000), MAX_LINEAR_GROWTH)
+
+    def test_lots_section_skips_patterns_without_keywords(self):
+        """Test qu'un long texte sur une seule ligne sans mot-clé de lots est écarté rapidement"""
+        sentence = "Objet du marché : fourniture de matériel médical pour les établissements. "
+        self.assertIsNone(self.improver._extract_lots_section(sentence * 600))
+
+        def run(repeat):
+            self.improver._locate_lots_section(sentence * repeat)
+
+        self.assertLess(growth_ratio(run, 600), MAX_LINEAR_GROWTH)
+
+    def test_lots_section_found_with_table(self):
+        """Test de localisation de la section des lots à partir de l'en-tête du tableau"""
+        text = (
+            "Allotissement\n"
+            "Lot N° Intitulé Montant estimatif Montant maximum\n"
+            "1 FOURNITURE DE MATERIEL 100 000 200 000\n"
+            "Article 2 - Durée\n"
+        )
+        section = self.improver._extract_lots_section(text)
+        self.assertIn("1 FOURNITURE DE MATERIEL 100 000 200 000", section)
+
+    def test_montant_maxi_found_in_currency_window(self):
+        """Test que les montants sont trouvés dans les fenêtres ': nombre devise' du texte"""
+        text = (
+            "Prix unitaire : voir annexe. Durée : 4 ans, 2 lots.\n"
+            "Le plafond des commandes est fixé à : 150 000 € HT, soit 50 k€ par an.\n"
+        )
+        montant = self.improver._extract_montant_global_maxi_intelligent(text, {}, {})
+        self.assertEqual(montant, 150000.0)
+        self.assertIsNone(self.improver._extract_montant_global_maxi_intelligent("Plafond : 150 000", {}, {}))
+
+    def test_no_document_retained_after_extraction(self):
+        """Test qu'aucun texte n'est conservé par l'améliorateur une fois l'extraction terminée"""
+        text = (
+            "Allotissement\n"
+            "Lot N° Intitulé Montant estimatif Montant maximum\n"
+            "1 FOURNITURE DE MATERIEL 100 000 200 000\n"
+        )
+        self.improver.extract_improved_data(text)
+
+        self.assertIsNone(self.improver._call_cache)
+        self.assertIsNone(self.improver._lots_section_cache)
+
+    def test_truncation_flagged_in_result(self):
+        """Test qu'un texte tronqué est signalé dans le résultat, et seulement dans ce cas"""
+        text = "Objet : Fourniture de matériel médical\n" + "Clause générale du marché.\n" * 10
+        self.improver.MAX_TEXT_LENGTH = 100
+
+        with self.assertLogs('extraction_improver', level='WARNING'):
+            result = self.improver.extract_improved_data(text)
+        self.assertEqual(result['_texte_tronque'], {'longueur_originale': len(text), 'longueur_analysee': 100})
+
+        self.improver.MAX_TEXT_LENGTH = len(text)
+        self.assertNotIn('_texte_tronque', self.improver.extract_improved_data(text))
+
+
+@unittest.skipUnless(extraction_improver.HYPERSCAN_AVAILABLE, "hyperscan non installé")
+class TestSimplePatternsHyperscan(unittest.TestCase):
+    """Tests du pré-filtre Hyperscan des patterns simples face au module re"""
+
+    TEXT = (
+        "Objet : Fourniture de matériel médical\n"
+        "Montant estimatif : 150 000 €\n"
+        "Date limite de remise des offres : 12/03/2025\n"
+        "Allotissement\n"
+        "Lot N° Intitulé Montant estimatif Montant maximum\n"
+        "1 FOURNITURE DE MATERIEL 100 000 200 000\n"
+    )
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.improver = ExtractionImprover()
+
+    def test_rejected_patterns_have_no_match(self):
+        """Test qu'aucun pattern écarté par le pré-filtre n'a de correspondance avec re"""
+        cleaned_text = self.improver._clean_text(self.TEXT)
+        rejected = self.improver._rejected_simple_patterns(cleaned_text)
+
+        for field, rank in rejected:
+            with self.subTest(field=field, rank=rank):
+                self.assertIsNone(self.improver.simple_patterns[field][rank].search(cleaned_text))
+
+    def test_same_extraction_as_re_fallback(self):
+        """Test que l'extraction est identique avec et sans Hyperscan"""
+        with_hyperscan = self.improver.extract_improved_data(self.TEXT)
+        with patch.object(extraction_improver, 'HYPERSCAN_AVAILABLE', False):
+            without_hyperscan = self.improver.extract_improved_data(self.TEXT)
+
+        self.assertEqual(with_hyperscan, without_hyperscan)
+
+
+if __name__ == '__main__':
+    unittest.main()
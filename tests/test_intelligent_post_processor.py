@@ -24,10 +24,10 @@ class TestIntelligentPostProcessor(unittest.TestCase):
         self.assertFalse(processor.is_available())
         self.assertIsNone(processor.extraction_improver)
     
-    @patch('extractors.intelligent_post_processor.extraction_improver')
+    @patch('extractors.intelligent_post_processor.get_extraction_improver')
     def test_init_with_improver(self, mock_improver):
         """Test initialisation avec ExtractionImprover"""
-        mock_improver.extract_improved_data = MagicMock(return_value={})
+        mock_improver.return_value.extract_improved_data = MagicMock(return_value={})
         processor = IntelligentPostProcessor(enable_improver=True)
         # Si ExtractionImprover est disponible, il devrait être initialisé
         # Sinon, processor.is_available() sera False
@@ -44,7 +44,7 @@ class TestIntelligentPostProcessor(unittest.TestCase):
         # Sans améliorateur, devrait retourner les données brutes
         self.assertEqual(enhanced, raw_data)
     
-    @patch('extractors.intelligent_post_processor.extraction_improver')
+    @patch('extractors.intelligent_post_processor.get_extraction_improver')
     def test_enhance_extraction_with_improver(self, mock_improver_instance):
         """Test enrichissement avec ExtractionImprover"""
         # Créer un mock de l'instance
@@ -56,18 +56,18 @@ class TestIntelligentPostProcessor(unittest.TestCase):
             }
         )
         
-        # Patcher l'import pour retourner notre mock
-        with patch('extractors.intelligent_post_processor.extraction_improver', mock_improver):
-            processor = IntelligentPostProcessor(enable_improver=True)
-            if processor.is_available():
-                raw_data = {'intitule_lot': 'Lot 1'}
-                text = "Contenu du document"
-                
-                enhanced = processor.enhance_extraction(raw_data, text)
-                
-                # Vérifier que les données ont été enrichies
-                self.assertIn('intitule_lot', enhanced)
-                self.assertIn('montant_global_estime', enhanced)
+        # Patcher l'accesseur pour retourner notre mock
+        mock_improver_instance.return_value = mock_improver
+        processor = IntelligentPostProcessor(enable_improver=True)
+        if processor.is_available():
+            raw_data = {'intitule_lot': 'Lot 1'}
+            text = "Contenu du document"
+            
+            enhanced = processor.enhance_extraction(raw_data, text)
+            
+            # Vérifier que les données ont été enrichies
+            self.assertIn('intitule_lot', enhanced)
+            self.assertIn('montant_global_estime', enhanced)
     
     def test_merge_data_basic(self):
         """Test fusion basique de données"""
@@ -0,0 +1,133 @@
+"""
+🧪 Tests Unitaires - LotDetector
+===============================
+
+Tests pour les stratégies de détection de lots.
+"""
+
+import re
+import unittest
+from unittest.mock import patch
+from extractors import lot_detector
+from extractors.lot_detector import ExcelTableStrategy, FlexiblePatternsStrategy, LotDetector
+from tests.timing import run_in_subprocess
+
+
+class TestFlexiblePatternsStrategy(unittest.TestCase):
+    """Tests pour la stratégie des patterns flexibles"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.strategy = FlexiblePatternsStrategy()
+
+    def test_continuation_lines_without_amounts_are_linear(self):
+        """Test qu'un intitulé suivi de nombreuses lignes sans montant ne fait pas exploser le temps"""
+        # Retour arrière exponentiel : interrompu par le délai du sous-processus
+        run_in_subprocess(
+            "from extractors.lot_detector import FlexiblePatternsStrategy\n"
+            "FlexiblePatternsStrategy().detect_lots('1 ABC\\n' + 'defg hij\\n' * 40)\n"
+        )
+
+    def test_multiline_title_with_amounts(self):
+        """Test d'un lot dont l'intitulé continue sur la ligne suivante avant les montants"""
+        pattern = FlexiblePatternsStrategy.FLEXIBLE_REGEXES[1]
+        matches = pattern.findall("1 FOURNITURE DE\nMATERIEL MEDICAL 100 000 € 200 000 €\n")
+        self.assertEqual(matches, [('1', 'FOURNITURE DE', '100 000', '200 000')])
+
+    def test_multiline_table_titles_stop_at_next_lot(self):
+        """Test qu'un lot sans montant n'absorbe pas la ligne numérotée du lot suivant"""
+        pattern = FlexiblePatternsStrategy.FLEXIBLE_REGEXES[1]
+        matches = pattern.findall(
+            "1 FOURNITURE DE MATERIEL\nMEDICAL\n"
+            "2 MAINTENANCE DES\nEQUIPEMENTS 100 000 € 200 000 €\n"
+            "3 LOCATION DE VEHICULES\nUTILITAIRES 50 000 € 80 000 €\n"
+        )
+        self.assertEqual(matches, [
+            ('2', 'MAINTENANCE DES', '100 000', '200 000'),
+            ('3', 'LOCATION DE VEHICULES', '50 000', '80 000'),
+        ])
+
+
+@unittest.skipUnless(lot_detector.HYPERSCAN_AVAILABLE, "hyperscan non installé")
+class TestFlexiblePatternsHyperscan(unittest.TestCase):
+    """Tests du pré-filtre Hyperscan face au repli sur le module re"""
+
+    TEXT = (
+        "Allotissement\n"
+        "1 FOURNITURE DE MATERIEL MEDICAL 100 000 € 200 000 €\n"
+        "2 MAINTENANCE DES EQUIPEMENTS 50 000 € 80 000 €\n"
+        "Lot 3 : Prestations de nettoyage des locaux\n"
+    )
+
+    def test_prefilter_keeps_every_matching_pattern(self):
+        """Test que le pré-filtre retient tous les patterns ayant une correspondance avec re"""
+        strategy = FlexiblePatternsStrategy()
+        candidates = strategy._candidate_pattern_ids(self.TEXT)
+
+        self.assertIsNotNone(candidates)
+        for index, pattern in enumerate(FlexiblePatternsStrategy.FLEXIBLE_REGEXES):
+            if pattern.search(self.TEXT):
+                self.assertIn(index, candidates)
+
+    def test_same_lots_as_re_fallback(self):
+        """Test que les lots détectés sont identiques avec et sans Hyperscan"""
+        with_hyperscan = FlexiblePatternsStrategy().detect_lots(self.TEXT)
+        with patch.object(lot_detector, 'HYPERSCAN_AVAILABLE', False):
+            without_hyperscan = FlexiblePatternsStrategy().detect_lots(self.TEXT)
+
+        self.assertEqual(with_hyperscan, without_hyperscan)
+
+
+class TestExcelTableStrategy(unittest.TestCase):
+    """Tests pour la stratégie des tableaux Excel"""
+
+    def test_unreadable_maximum_falls_back_to_estimate(self):
+        """Test qu'un montant maximum illisible reprend le montant estimé"""
+        strategy = ExcelTableStrategy()
+        strategy.EXCEL_ROW_PATTERNS = (re.compile(r'^(\d+)\s+(.+?)\s+(\d+)\s+(\S+)$', re.MULTILINE),)
+        text = (
+            "1 Fourniture de matériel médical 1000 NC\n"
+            "2 Maintenance des équipements 2000 3000\n"
+            "3 Prestations de nettoyage 500 NC\n"
+        )
+        lots = strategy.detect_lots(text)
+
+        self.assertEqual([(lot.montant_estime, lot.montant_maximum) for lot in lots],
+                         [(1000.0, 1000.0), (2000.0, 3000.0), (500.0, 500.0)])
+
+
+class TestLotDetector(unittest.TestCase):
+    """Tests pour le détecteur principal"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        # Le cache des détections est partagé entre instances : repartir à vide
+        LotDetector.clear_detection_cache()
+
+    def test_repeated_detection_returns_independent_copies(self):
+        """Test qu'une détection relancée sur le même texte renvoie les mêmes lots, modifiables sans effet de bord"""
+        text = (
+            "Lot 1 : Fourniture de matériel médical\n"
+            "Lot 2 : Maintenance des équipements\n"
+        )
+        first = LotDetector().detect_lots(text)
+        first[0].intitule = "MODIFIE"
+
+        detector = LotDetector()
+        second = detector.detect_lots(text)
+
+        self.assertEqual([lot.numero for lot in second], [lot.numero for lot in first])
+        self.assertNotEqual(second[0].intitule, "MODIFIE")
+        self.assertEqual(detector.get_performance_metrics()['successful_detections'], 1)
+
+    def test_clear_detection_cache(self):
+        """Test que le cache partagé est vidé pour toutes les instances"""
+        LotDetector().detect_lots("Lot 1 : Fourniture de matériel médical\n")
+        self.assertEqual(len(LotDetector._DETECTION_CACHE), 1)
+
+        LotDetector.clear_detection_cache()
+        self.assertEqual(LotDetector._DETECTION_CACHE, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
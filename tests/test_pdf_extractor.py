@@ -0,0 +1,215 @@
+"""
+🧪 Tests Unitaires - PDFExtractor
+=================================
+
+Tests pour le traitement par lot de l'extracteur PDF (OCR groupé).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from importlib.util import find_spec
+from unittest.mock import MagicMock, patch
+from extractors.lot_detector import LotInfo
+from extractors.pdf_extractor import PDFExtractor
+
+
+def _ocr_modules(pages_per_pdf, tesseract_output):
+    """Modules pdf2image/pytesseract factices pour l'OCR groupé"""
+    pdf2image = MagicMock()
+    pdf2image.convert_from_bytes.side_effect = [
+        [f"/tmp/pdf{index:04d}_{page}.tif" for page in range(count)]
+        for index, count in enumerate(pages_per_pdf)
+    ]
+    pytesseract = MagicMock()
+    pytesseract.image_to_string.return_value = tesseract_output
+    return {'pdf2image': pdf2image, 'pytesseract': pytesseract}
+
+
+class TestOcrPdfsBatch(unittest.TestCase):
+    """Tests pour l'OCR groupé de plusieurs PDFs scannés"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.extractor = PDFExtractor()
+
+    def test_pages_are_split_back_per_pdf(self):
+        """Test que la sortie de Tesseract est redécoupée selon le nombre de pages de chaque PDF"""
+        modules = _ocr_modules([2, 1], "page A1\fpage A2\fpage B1\f")
+        with patch.dict(sys.modules, modules):
+            texts = self.extractor._ocr_pdfs_batch([b"scan-a", b"scan-b"])
+
+        self.assertEqual(texts, ["page A1\npage A2\n", "page B1\n"])
+        modules['pytesseract'].image_to_string.assert_called_once()
+
+    def test_fallback_when_tesseract_returns_fewer_pages(self):
+        """Test que chaque PDF repasse par l'OCR individuel si des pages manquent"""
+        modules = _ocr_modules([2, 1], "page A1\fpage A2")
+        with patch.dict(sys.modules, modules), \
+                patch.object(self.extractor, '_extract_text_with_ocr',
+                             side_effect=lambda pdf_bytes: f"ocr {pdf_bytes.decode()}") as single_ocr:
+            texts = self.extractor._ocr_pdfs_batch([b"scan-a", b"scan-b"])
+
+        self.assertEqual(texts, ["ocr scan-a", "ocr scan-b"])
+        self.assertEqual(single_ocr.call_count, 2)
+
+
+class TestEasyOcrFallback(unittest.TestCase):
+    """Tests du repli easyocr quand Tesseract est indisponible"""
+
+    def test_pages_rendered_at_ocr_dpi(self):
+        """Test que le repli easyocr rend les pages à la résolution OCR de l'extracteur"""
+        extractor = PDFExtractor()
+        pdf2image = MagicMock()
+        pdf2image.pdfinfo_from_bytes.side_effect = ImportError("poppler absent")
+        pdf2image.convert_from_bytes.return_value = ["page-1"]
+        easyocr = MagicMock()
+        easyocr.Reader.return_value.readtext.return_value = [(None, "LOT 1 FOURNITURE", 0.9)]
+
+        with patch.dict(sys.modules, {'pdf2image': pdf2image, 'easyocr': easyocr}):
+            text = extractor._extract_text_with_ocr(b"scan")
+
+        self.assertEqual(text, "LOT 1 FOURNITURE\n")
+        pdf2image.convert_from_bytes.assert_called_once_with(b"scan", dpi=PDFExtractor.OCR_DPI)
+
+
+@unittest.skipUnless(find_spec('tesserocr') and find_spec('pytesseract') and find_spec('PIL'),
+                     "tesserocr ou pytesseract non installé")
+class TestTesserocrPages(unittest.TestCase):
+    """Tests de l'OCR in-process tesserocr face au repli pytesseract"""
+
+    PAGES = ("LOT 1 FOURNITURE DE MATERIEL", "LOT 2 MAINTENANCE DES EQUIPEMENTS", "ARTICLE 3 DUREE")
+
+    def _page_image(self, text):
+        from PIL import Image, ImageDraw, ImageFont
+        image = Image.new('L', (1400, 120), color=255)
+        ImageDraw.Draw(image).text((20, 30), text, fill=0, font=ImageFont.load_default(size=48))
+        return image
+
+    def test_same_text_as_pytesseract(self):
+        """Test que tesserocr lit les mêmes mots que pytesseract, dans l'ordre des pages"""
+        import pytesseract
+        extractor = PDFExtractor()
+        images = {number: self._page_image(text) for number, text in enumerate(self.PAGES, start=1)}
+
+        with patch.object(extractor, '_render_ocr_page', side_effect=lambda pdf_bytes, number: images[number]):
+            try:
+                tesserocr_texts = extractor._ocr_pages_with_tesserocr(b"", list(images), max_workers=2)
+            except RuntimeError as e:
+                self.skipTest(f"données Tesseract 'fra' indisponibles: {e}")
+        pytesseract_texts = [pytesseract.image_to_string(images[number], lang='fra') for number in images]
+
+        self.assertEqual([text.split() for text in tesserocr_texts],
+                         [text.split() for text in pytesseract_texts])
+
+
+class TestExtractCriteresByLot(unittest.TestCase):
+    """Tests pour l'extraction des critères lot par lot"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.extractor = PDFExtractor()
+
+    def test_failing_lot_keeps_other_lots(self):
+        """Test qu'une erreur sur un lot laisse des critères vides pour ce lot seulement"""
+        lots = [LotInfo(numero=1, intitule="Fourniture"), LotInfo(numero=2, intitule="Maintenance")]
+        criteres = {'criteres_economique': 'Prix 60%', 'criteres_techniques': 'Valeur technique 40%'}
+
+        def extract_for_lot(text_content, lot_numero, patterns_par_type, lot_headers):
+            if lot_numero == 1:
+                raise ValueError("contexte illisible")
+            return dict(criteres)
+
+        with patch.object(self.extractor, '_extract_criteres_for_lot', side_effect=extract_for_lot), \
+                self.assertLogs('extractors.pdf_extractor', level='ERROR'):
+            result = self.extractor._extract_criteres_by_lot("Lot 1 ...\nLot 2 ...", lots)
+
+        self.assertEqual(result, {1: {}, 2: criteres})
+
+
+class TestBatchExtractFromPdfs(unittest.TestCase):
+    """Tests pour l'extraction de plusieurs PDFs"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.extractor = PDFExtractor()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.tmpdir)
+
+    def _write_pdf(self, name, content):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_scanned_and_text_pdfs_keep_input_order(self):
+        """Test qu'un PDF texte intercalé entre deux PDFs scannés garde sa place"""
+        paths = [
+            self._write_pdf('scan_a.pdf', b"scan-a"),
+            self._write_pdf('texte.pdf', b"texte"),
+            self._write_pdf('scan_b.pdf', b"scan-b"),
+        ]
+        page_a1, page_a2, page_b1 = ("A1 " * 40, "A2 " * 40, "B1 " * 40)
+        modules = _ocr_modules([2, 1], f"{page_a1}\f{page_a2}\f{page_b1}\f")
+        text_layers = {b"scan-a": "", b"texte": "couche texte", b"scan-b": ""}
+
+        with patch.dict(sys.modules, modules), \
+                patch.object(self.extractor, '_extract_text_from_bytes',
+                             side_effect=lambda pdf_bytes, allow_ocr=True: text_layers[pdf_bytes]), \
+                patch.object(self.extractor, '_extract_texts_in_processes', return_value=None), \
+                patch.object(self.extractor, 'extract', side_effect=lambda text: [{'texte': text}]):
+            results = self.extractor.batch_extract_from_pdfs(paths)
+
+        self.assertEqual(results, [
+            [{'texte': f"{page_a1}\n{page_a2}\n"}],
+            [{'texte': "couche texte"}],
+            [{'texte': f"{page_b1}\n"}],
+        ])
+        # Un seul appel à Tesseract pour les deux PDFs scannés
+        modules['pytesseract'].image_to_string.assert_called_once()
+
+    def test_pdf_without_text_maps_to_empty_list(self):
+        """Test qu'un PDF dont l'OCR ne donne rien produit une liste vide à sa place"""
+        paths = [
+            self._write_pdf('texte.pdf', b"texte"),
+            self._write_pdf('vide.pdf', b"vide"),
+        ]
+        modules = _ocr_modules([1], "\f")
+        text_layers = {b"texte": "couche texte", b"vide": ""}
+
+        with patch.dict(sys.modules, modules), \
+                patch.object(self.extractor, '_extract_text_from_bytes',
+                             side_effect=lambda pdf_bytes, allow_ocr=True: text_layers[pdf_bytes]), \
+                patch.object(self.extractor, '_extract_texts_in_processes', return_value=None), \
+                patch.object(self.extractor, 'extract', side_effect=lambda text: [{'texte': text}]):
+            results = self.extractor.batch_extract_from_pdfs(paths)
+
+        self.assertEqual(results, [[{'texte': "couche texte"}], []])
+
+    def test_process_pool_keeps_input_order(self):
+        """Test que l'analyse dans deux processus renvoie les résultats dans l'ordre des fichiers"""
+        paths = [
+            self._write_pdf('lots.pdf', b"lots"),
+            self._write_pdf('vide.pdf', b""),
+            self._write_pdf('simple.pdf', b"simple"),
+        ]
+        text_layers = {
+            b"lots": "Lot 1 : Fourniture de matériel médical\nLot 2 : Maintenance des équipements\n",
+            b"simple": "Objet : Maintenance des ascenseurs du CHU",
+        }
+
+        with patch.object(self.extractor, '_extract_text_from_bytes',
+                          side_effect=lambda pdf_bytes, allow_ocr=True: text_layers[pdf_bytes]):
+            results = self.extractor.batch_extract_from_pdfs(paths, max_workers=2)
+
+        self.assertEqual([[entry.get('lot_id') for entry in result] for result in results],
+                         [['LOT_1', 'LOT_2'], [], [None]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+⏱️ Mesures de complexité pour les tests
+=======================================
+
+Plutôt qu'un seuil absolu en secondes, sensible à la charge de la machine,
+les tests de retour arrière comparent la croissance du temps d'exécution
+entre deux tailles d'entrée, ou bornent l'exécution dans un sous-processus.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Une croissance linéaire donne un rapport proche du facteur de taille (4),
+# une croissance quadratique un rapport proche de son carré (16)
+GROWTH_FACTOR = 4
+MAX_LINEAR_GROWTH = 8
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def best_time(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Meilleur temps d'exécution de func sur plusieurs essais"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def growth_ratio(run: Callable[[int], Any], size: int, factor: int = GROWTH_FACTOR) -> float:
+    """Rapport des temps de run(size * factor) et run(size)"""
+    return best_time(lambda: run(size * factor)) / best_time(lambda: run(size))
+
+
+def run_in_subprocess(code: str, timeout: float = 60) -> subprocess.CompletedProcess:
+    """
+    Exécute du code Python dans un sous-processus depuis la racine du dépôt
+
+    Lève subprocess.TimeoutExpired si le code dépasse le délai : un retour
+    arrière exponentiel est interrompu au lieu de bloquer la suite de tests.
+    """
+    return subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT,
+                          capture_output=True, text=True, timeout=timeout, check=True)
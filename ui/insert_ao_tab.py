@@ -164,6 +164,9 @@ def render_insert_ao_tab(
                     else:
                         st.info("✅ Extraction effectuée avec **TextExtractor**")
                     
+                    if any(entry.get('statistiques', {}).get('texte_tronque') for entry in extracted_entries):
+                        st.warning("⚠️ Document très long : seul le début du texte a été analysé par l'extraction intelligente")
+                    
                     # Métriques
                     col1, col2, col3 = st.columns(3)
                     
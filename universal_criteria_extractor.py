@@ -8,10 +8,16 @@ import re
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-from criteria_extractor import CriteriaExtractor, TableauCriteres, CritereAttribution
+from criteria_extractor import CriteriaExtractor, TableauCriteres, CritereAttribution, _compile_linear
 
 logger = logging.getLogger(__name__)
 
+# Patterns compilés une seule fois au chargement du module
+_PERCENTAGE_RE = re.compile(r'(\d+(?:[.,]\d+)?)\s*%')
+_SPACES_TABS_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_UNWANTED_CHARS_RE = re.compile(r'[^\w\s%.,()°éèêëàâäôöùûüçÉÈÊËÀÂÄÔÖÙÛÜÇ\n-]')
+
 @dataclass
 class UniversalCriteriaResult:
     """Résultat de l'extraction universelle des critères"""
@@ -25,8 +31,17 @@ class UniversalCriteriaResult:
 class UniversalCriteriaExtractor:
     """Extracteur de critères universel pour tous les types de documents"""
     
+    # Plafond du score de confiance renvoyé par chaque méthode de repli
+    FALLBACK_MAX_CONFIDENCE = {
+        '_extract_text_patterns': 0.7,
+        '_extract_percentage_patterns': 0.5,
+        '_extract_keyword_patterns': 0.4,
+    }
+    
     def __init__(self):
         self.criteria_extractor = CriteriaExtractor()
+        self.text_patterns = self._init_text_patterns()
+        self.keyword_patterns = self._init_keyword_patterns()
         self.extraction_methods = [
             self._extract_structured_table,
             self._extract_text_patterns,
@@ -34,6 +49,56 @@ class UniversalCriteriaExtractor:
             self._extract_keyword_patterns
         ]
     
+    def _init_text_patterns(self) -> Dict[str, List[re.Pattern]]:
+        """
+        Patterns de critères par type (compilés une fois à la construction)
+        
+        Les `[^:]*` / `[^%]*?` non bornés peuvent coûter un temps quadratique en
+        retour arrière sur un long texte sans ':' ni '%' ; ils sont compilés avec
+        RE2 quand il est disponible. Écrits en minuscules, ils sont compilés
+        sensibles à la casse et appliqués au texte mis en minuscules.
+        """
+        raw_patterns = {
+            'economique': [
+                r'critère\s+(?:économique|prix|coût|cout|financier)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
+                r'prix[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
+                r'coût[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%'
+            ],
+            'technique': [
+                r'critère\s+(?:technique|qualité|qualite|performance)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
+                r'valeur\s+technique[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
+                r'qualité[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%'
+            ],
+            'autre': [
+                r'critère\s+(?:autre|autres|général|general)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
+                r'qualité\s+des\s+services[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%'
+            ],
+            'rse': [
+                r'critère\s+(?:rse|développement\s+durable|durable|environnemental)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
+                r'développement\s+durable[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%'
+            ]
+        }
+        return {
+            type_critere: [_compile_linear(pattern, ignore_case=False) for pattern in pattern_list]
+            for type_critere, pattern_list in raw_patterns.items()
+        }
+    
+    def _init_keyword_patterns(self) -> Dict[str, List[Tuple[str, re.Pattern]]]:
+        """Mots-clés par type de critère, avec le pattern 'mot-clé ... N %' compilé"""
+        keywords = {
+            'economique': ['prix', 'coût', 'cout', 'financier', 'économique', 'budget'],
+            'technique': ['technique', 'qualité', 'qualite', 'performance', 'valeur technique'],
+            'autre': ['autre', 'général', 'general', 'services', 'qualité des services'],
+            'rse': ['rse', 'développement durable', 'durable', 'environnemental', 'social']
+        }
+        return {
+            type_critere: [
+                (keyword, _compile_linear(rf'{re.escape(keyword)}[^%]*?(\d+(?:[.,]\d+)?)\s*%', ignore_case=False))
+                for keyword in kw_list
+            ]
+            for type_critere, kw_list in keywords.items()
+        }
+    
     def extract_criteria(self, text: str, document_type: str = "unknown") -> UniversalCriteriaResult:
         """
         Extrait les critères d'un texte avec toutes les méthodes disponibles
@@ -64,10 +129,18 @@ class UniversalCriteriaExtractor:
             # Si pas de résultat, nettoyer le texte et essayer les autres méthodes
             if not best_result:
                 cleaned_text = self._clean_text(text)
+                # Minuscules calculées une fois pour toutes les méthodes de repli
+                cleaned_lower = cleaned_text.lower()
                 
-                for method in self.extraction_methods[1:]:  # Skip _extract_structured_table
+                fallback_methods = self.extraction_methods[1:]  # Skip _extract_structured_table
+                for index, method in enumerate(fallback_methods):
+                    # Une méthode ne remplace le résultat que si elle fait strictement mieux :
+                    # arrêter dès qu'aucune méthode restante ne peut dépasser la confiance obtenue
+                    if best_confidence >= max(self.FALLBACK_MAX_CONFIDENCE.get(remaining.__name__, 1.0)
+                                              for remaining in fallback_methods[index:]):
+                        break
                     try:
-                        result = method(cleaned_text, document_type)
+                        result = method(cleaned_text, document_type, cleaned_lower)
                         if result and result.confidence_score > best_confidence:
                             best_result = result
                             best_confidence = result.confidence_score
@@ -125,36 +198,19 @@ class UniversalCriteriaExtractor:
             logger.error(f"Erreur extraction tableaux structurés: {e}")
             return None
     
-    def _extract_text_patterns(self, text: str, document_type: str) -> Optional[UniversalCriteriaResult]:
+    def _extract_text_patterns(self, text: str, document_type: str,
+                               text_lower: Optional[str] = None) -> Optional[UniversalCriteriaResult]:
         """Extraction des critères depuis des patterns de texte"""
         try:
             criteres = []
             
-            # Patterns pour différents types de critères
-            patterns = {
-                'economique': [
-                    r'critère\s+(?:économique|prix|coût|cout|financier)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
-                    r'prix[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
-                    r'coût[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%'
-                ],
-                'technique': [
-                    r'critère\s+(?:technique|qualité|qualite|performance)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
-                    r'valeur\s+technique[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
-                    r'qualité[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%'
-                ],
-                'autre': [
-                    r'critère\s+(?:autre|autres|général|general)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
-                    r'qualité\s+des\s+services[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%'
-                ],
-                'rse': [
-                    r'critère\s+(?:rse|développement\s+durable|durable|environnemental)[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%',
-                    r'développement\s+durable[^:]*:?\s*(\d+(?:[.,]\d+)?)\s*%'
-                ]
-            }
+            # Patterns en minuscules : pas de repli de casse caractère par caractère
+            if text_lower is None:
+                text_lower = text.lower()
             
-            for type_critere, pattern_list in patterns.items():
+            for type_critere, pattern_list in self.text_patterns.items():
                 for pattern in pattern_list:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
+                    matches = pattern.finditer(text_lower)
                     for match in matches:
                         try:
                             pourcentage = float(match.group(1).replace(',', '.'))
@@ -170,7 +226,7 @@ class UniversalCriteriaExtractor:
                             continue
             
             if criteres:
-                confidence = min(0.7, len(criteres) * 0.2)  # Confiance basée sur le nombre de critères
+                confidence = min(self.FALLBACK_MAX_CONFIDENCE['_extract_text_patterns'], len(criteres) * 0.2)  # Confiance basée sur le nombre de critères
                 return UniversalCriteriaResult(
                     has_criteria=True,
                     criteria_type='text_patterns',
@@ -186,14 +242,14 @@ class UniversalCriteriaExtractor:
             logger.error(f"Erreur extraction patterns texte: {e}")
             return None
     
-    def _extract_percentage_patterns(self, text: str, document_type: str) -> Optional[UniversalCriteriaResult]:
+    def _extract_percentage_patterns(self, text: str, document_type: str,
+                                     text_lower: Optional[str] = None) -> Optional[UniversalCriteriaResult]:
         """Extraction des critères depuis des patterns de pourcentages"""
         try:
             criteres = []
             
             # Chercher tous les pourcentages dans le texte
-            percentage_pattern = r'(\d+(?:[.,]\d+)?)\s*%'
-            matches = re.finditer(percentage_pattern, text, re.IGNORECASE)
+            matches = _PERCENTAGE_RE.finditer(text)
             
             for i, match in enumerate(matches):
                 try:
@@ -222,7 +278,7 @@ class UniversalCriteriaExtractor:
                     continue
             
             if criteres:
-                confidence = min(0.5, len(criteres) * 0.1)  # Confiance plus faible
+                confidence = min(self.FALLBACK_MAX_CONFIDENCE['_extract_percentage_patterns'], len(criteres) * 0.1)  # Confiance plus faible
                 return UniversalCriteriaResult(
                     has_criteria=True,
                     criteria_type='percentage_patterns',
@@ -238,26 +294,22 @@ class UniversalCriteriaExtractor:
             logger.error(f"Erreur extraction patterns pourcentages: {e}")
             return None
     
-    def _extract_keyword_patterns(self, text: str, document_type: str) -> Optional[UniversalCriteriaResult]:
+    def _extract_keyword_patterns(self, text: str, document_type: str,
+                                  text_lower: Optional[str] = None) -> Optional[UniversalCriteriaResult]:
         """Extraction des critères depuis des mots-clés"""
         try:
             criteres = []
             
-            # Mots-clés pour différents types de critères
-            keywords = {
-                'economique': ['prix', 'coût', 'cout', 'financier', 'économique', 'budget'],
-                'technique': ['technique', 'qualité', 'qualite', 'performance', 'valeur technique'],
-                'autre': ['autre', 'général', 'general', 'services', 'qualité des services'],
-                'rse': ['rse', 'développement durable', 'durable', 'environnemental', 'social']
-            }
+            # Texte en minuscules (les mots-clés le sont déjà)
+            if text_lower is None:
+                text_lower = text.lower()
             
             # Chercher les mots-clés dans le texte
-            for type_critere, kw_list in keywords.items():
-                for keyword in kw_list:
-                    if keyword.lower() in text.lower():
+            for type_critere, kw_list in self.keyword_patterns.items():
+                for keyword, pattern in kw_list:
+                    if keyword in text_lower:
                         # Chercher un pourcentage près du mot-clé
-                        pattern = rf'{re.escape(keyword)}[^%]*?(\d+(?:[.,]\d+)?)\s*%'
-                        match = re.search(pattern, text, re.IGNORECASE)
+                        match = pattern.search(text_lower)
                         
                         if match:
                             try:
@@ -274,7 +326,7 @@ class UniversalCriteriaExtractor:
                                 continue
             
             if criteres:
-                confidence = min(0.4, len(criteres) * 0.15)  # Confiance faible
+                confidence = min(self.FALLBACK_MAX_CONFIDENCE['_extract_keyword_patterns'], len(criteres) * 0.15)  # Confiance faible
                 return UniversalCriteriaResult(
                     has_criteria=True,
                     criteria_type='keyword_patterns',
@@ -322,10 +374,10 @@ class UniversalCriteriaExtractor:
         # Remplacer les caractères problématiques
         text = text.replace('\x00', ' ')
         # Normaliser les espaces multiples mais préserver les sauts de ligne
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = _SPACES_TABS_RE.sub(' ', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
         # Garder les caractères utiles incluant les accents et symboles spéciaux
-        text = re.sub(r'[^\w\s%.,()°éèêëàâäôöùûüçÉÈÊËÀÂÄÔÖÙÛÜÇ\n-]', ' ', text)
+        text = _UNWANTED_CHARS_RE.sub(' ', text)
         return text
     
     def format_criteria_summary(self, result: UniversalCriteriaResult) -> str: